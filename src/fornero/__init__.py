@@ -21,7 +21,7 @@ Key components:
 import pandas as _pd
 
 # Import core components
-from .core import DataFrame
+from .core import DataFrame, LAZY_MODE
 from .algebra import LogicalPlan
 from .compiler import compile, compile_to_sheets, compile_locally
 from .exceptions import *
@@ -32,6 +32,7 @@ __version__ = "0.1.0"
 # Re-export DataFrame as the primary interface
 __all__ = [
     'DataFrame',
+    'LAZY_MODE',
     'LogicalPlan',
     'compile',
     'compile_to_sheets',
@@ -45,7 +46,7 @@ __all__ = [
 
 # Tracked variants of pandas functions
 
-def read_csv(filepath_or_buffer, **kwargs):
+def read_csv(filepath_or_buffer, lazy=False, **kwargs):
     """Read a CSV file into a fornero DataFrame.
 
     This is a wrapper around pandas.read_csv that returns a fornero DataFrame
@@ -53,6 +54,9 @@ def read_csv(filepath_or_buffer, **kwargs):
 
     Args:
         filepath_or_buffer: File path or file-like object
+        lazy: If True (or when ``LAZY_MODE`` is set), parse only the header row and
+            return an empty frame whose Source carries the schema. Use this when only
+            the plan is needed; the rows are never read.
         **kwargs: Additional arguments passed to pandas.read_csv
 
     Returns:
@@ -62,6 +66,9 @@ def read_csv(filepath_or_buffer, **kwargs):
         This function reads the CSV using pandas and wraps the result in a
         fornero DataFrame, which creates a Source node tracking the file path.
     """
+    if lazy or LAZY_MODE.get():
+        kwargs['nrows'] = 0
+
     # Read using pandas
     df = _pd.read_csv(filepath_or_buffer, **kwargs)
 
@@ -124,7 +131,7 @@ def concat(objs, axis=0, **kwargs):
 
     # If we have exactly two DataFrames and axis=0, create a Union node
     if axis == 0 and len(objs) == 2:
-        from .algebra import Union, Source
+        from .core.tracer import source_for, union_node
 
         # Get plan roots from input DataFrames
         roots = []
@@ -134,9 +141,9 @@ def concat(objs, axis=0, **kwargs):
             else:
                 # Create Source node for regular pandas DataFrame
                 schema = list(obj.columns) if hasattr(obj, 'columns') else None
-                roots.append(Source(source_id="<dataframe>", schema=schema))
+                roots.append(source_for("<dataframe>", schema))
 
-        union_op = Union(inputs=roots)
+        union_op = union_node(*roots)
         result._plan = LogicalPlan(union_op)
 
     return result
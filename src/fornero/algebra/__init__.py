@@ -31,6 +31,7 @@ from .operations import (
     JoinType,
     SortDirection,
     LimitEnd,
+    NodeKind,
     SchemaValidationError,
 )
 from .expressions import (
@@ -64,6 +65,7 @@ __all__ = [
     "JoinType",
     "SortDirection",
     "LimitEnd",
+    "NodeKind",
     "SchemaValidationError",
     "Expression",
     "Column",
@@ -0,0 +1,37 @@
+"""LSD radix argsort for integer sort keys.
+
+NumPy's stable argsort is a radix sort for types of 16 bits or fewer and a
+timsort for anything wider. Wider integer keys are sorted here as a series of
+stable argsorts over 16-bit digits, least significant first, so every pass
+runs NumPy's radix sort and the whole sort stays linear in the row count.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+RADIX_MIN_ROWS = 4096
+"""Below this many rows a single comparison sort is faster than several passes."""
+
+_DIGIT_BITS = 16
+_DIGIT_MASK = (1 << _DIGIT_BITS) - 1
+
+
+def radix_argsort(keys: np.ndarray) -> np.ndarray:
+    """Return the stable ascending argsort of the integer array *keys*."""
+    if keys.dtype.kind == "i":
+        unsigned_dtype = np.dtype(f"u{keys.dtype.itemsize}")
+        sign_bit = unsigned_dtype.type(1 << (keys.dtype.itemsize * 8 - 1))
+        unsigned = keys.view(unsigned_dtype) ^ sign_bit
+    else:
+        unsigned = keys
+    unsigned = unsigned.astype(np.uint64)
+    if len(unsigned):
+        unsigned -= unsigned.min()
+    width = int(unsigned.max()).bit_length() if len(unsigned) else 0
+
+    order = np.argsort((unsigned & _DIGIT_MASK).astype(np.uint16), kind="stable")
+    for shift in range(_DIGIT_BITS, width, _DIGIT_BITS):
+        digits = ((unsigned[order] >> np.uint64(shift)) & _DIGIT_MASK).astype(np.uint16)
+        order = order[np.argsort(digits, kind="stable")]
+    return order
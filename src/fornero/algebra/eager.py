@@ -8,11 +8,14 @@ operation tree is simultaneously available for later translation.
 from __future__ import annotations
 
 import operator
-from typing import Any
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable
 
 import numpy as np
 import pandas as pd
+from pandas.api.extensions import take
 
+from fornero.algebra._radix import RADIX_MIN_ROWS, radix_argsort
 from fornero.algebra.expressions import (
     BinaryOp,
     Column,
@@ -37,6 +40,7 @@ from fornero.algebra.operations import (
     Window,
     WithColumn,
 )
+from fornero.algebra.fusion import FusedProject, evaluate_numexpr, fuse_projections
 
 _COMPARE_OPS: dict[str, Any] = {
     ">": operator.gt,
@@ -68,6 +72,19 @@ _AGG_FUNCS: dict[str, str] = {
     "median": "median",
 }
 
+_PIVOT_UFUNCS: dict[str, Any] = {
+    "sum": np.add,
+    "min": np.minimum,
+    "max": np.maximum,
+}
+
+# Accumulator dtype for scatter-pivot sums, by input dtype kind.
+_PIVOT_SUM_DTYPES: dict[str, Any] = {
+    "i": np.int64,
+    "u": np.uint64,
+    "f": np.float64,
+}
+
 _BUILTIN_FUNCS: dict[str, Any] = {
     "abs": np.abs,
     "round": np.round,
@@ -79,47 +96,164 @@ _BUILTIN_FUNCS: dict[str, Any] = {
 }
 
 
+_LOGICAL_OPS: dict[str, Any] = {
+    "and": operator.and_,
+    "or": operator.or_,
+}
+
+_BINARY_OPS: dict[str, Any] = {**_COMPARE_OPS, **_ARITH_OPS, **_LOGICAL_OPS}
+
+_LOGICAL_UFUNCS: dict[str, np.ufunc] = {
+    "and": np.logical_and,
+    "or": np.logical_or,
+}
+
+_UNARY_OPS: dict[str, Any] = {
+    "neg": operator.neg,
+    "not": operator.invert,
+}
+
+
 def evaluate_expression(expr: Expression, df: pd.DataFrame) -> pd.Series | Any:
-    """Evaluate an Expression AST against a DataFrame, producing a Series."""
-    match expr:
-        case Column(name=name):
-            return df[name]
-
-        case Literal(value=value):
-            return value
-
-        case BinaryOp(op=op, left=left, right=right):
-            lval = evaluate_expression(left, df)
-            rval = evaluate_expression(right, df)
-
-            if op in _COMPARE_OPS:
-                return _COMPARE_OPS[op](lval, rval)
-            if op in _ARITH_OPS:
-                return _ARITH_OPS[op](lval, rval)
-            if op == "and":
-                return lval & rval
-            if op == "or":
-                return lval | rval
-            raise ValueError(f"Unknown binary operator: {op!r}")
-
-        case UnaryOp(op="neg", operand=operand):
-            return -evaluate_expression(operand, df)
-
-        case UnaryOp(op="not", operand=operand):
-            return ~evaluate_expression(operand, df)
-
-        case FunctionCall(func=func, args=args):
-            evaluated_args = [evaluate_expression(a, df) for a in args]
-            if func not in _BUILTIN_FUNCS:
-                raise ValueError(f"Unknown function: {func!r}")
-            return _BUILTIN_FUNCS[func](*evaluated_args)
+    """Evaluate an Expression AST against a DataFrame, producing a Series.
+
+    The tree is compiled into a closure on first use and cached on the node,
+    so repeated evaluations skip the per-node dispatch.
+    """
+    compiled = getattr(expr, "_compiled", None)
+    if compiled is None:
+        compiled = _compile_expression(expr)
+        expr._compiled = compiled
+    return compiled(df)
+
+
+def _compile_expression(expr: Expression) -> Callable[[pd.DataFrame], Any]:
+    """Build a closure ``df -> value`` equivalent to evaluating *expr*.
+
+    The node's compiler is looked up by exact type in ``_COMPILERS``.
+    """
+    compiler = _COMPILERS.get(type(expr))
+    if compiler is None:
+        raise TypeError(f"Unknown expression type: {type(expr).__name__}")
+    return compiler(expr)
+
+
+def _compile_column(expr: Column) -> Callable[[pd.DataFrame], Any]:
+    name = expr.name
+    return lambda df: df[name]
+
+
+def _compile_literal(expr: Literal) -> Callable[[pd.DataFrame], Any]:
+    value = expr.value
+    return lambda df: value
+
+
+def _compile_binary(expr: BinaryOp) -> Callable[[pd.DataFrame], Any]:
+    op = expr.op
+    if op in _LOGICAL_OPS:
+        operand_fns = [_compiled_child(e) for e in _flatten_logical(expr, op)]
+        return lambda df: _combine_logical(op, [fn(df) for fn in operand_fns])
+    if op not in _BINARY_OPS:
+        raise ValueError(f"Unknown binary operator: {op!r}")
+    fn = _BINARY_OPS[op]
+    left_fn = _compiled_child(expr.left)
+    right_fn = _compiled_child(expr.right)
+    return lambda df: fn(left_fn(df), right_fn(df))
+
+
+def _compile_unary(expr: UnaryOp) -> Callable[[pd.DataFrame], Any]:
+    if expr.op not in _UNARY_OPS:
+        raise ValueError(f"Unknown unary operator: {expr.op!r}")
+    fn = _UNARY_OPS[expr.op]
+    operand_fn = _compiled_child(expr.operand)
+    return lambda df: fn(operand_fn(df))
+
+
+def _compile_function(expr: FunctionCall) -> Callable[[pd.DataFrame], Any]:
+    if expr.func not in _BUILTIN_FUNCS:
+        raise ValueError(f"Unknown function: {expr.func!r}")
+    fn = _BUILTIN_FUNCS[expr.func]
+    arg_fns = [_compiled_child(a) for a in expr.args]
+    return lambda df: fn(*(arg_fn(df) for arg_fn in arg_fns))
+
+
+_COMPILERS: dict[type, Callable[[Any], Callable[[pd.DataFrame], Any]]] = {
+    Column: _compile_column,
+    Literal: _compile_literal,
+    BinaryOp: _compile_binary,
+    UnaryOp: _compile_unary,
+    FunctionCall: _compile_function,
+}
 
-        case _:
-            raise TypeError(f"Unknown expression type: {type(expr).__name__}")
+
+def _compiled_child(expr: Expression) -> Callable[[pd.DataFrame], Any]:
+    """Return the cached closure for a child node, compiling it if needed."""
+    if expr._compiled is None:
+        expr._compiled = _compile_expression(expr)
+    return expr._compiled
+
+
+def _flatten_logical(expr: Expression, op: str) -> list[Expression]:
+    """Collect the operands of a chain of ``and``/``or`` nodes, left to right."""
+    if isinstance(expr, BinaryOp) and expr.op == op:
+        return _flatten_logical(expr.left, op) + _flatten_logical(expr.right, op)
+    return [expr]
+
+
+def _combine_logical(op: str, values: list[Any]) -> Any:
+    """Fold *values* with ``and``/``or``, reusing one buffer for boolean Series.
+
+    The first operand is copied into a fresh mask and every other operand is
+    combined into it in place, so an n-way chain allocates one array instead
+    of n - 1. Non-boolean operands keep pandas' bitwise semantics.
+    """
+    if all(isinstance(v, pd.Series) and v.dtype == np.bool_ for v in values):
+        ufunc = _LOGICAL_UFUNCS[op]
+        mask = values[0].to_numpy(dtype=bool, copy=True)
+        for value in values[1:]:
+            ufunc(mask, value.to_numpy(), out=mask)
+        return pd.Series(mask, index=values[0].index)
+    fn = _LOGICAL_OPS[op]
+    result = values[0]
+    for value in values[1:]:
+        result = fn(result, value)
+    return result
 
 
 def execute(op: Operation) -> pd.DataFrame:
-    """Recursively execute an operation tree, returning a pandas DataFrame."""
+    """Recursively execute an operation tree, returning a pandas DataFrame.
+
+    Source data is shared rather than copied while the tree is evaluated.
+    Limit slices its input without copying and every other node builds a new
+    frame, so only a Source result, possibly under Limits, needs a copy to
+    keep callers from mutating the original data.
+    """
+    result = _execute(op, _SubplanCache(_shared_subplans(op)))
+    while isinstance(op, Limit):
+        op = op.inputs[0]
+    if isinstance(op, Source):
+        return result.copy()
+    return result
+
+
+def _execute(op: Operation, cache: _SubplanCache) -> pd.DataFrame:
+    """Evaluate *op* bottom-up without copying Source data.
+
+    Subplans that occur more than once in the tree are evaluated once and
+    their result is reused; no node mutates its input frames, so sharing the
+    result between consumers is safe.
+    """
+    key = cache.keys.get(id(op))
+    if key is None:
+        return _evaluate(op, cache)
+    result = cache.results.get(key)
+    if result is None:
+        result = cache.results[key] = _evaluate(op, cache)
+    return result
+
+
+def _evaluate(op: Operation, cache: _SubplanCache) -> pd.DataFrame:
+    """Evaluate a single node, recursing into its inputs through ``_execute``."""
     match op:
         case Source(data=data):
             if data is None:
@@ -127,33 +261,42 @@ def execute(op: Operation) -> pd.DataFrame:
                     "Source operation has no data for eager execution. "
                     "Set Source.data to a DataFrame before calling execute()."
                 )
-            return data.copy()
+            return data
+
+        case WithColumn() | Filter() if (fused := fuse_projections(op)) is not op:
+            return _execute(fused, cache)
+
+        case FusedProject(steps=steps, inputs=[child]):
+            return _execute_fused(_execute(child, cache), steps)
 
         case Select(columns=columns, inputs=[child]):
-            df = execute(child)
-            return df[columns].reset_index(drop=True)
+            df = _execute(child, cache)
+            return _ensure_range_index(df[columns])
 
         case Filter(predicate=predicate, inputs=[child]):
-            df = execute(child)
-            mask = evaluate_expression(predicate, df)
-            return df.loc[mask].reset_index(drop=True)
+            df = _execute(child, cache)
+            if isinstance(predicate, Expression):
+                mask = _evaluate_with_numexpr(predicate, df)
+            else:
+                mask = evaluate_expression(predicate, df)
+            return _take_rows(df, np.flatnonzero(np.asarray(mask, dtype=bool)))
 
         case Sort(keys=keys, inputs=[child]):
-            df = execute(child)
+            df = _execute(child, cache)
+            indexer = _sort_indexer(df, keys)
+            if indexer is not None:
+                return _take_rows(df, indexer)
             cols = [k[0] for k in keys]
             ascending = [k[1] == "asc" for k in keys]
             return df.sort_values(
-                cols, ascending=ascending, kind="mergesort"
-            ).reset_index(drop=True)
+                cols, ascending=ascending, kind="mergesort", ignore_index=True
+            )
 
         case Limit(count=n, end=end, inputs=[child]):
-            df = execute(child)
-            if end == "head":
-                return df.head(n).reset_index(drop=True)
-            return df.tail(n).reset_index(drop=True)
+            return _slice_rows(_execute(child, cache), n, end)
 
         case WithColumn(column=col_name, expression=expr, inputs=[child]):
-            df = execute(child)
+            df = _execute(child, cache)
             if isinstance(expr, Expression) and not isinstance(expr, str):
                 df = df.copy()
                 df[col_name] = evaluate_expression(expr, df)
@@ -164,8 +307,8 @@ def execute(op: Operation) -> pd.DataFrame:
             )
 
         case GroupBy(keys=keys, aggregations=aggs, inputs=[child]):
-            df = execute(child)
-            grouped = df.groupby(keys, sort=False)
+            df = _execute(child, cache)
+            grouped = df.groupby(keys, sort=False, observed=True)
             named_aggs = {
                 out_name: pd.NamedAgg(
                     column=in_col, aggfunc=_AGG_FUNCS.get(func, func)
@@ -175,7 +318,7 @@ def execute(op: Operation) -> pd.DataFrame:
             return grouped.agg(**named_aggs).reset_index()
 
         case Aggregate(aggregations=aggs, inputs=[child]):
-            df = execute(child)
+            df = _execute(child, cache)
             row: dict[str, Any] = {}
             for out_name, func, in_col in aggs:
                 pandas_func = _AGG_FUNCS.get(func, func)
@@ -186,26 +329,37 @@ def execute(op: Operation) -> pd.DataFrame:
             left_on=lk, right_on=rk, join_type=how, suffixes=suffixes,
             inputs=[left, right],
         ):
-            ldf = execute(left)
-            rdf = execute(right)
+            ldf = _execute(left, cache)
+            rdf = _execute(right, cache)
+            if how in ("inner", "left") and len(lk) == 1 and lk == rk:
+                joined = _hash_join(ldf, rdf, lk[0], how, suffixes)
+                if joined is not None:
+                    return joined
+            # pandas reads a tuple as a single label, so pass the keys as lists
             return ldf.merge(
-                rdf, left_on=lk, right_on=rk, how=how, suffixes=suffixes
-            ).reset_index(drop=True)
+                rdf, left_on=list(lk), right_on=list(rk), how=how, suffixes=suffixes
+            )
 
         case Union(inputs=[left, right]):
-            ldf = execute(left)
-            rdf = execute(right)
+            ldf = _execute(left, cache)
+            rdf = _execute(right, cache)
             if list(ldf.columns) != list(rdf.columns):
                 raise ValueError(
                     f"Union requires identical schemas, got {list(ldf.columns)} "
                     f"and {list(rdf.columns)}"
                 )
+            stacked = _concat_rows(ldf, rdf)
+            if stacked is not None:
+                return stacked
             return pd.concat([ldf, rdf], ignore_index=True)
 
         case Pivot(
             index=index, columns=pc, values=vc, aggfunc=af, inputs=[child],
         ):
-            df = execute(child)
+            df = _execute(child, cache)
+            pivoted = _scatter_pivot(df, index, pc, vc, af)
+            if pivoted is not None:
+                return pivoted
             result = df.pivot_table(
                 index=index,
                 columns=pc,
@@ -221,14 +375,14 @@ def execute(op: Operation) -> pd.DataFrame:
             id_vars=id_vars, value_vars=value_vars,
             var_name=var_name, value_name=value_name, inputs=[child],
         ):
-            df = execute(child)
+            df = _execute(child, cache)
             return pd.melt(
                 df,
                 id_vars=id_vars,
                 value_vars=value_vars,
                 var_name=var_name,
                 value_name=value_name,
-            ).reset_index(drop=True)
+            )
 
         case Window(
             partition_by=partition_by,
@@ -239,7 +393,7 @@ def execute(op: Operation) -> pd.DataFrame:
             frame=frame,
             inputs=[child],
         ):
-            df = execute(child)
+            df = _execute(child, cache)
             return _execute_window(
                 df, partition_by, order_by, func, input_col, output_col, frame
             )
@@ -248,6 +402,302 @@ def execute(op: Operation) -> pd.DataFrame:
             raise TypeError(f"Unknown operation type: {type(op).__name__}")
 
 
+def _sort_indexer(
+    df: pd.DataFrame, keys: list[tuple[str, str]]
+) -> np.ndarray | None:
+    """Compute a stable row permutation for *keys* directly on NumPy arrays.
+
+    Only plain numeric keys without NaN are handled; anything else returns
+    None so the caller can fall back to ``sort_values``. Descending keys are
+    replaced by their negated dense ranks, which keeps ties in input order.
+    A single wide integer key on a large frame is radix sorted.
+    """
+    arrays = []
+    for name, direction in keys:
+        arr = df[name].to_numpy()
+        if arr.dtype.kind not in "biuf":
+            return None
+        if arr.dtype.kind == "f" and np.isnan(arr).any():
+            return None
+        if direction == "desc":
+            arr = -np.unique(arr, return_inverse=True)[1]
+        arrays.append(arr)
+    if len(arrays) == 1:
+        key = arrays[0]
+        if key.dtype.kind in "iu" and key.dtype.itemsize > 2 and len(key) >= RADIX_MIN_ROWS:
+            return radix_argsort(key)
+        return np.argsort(key, kind="stable")
+    return np.lexsort(arrays[::-1])
+
+
+@dataclass
+class _SubplanCache:
+    """Results of repeated subplans for the duration of one ``execute`` call.
+
+    ``keys`` maps ``id(node)`` to a structural key for every node whose
+    subplan occurs more than once; ``results`` maps those keys to frames.
+    """
+
+    keys: dict[int, int]
+    results: dict[int, pd.DataFrame] = field(default_factory=dict)
+
+
+_INPUT_FIELDS = frozenset({"inputs", "input", "left", "right", "data"})
+
+
+def _shared_subplans(root: Operation) -> dict[int, int]:
+    """Find the subplans of *root* that occur more than once.
+
+    Every node is given an integer key built from its type, its own
+    parameters and its children's keys, so structurally identical subtrees
+    get the same key. Sources are identified by their data object rather
+    than its contents. Returns ``id(node) -> key`` for nodes whose key is
+    referenced at least twice.
+    """
+    interned: dict[tuple, int] = {}
+    node_keys: dict[int, int] = {}
+    uses: dict[int, int] = {}
+
+    def visit(node: Operation) -> int:
+        key = node_keys.get(id(node))
+        if key is None:
+            children = tuple(visit(child) for child in node.inputs)
+            if isinstance(node, Source):
+                params: tuple = (node.source_id, id(node.data))
+            else:
+                params = tuple(
+                    repr(getattr(node, f.name))
+                    for f in fields(node)
+                    if f.compare and f.name not in _INPUT_FIELDS
+                )
+            signature = (type(node).__name__, params, children)
+            key = node_keys[id(node)] = interned.setdefault(signature, len(interned))
+        uses[key] = uses.get(key, 0) + 1
+        return key
+
+    visit(root)
+    return {
+        node_id: key for node_id, key in node_keys.items() if uses[key] > 1
+    }
+
+
+def _take_rows(df: pd.DataFrame, indexer: np.ndarray) -> pd.DataFrame:
+    """Gather rows by position into a new frame with a fresh RangeIndex.
+
+    Columns are taken one at a time and the frame is built directly, so no
+    index is carried over and nothing needs ``reset_index``.
+    """
+    if len(df.columns) == 0 or not df.columns.is_unique:
+        return df.take(indexer).reset_index(drop=True)
+    result = pd.DataFrame(
+        {name: df[name].array.take(indexer) for name in df.columns},
+        columns=df.columns,
+    )
+    if __debug__:
+        _assert_range_index(result)
+    return result
+
+
+def _slice_rows(df: pd.DataFrame, n: int, end: str) -> pd.DataFrame:
+    """Keep the first or last *n* rows as views of *df*'s column arrays.
+
+    Building the frame from sliced arrays gives it a fresh RangeIndex
+    without the extra copy ``head(n).reset_index(drop=True)`` makes.
+    """
+    n = min(n, len(df))
+    if len(df.columns) == 0 or not df.columns.is_unique:
+        rows = df.head(n) if end == "head" else df.tail(n)
+        return rows.reset_index(drop=True)
+    window = slice(0, n) if end == "head" else slice(len(df) - n, len(df))
+    return pd.DataFrame(
+        {name: df[name].array[window] for name in df.columns},
+        columns=df.columns,
+        copy=False,
+    )
+
+
+def _concat_rows(top: pd.DataFrame, bottom: pd.DataFrame) -> pd.DataFrame | None:
+    """Stack two same-schema frames column by column with ``np.concatenate``.
+
+    Only numpy-backed columns whose dtypes are equal, or both numeric, are
+    stacked this way; the result dtype is then the one ``pd.concat`` would
+    choose. Returns None when any column needs pandas' concat rules.
+    """
+    if len(top.columns) == 0 or not top.columns.is_unique:
+        return None
+    arrays = {}
+    for name in top.columns:
+        upper = top[name].dtype
+        lower = bottom[name].dtype
+        if not isinstance(upper, np.dtype) or not isinstance(lower, np.dtype):
+            return None
+        if upper != lower and not (upper.kind in "iuf" and lower.kind in "iuf"):
+            return None
+        arrays[name] = np.concatenate(
+            [top[name].to_numpy(), bottom[name].to_numpy()],
+            dtype=np.result_type(upper, lower),
+        )
+    return pd.DataFrame(arrays, columns=top.columns, copy=False)
+
+
+def _ensure_range_index(df: pd.DataFrame) -> pd.DataFrame:
+    """Return *df* with a default RangeIndex, resetting only when needed."""
+    if _has_default_index(df):
+        return df
+    return df.reset_index(drop=True)
+
+
+def _has_default_index(df: pd.DataFrame) -> bool:
+    index = df.index
+    return (
+        isinstance(index, pd.RangeIndex)
+        and index.start == 0
+        and index.step == 1
+        and len(index) == len(df)
+    )
+
+
+def _assert_range_index(df: pd.DataFrame) -> None:
+    """Debug check that an internally built frame carries a default RangeIndex."""
+    assert _has_default_index(df), f"expected a default RangeIndex, got {df.index!r}"
+
+
+def _hash_join(
+    ldf: pd.DataFrame,
+    rdf: pd.DataFrame,
+    key: str,
+    how: str,
+    suffixes: tuple[str, str],
+) -> pd.DataFrame | None:
+    """Inner/left join on a shared single key via a hash index on the right.
+
+    Handles the common case of a unique, NaN-free right key of the same dtype
+    as the left key; returns None otherwise so the caller can use ``merge``.
+    Output rows follow left order and columns follow ``merge``'s naming.
+    """
+    if not (ldf.columns.is_unique and rdf.columns.is_unique) or None in suffixes:
+        return None
+    if ldf[key].dtype != rdf[key].dtype:
+        return None
+    right_index = pd.Index(rdf[key])
+    if not right_index.is_unique or right_index.hasnans:
+        return None
+
+    positions = right_index.get_indexer(ldf[key])
+    if how == "inner":
+        left_rows = np.flatnonzero(positions != -1)
+        right_rows = positions[left_rows]
+    else:
+        left_rows = np.arange(len(ldf))
+        right_rows = positions
+
+    overlap = (set(ldf.columns) & set(rdf.columns)) - {key}
+    left_suffix, right_suffix = suffixes
+    columns: dict[Any, Any] = {}
+    for name in ldf.columns:
+        out_name = f"{name}{left_suffix}" if name in overlap else name
+        columns[out_name] = ldf[name].array.take(left_rows)
+    for name in rdf.columns:
+        if name == key:
+            continue
+        out_name = f"{name}{right_suffix}" if name in overlap else name
+        if out_name in columns:
+            return None
+        columns[out_name] = take(rdf[name].array, right_rows, allow_fill=True)
+    return pd.DataFrame(columns)
+
+
+def _scatter_pivot(
+    df: pd.DataFrame,
+    index: list[str],
+    pivot_column: str,
+    values_column: str,
+    aggfunc: str,
+) -> pd.DataFrame | None:
+    """Pivot by scattering values straight into a 2-D output array.
+
+    Row and column labels are factorized (sorted, as ``pivot_table`` does)
+    and every value is accumulated into its cell with an unbuffered ufunc
+    ``at`` call. Covers a single index column, NaN-free numeric values and
+    keys, and sum/min/max/first/count; returns None for anything else.
+    """
+    if len(index) != 1 or (aggfunc not in _PIVOT_UFUNCS and aggfunc not in ("first", "count")):
+        return None
+    values = df[values_column].to_numpy()
+    if values.dtype.kind not in "iuf":
+        return None
+    if values.dtype.kind == "f" and np.isnan(values).any():
+        return None
+    row_codes, row_labels = pd.factorize(df[index[0]], sort=True)
+    col_codes, col_labels = pd.factorize(df[pivot_column], sort=True)
+    if (row_codes < 0).any() or (col_codes < 0).any():
+        return None
+    col_names = col_labels.astype(str)
+    if not col_names.is_unique or index[0] in col_names:
+        return None
+
+    shape = (len(row_labels), len(col_labels))
+    cells = (row_codes, col_codes)
+    counts = np.zeros(shape, dtype=np.int64)
+    np.add.at(counts, cells, 1)
+    if aggfunc == "count":
+        out = counts
+    elif aggfunc == "sum":
+        # Accumulate in 64 bits so narrow integers don't wrap; like pandas,
+        # integer sums narrow back to the input dtype when every cell fits.
+        out = np.zeros(shape, dtype=_PIVOT_SUM_DTYPES[values.dtype.kind])
+        np.add.at(out, cells, values)
+        narrowed = out.astype(values.dtype)
+        if values.dtype.kind == "f" or np.array_equal(narrowed, out):
+            out = narrowed
+    else:
+        out = np.zeros(shape, dtype=values.dtype)
+        flat = row_codes * shape[1] + col_codes
+        cell_ids, first_rows = np.unique(flat, return_index=True)
+        out.flat[cell_ids] = values[first_rows]
+        if aggfunc in _PIVOT_UFUNCS:
+            _PIVOT_UFUNCS[aggfunc].at(out, cells, values)
+    missing = counts == 0
+    if missing.any():
+        out = out.astype(np.float64)
+        out[missing] = np.nan
+
+    columns: dict[str, Any] = {index[0]: row_labels}
+    for j, name in enumerate(col_names):
+        columns[name] = out[:, j]
+    return pd.DataFrame(columns)
+
+
+def _execute_fused(df: pd.DataFrame, steps: list[Operation]) -> pd.DataFrame:
+    """Run a fused WithColumn/Filter chain against a single copy of *df*.
+
+    Every step is row-wise, so predicates are evaluated over all rows and
+    combined into one mask that is applied after the last step.
+    """
+    df = df.copy()
+    mask = None
+    for step in steps:
+        if isinstance(step, Filter):
+            step_mask = np.asarray(_evaluate_with_numexpr(step.predicate, df), dtype=bool)
+            if mask is None:
+                mask = step_mask.copy()
+            else:
+                np.logical_and(mask, step_mask, out=mask)
+        else:
+            df[step.column] = _evaluate_with_numexpr(step.expression, df)
+    if mask is None:
+        return df
+    return _take_rows(df, np.flatnonzero(mask))
+
+
+def _evaluate_with_numexpr(expr: Expression, df: pd.DataFrame) -> Any:
+    """Evaluate with numexpr when possible, otherwise fall back to pandas."""
+    result = evaluate_numexpr(expr, df)
+    if result is None:
+        return evaluate_expression(expr, df)
+    return result
+
+
 def _execute_window(
     df: pd.DataFrame,
     partition_by: list[str],
@@ -265,8 +715,13 @@ def _execute_window(
         sort_asc = [o[1] == "asc" for o in order_by]
         df = df.sort_values(sort_cols, ascending=sort_asc, kind="mergesort")
 
+    kernel_result = _window_kernel(df, partition_by, func, input_col)
+    if kernel_result is not None:
+        df[output_col] = kernel_result
+        return df.sort_index().reset_index(drop=True)
+
     if partition_by and input_col:
-        grouped = df.groupby(partition_by, sort=False)[input_col]
+        grouped = df.groupby(partition_by, sort=False, observed=True)[input_col]
     elif input_col:
         grouped = df[input_col]
     else:
@@ -340,14 +795,14 @@ def _execute_window(
         case "lag":
             offset = _parse_offset(frame)
             if partition_by:
-                df[output_col] = df.groupby(partition_by, sort=False)[input_col].shift(offset)
+                df[output_col] = grouped.shift(offset)
             else:
                 df[output_col] = df[input_col].shift(offset)
 
         case "lead":
             offset = _parse_offset(frame)
             if partition_by:
-                df[output_col] = df.groupby(partition_by, sort=False)[input_col].shift(-offset)
+                df[output_col] = grouped.shift(-offset)
             else:
                 df[output_col] = df[input_col].shift(-offset)
 
@@ -357,6 +812,95 @@ def _execute_window(
     return df.sort_index().reset_index(drop=True)
 
 
+def _window_kernel(
+    df: pd.DataFrame,
+    partition_by: list[str],
+    func: str,
+    input_col: str | None,
+) -> np.ndarray | None:
+    """Compute row_number, cumsum or rank for all partitions in one pass.
+
+    Rows are stably sorted by partition code so every partition is a
+    contiguous run; the result is computed over the whole array with
+    partition start offsets and scattered back to the current row order.
+    cumsum and rank take integer inputs only, so results match pandas
+    exactly. Returns None when the caller should use the groupby path.
+    """
+    if func not in ("row_number", "cumsum", "rank"):
+        return None
+    values = None
+    if func != "row_number":
+        if input_col is None:
+            return None
+        values = df[input_col].to_numpy()
+        if values.dtype.kind not in "iu":
+            return None
+
+    codes = _partition_codes(df, partition_by)
+    if (codes < 0).any():
+        return None
+
+    if func == "rank":
+        order = np.lexsort((values, codes))
+    else:
+        order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    positions = np.arange(len(df))
+    starts = _run_starts(positions, sorted_codes != np.roll(sorted_codes, 1))
+
+    match func:
+        case "row_number":
+            sorted_out = positions - starts + 1
+        case "cumsum":
+            sorted_values = values[order]
+            running = np.cumsum(sorted_values)
+            sorted_out = running - (running[starts] - sorted_values[starts])
+            # NumPy accumulates narrow integers in 64 bits; pandas then narrows
+            # back to the input dtype when every running total fits.
+            narrowed = sorted_out.astype(values.dtype)
+            if np.array_equal(narrowed, sorted_out):
+                sorted_out = narrowed
+        case _:
+            sorted_values = values[order]
+            tie_starts = _run_starts(
+                positions,
+                (sorted_codes != np.roll(sorted_codes, 1))
+                | (sorted_values != np.roll(sorted_values, 1)),
+            )
+            sorted_out = tie_starts - starts + 1
+
+    out = np.empty_like(sorted_out)
+    out[order] = sorted_out
+    return out
+
+
+def _partition_codes(df: pd.DataFrame, partition_by: list[str]) -> np.ndarray:
+    """Label each row with an integer identifying its partition.
+
+    A single categorical key already carries its codes, so they are used
+    as-is instead of hashing the values again. Rows with a missing key get -1.
+    """
+    if not partition_by:
+        return np.zeros(len(df), dtype=np.intp)
+    if len(partition_by) == 1:
+        key = df[partition_by[0]]
+        if isinstance(key.dtype, pd.CategoricalDtype):
+            return key.cat.codes.to_numpy()
+    return df.groupby(partition_by, sort=False, observed=True).ngroup().to_numpy()
+
+
+def _run_starts(positions: np.ndarray, boundary: np.ndarray) -> np.ndarray:
+    """Map each position to the first position of its run.
+
+    *boundary* marks positions that begin a new run; the first position
+    always does.
+    """
+    if len(positions) == 0:
+        return positions
+    boundary[0] = True
+    return np.maximum.accumulate(np.where(boundary, positions, 0))
+
+
 def _parse_offset(frame: str | None) -> int:
     """Extract an integer offset from a frame spec string. Defaults to 1."""
     if frame is None:
@@ -11,7 +11,12 @@ for backward compatibility and serialization.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def _columns_of(node: Any) -> Tuple[str, ...]:
+    """``referenced_columns`` of *node*; children built by hand may be plain strings."""
+    return node.referenced_columns if isinstance(node, Expression) else ()
 
 
 def _wrap(other: Any) -> "Expression":
@@ -27,13 +32,34 @@ class Expression:
 
     Supports Python operators so you can write ``col("age") > 30`` and get
     back a ``BinaryOp`` AST node.
+
+    The eager executor memoizes a compiled evaluator for each node in
+    ``_compiled`` the first time it is evaluated; ``referenced_columns`` is
+    likewise memoized in ``_referenced_columns``.
     """
 
     expr: str = ""
+    _compiled: Optional[Callable[[Any], Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _referenced_columns: Optional[Tuple[str, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __str__(self) -> str:
         return self.expr
 
+    @property
+    def referenced_columns(self) -> Tuple[str, ...]:
+        """Names of the columns this expression reads, in first-reference order."""
+        if self._referenced_columns is None:
+            self._referenced_columns = tuple(dict.fromkeys(self._child_columns()))
+        return self._referenced_columns
+
+    def _child_columns(self) -> Iterable[str]:
+        # A plain-string expression cannot be analyzed; it references nothing.
+        return ()
+
     # Arithmetic
     def __add__(self, other: Any) -> "BinaryOp":
         return BinaryOp(op="+", left=self, right=_wrap(other))
@@ -129,6 +155,9 @@ class Column(Expression):
     def __str__(self) -> str:
         return self.name
 
+    def _child_columns(self) -> Iterable[str]:
+        return (self.name,)
+
     def to_dict(self) -> Dict[str, Any]:
         return {"type": "column", "name": self.name}
 
@@ -173,6 +202,9 @@ class BinaryOp(Expression):
     def __str__(self) -> str:
         return f"({self.left} {self.op} {self.right})"
 
+    def _child_columns(self) -> Iterable[str]:
+        return _columns_of(self.left) + _columns_of(self.right)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "type": "binary_op",
@@ -200,6 +232,9 @@ class UnaryOp(Expression):
     def __str__(self) -> str:
         return f"({self.op} {self.operand})"
 
+    def _child_columns(self) -> Iterable[str]:
+        return _columns_of(self.operand)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "type": "unary_op",
@@ -226,6 +261,9 @@ class FunctionCall(Expression):
         args_str = ", ".join(str(a) for a in self.args)
         return f"{self.func}({args_str})"
 
+    def _child_columns(self) -> Iterable[str]:
+        return (name for arg in self.args for name in _columns_of(arg))
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "type": "function_call",
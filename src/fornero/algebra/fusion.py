@@ -0,0 +1,164 @@
+"""Projection fusion for the eager executor.
+
+A chain such as ``WithColumn -> WithColumn -> Filter`` is evaluated one node
+at a time by default: every WithColumn copies the frame and every Filter
+materializes a new one. Because all of these nodes are row-wise, the chain can
+instead be run against a single copy of the input, with every predicate folded
+into one boolean mask that is applied once at the end.
+
+When the optional ``numexpr`` package is installed, each numeric expression in
+the fused chain is compiled to a numexpr string and evaluated in a single
+vectorized pass, avoiding one temporary array per arithmetic operator.
+Expressions numexpr cannot express (strings, unsupported functions, non-numeric
+columns) fall back to ``evaluate_expression``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from fornero.algebra.expressions import (
+    BinaryOp,
+    Column,
+    Expression,
+    FunctionCall,
+    Literal,
+    UnaryOp,
+)
+from fornero.algebra.operations import Filter, Operation, WithColumn
+
+try:
+    import numexpr
+except ImportError:  # pragma: no cover - exercised only without numexpr
+    numexpr = None
+
+# ``%`` is left out: with integer operands numexpr gives 0 for a zero divisor
+# where pandas gives NaN (and a float64 column).
+_NUMEXPR_BINARY_OPS: dict[str, str] = {
+    "+": "+",
+    "-": "-",
+    "*": "*",
+    "/": "/",
+    ">": ">",
+    "<": "<",
+    ">=": ">=",
+    "<=": "<=",
+    "==": "==",
+    "!=": "!=",
+    "and": "&",
+    "or": "|",
+}
+
+# Functions whose numexpr result dtype matches numpy's. ``abs`` is excluded
+# because numexpr promotes integer input to float64.
+_NUMEXPR_FUNCS = frozenset({"sqrt", "log", "exp"})
+
+# Column dtypes numexpr evaluates with numpy's semantics. Narrower and unsigned
+# integers are widened or reinterpreted by numexpr, so their overflow differs.
+_NUMEXPR_DTYPES = frozenset(
+    np.dtype(name) for name in ("bool", "int32", "int64", "float32", "float64")
+)
+
+
+@dataclass(slots=True)
+class FusedProject(Operation):
+    """A maximal run of WithColumn/Filter nodes executed as one step.
+
+    ``steps`` holds the original nodes in execution order (innermost first);
+    ``inputs`` holds the single child feeding the chain.
+    """
+
+    steps: list[Operation] = field(default_factory=list)
+
+
+def _is_fusable(op: Operation) -> bool:
+    if isinstance(op, WithColumn):
+        return isinstance(op.expression, Expression)
+    if isinstance(op, Filter):
+        return isinstance(op.predicate, Expression)
+    return False
+
+
+def fuse_projections(op: Operation) -> Operation:
+    """Coalesce the WithColumn/Filter chain rooted at *op*.
+
+    Returns a ``FusedProject`` when the chain has at least two nodes, and
+    *op* unchanged otherwise.
+    """
+    steps: list[Operation] = []
+    node = op
+    while _is_fusable(node):
+        steps.append(node)
+        node = node.inputs[0]
+    if len(steps) < 2:
+        return op
+    steps.reverse()
+    return FusedProject(steps=steps, inputs=(node,))
+
+
+def expression_to_numexpr(expr: Any, names: dict[str, str]) -> Optional[str]:
+    """Serialize *expr* to a numexpr expression string.
+
+    Column references are replaced by placeholder identifiers so that column
+    names need not be valid Python identifiers; *names* is filled in with the
+    ``column -> placeholder`` mapping. Returns None if any node cannot be
+    expressed in numexpr.
+    """
+    match expr:
+        case Column(name=name):
+            if name not in names:
+                names[name] = f"_c{len(names)}"
+            return names[name]
+
+        case Literal(value=value):
+            if isinstance(value, (bool, int, float, np.bool_, np.integer, np.floating)):
+                return repr(value.item() if isinstance(value, np.generic) else value)
+            return None
+
+        case BinaryOp(op=op, left=left, right=right):
+            symbol = _NUMEXPR_BINARY_OPS.get(op)
+            if symbol is None:
+                return None
+            lhs = expression_to_numexpr(left, names)
+            rhs = expression_to_numexpr(right, names)
+            if lhs is None or rhs is None:
+                return None
+            return f"({lhs} {symbol} {rhs})"
+
+        case UnaryOp(op="neg", operand=operand):
+            inner = expression_to_numexpr(operand, names)
+            return None if inner is None else f"(-{inner})"
+
+        case UnaryOp(op="not", operand=operand):
+            inner = expression_to_numexpr(operand, names)
+            return None if inner is None else f"(~{inner})"
+
+        case FunctionCall(func=func, args=args) if func in _NUMEXPR_FUNCS and len(args) == 1:
+            inner = expression_to_numexpr(args[0], names)
+            return None if inner is None else f"{func}({inner})"
+
+        case _:
+            return None
+
+
+def evaluate_numexpr(expr: Expression, df: pd.DataFrame) -> Optional[np.ndarray]:
+    """Evaluate *expr* with numexpr, or return None if that is not possible."""
+    if numexpr is None:
+        return None
+    names: dict[str, str] = {}
+    source = expression_to_numexpr(expr, names)
+    if source is None or not names:
+        return None
+    local_dict: dict[str, np.ndarray] = {}
+    for column, placeholder in names.items():
+        if column not in df.columns:
+            return None
+        dtype = df[column].dtype
+        if not isinstance(dtype, np.dtype) or dtype not in _NUMEXPR_DTYPES:
+            return None
+        local_dict[placeholder] = df[column].to_numpy()
+    return numexpr.evaluate(source, local_dict=local_dict)
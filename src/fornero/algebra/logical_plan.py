@@ -6,8 +6,100 @@ methods for introspection, serialization, and debugging. It tracks the complete
 graph from source to final result.
 """
 
-from typing import Dict, Any
-from .operations import Operation, Source
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+from .operations import NodeKind, Operation, Source
+
+
+# explain() line templates per node kind, bound once as str.format methods. Each
+# is called with the class name and the node; kinds with optional fields leave
+# the closing parenthesis to _describe().
+_TEMPLATES: Dict[NodeKind, Callable[..., str]] = {
+    NodeKind.SOURCE: "{0}(source_id='{1.source_id}'".format,
+    NodeKind.SELECT: "{0}(columns={1.columns}".format,
+    NodeKind.FILTER: "{0}(predicate='{1.predicate}')".format,
+    NodeKind.JOIN: lambda name, op: "{0}(left_on={1}, right_on={2}, type='{3}')".format(
+        name, list(op.left_on), list(op.right_on), op.join_type
+    ),
+    NodeKind.GROUPBY: "{0}(keys={1.keys}, aggregations={1.aggregations})".format,
+    NodeKind.AGGREGATE: "{0}(aggregations={1.aggregations})".format,
+    NodeKind.SORT: "{0}(keys={1.keys}".format,
+    NodeKind.LIMIT: "{0}(count={1.count}, end='{1.end}')".format,
+    NodeKind.WITH_COLUMN: "{0}(column='{1.column}', expression='{1.expression}')".format,
+    NodeKind.PIVOT: "{0}(index={1.index}, columns='{1.columns}', values='{1.values}')".format,
+    NodeKind.MELT: "{0}(id_vars={1.id_vars}".format,
+    NodeKind.WINDOW: "{0}(function='{1.function}', output='{1.output_column}'".format,
+}
+
+# Optional fields appended after the template when set (not None, not an empty list).
+_OPTIONAL_FIELDS: Dict[NodeKind, Tuple[Tuple[str, Callable[..., str]], ...]] = {
+    NodeKind.SOURCE: (("schema", ", schema={}".format),),
+    NodeKind.SELECT: (("predicate", ", predicate='{}'".format),),
+    NodeKind.SORT: (("limit", ", limit={}".format), ("predicate", ", predicate='{}'".format)),
+    NodeKind.MELT: (("value_vars", ", value_vars={}".format),),
+    NodeKind.WINDOW: (
+        ("partition_by", ", partition_by={}".format),
+        ("order_by", ", order_by={}".format),
+    ),
+}
+
+
+def _describe(op: Operation) -> str:
+    """Render the one-line explain() description of *op*."""
+    op_type = op.__class__.__name__
+    template = _TEMPLATES.get(op.kind)
+    if template is None:
+        # Union, fused nodes and unknown operations
+        return f"{op_type}()"
+
+    desc = template(op_type, op)
+    optional = _OPTIONAL_FIELDS.get(op.kind)
+    if optional is None:
+        return desc
+    for name, render in optional:
+        value = getattr(op, name, None)
+        if value is not None and not (isinstance(value, list) and not value):
+            desc += render(value)
+    return desc + ")"
+
+
+def validate_plan(root: Operation) -> None:
+    """Validate the not-yet-validated nodes under *root* in one post-order walk.
+
+    Each such node is checked against its inputs' ``output_schema``, which is
+    derived once per node and kept on it, so it is checked against the schema its
+    inputs actually produce. Nodes already validated, e.g. at construction, are
+    skipped, like ``Operation.validate()``. Shared subplans are visited once.
+
+    Args:
+        root: Root operation of the plan
+
+    Raises:
+        SchemaValidationError: At the innermost node that references columns
+            its inputs lack
+    """
+    schema_sets: Dict[int, Optional[FrozenSet[str]]] = {}
+    stack = [(root, False)]
+    while stack:
+        op, expanded = stack.pop()
+        if id(op) in schema_sets:
+            continue
+        if not expanded:
+            stack.append((op, True))
+            stack.extend((inp, False) for inp in op.inputs if id(inp) not in schema_sets)
+            continue
+
+        if not op._validated:
+            op._validate_with_input_schemas(
+                tuple(inp.output_schema for inp in op.inputs),
+                tuple(schema_sets[id(inp)] for inp in op.inputs),
+            )
+            op._validated = True
+
+        if isinstance(op, Source):
+            schema_sets[id(op)] = op._schema_set
+        else:
+            schema = op.output_schema
+            schema_sets[id(op)] = frozenset(schema) if schema is not None else None
 
 
 class LogicalPlan:
@@ -37,6 +129,8 @@ class LogicalPlan:
         if not isinstance(root, Operation):
             raise TypeError(f"Plan root must be an Operation, got {type(root)}")
         self._root = root
+        self._explained: Dict[bool, str] = {}
+        self._optimized: Optional['LogicalPlan'] = None
 
     @property
     def root(self) -> Operation:
@@ -66,11 +160,45 @@ class LogicalPlan:
             raise ValueError("Plan dict must have 'root' or 'type' key")
         return cls(root)
 
+    def validate(self) -> None:
+        """Run schema validation on every node of the plan not yet validated.
+
+        See ``validate_plan``. Construction validates each node unless
+        ``FORNERO_LAZY_VALIDATION`` is set, so this only does work for deferred
+        nodes; unlike construction-time validation, which only knows the schemas
+        of Source inputs, it checks them against the columns derived for their
+        inputs.
+
+        Raises:
+            SchemaValidationError: If any node references columns its inputs lack
+        """
+        validate_plan(self._root)
+
+    def optimized(self) -> 'LogicalPlan':
+        """Return the plan rewritten by the translator's optimization passes.
+
+        Applies predicate pushdown, projection pushdown and operator fusion
+        (e.g. ``Select(Filter(...))`` becomes one Select with a predicate). The
+        result is computed on first use and kept on the plan, so translating
+        the same plan again skips the passes.
+
+        Returns:
+            Optimized LogicalPlan
+        """
+        if self._optimized is None:
+            # Import locally: the translator package imports the algebra.
+            from fornero.translator.optimizer import Optimizer
+
+            self._optimized = Optimizer().optimize(self)
+        return self._optimized
+
     def explain(self, verbose: bool = False) -> str:
         """Generate a human-readable explanation of the plan.
 
         The explanation shows the operation tree from leaves (sources) to root (final result).
-        Each operation is indented based on its depth in the tree.
+        Each operation is indented based on its depth in the tree. The rendered text is
+        cached per ``verbose`` flag: plans are never modified in place (tracked operations
+        build a new plan), so repeat calls return the same string.
 
         Args:
             verbose: If True, include more detailed information about each operation
@@ -78,6 +206,10 @@ class LogicalPlan:
         Returns:
             String explanation of the plan
         """
+        cached = self._explained.get(verbose)
+        if cached is not None:
+            return cached
+
         lines = []
         lines.append("Logical Plan:")
         lines.append("=" * 60)
@@ -85,7 +217,9 @@ class LogicalPlan:
         # Traverse the tree and build explanation
         self._explain_operation(self._root, lines, indent=0, verbose=verbose)
 
-        return "\n".join(lines)
+        explanation = "\n".join(lines)
+        self._explained[verbose] = explanation
+        return explanation
 
     def _explain_operation(self, op: Operation, lines: list, indent: int, verbose: bool):
         """Recursively explain an operation and its inputs.
@@ -100,75 +234,7 @@ class LogicalPlan:
         for input_op in op.inputs:
             self._explain_operation(input_op, lines, indent, verbose)
 
-        # Format this operation
-        prefix = "  " * indent
-        op_type = op.__class__.__name__
-
-        # Import locally to avoid circular imports
-        from .operations import (
-            Source, Select, Filter, Join, GroupBy, Aggregate,
-            Sort, Limit, WithColumn, Pivot, Melt, Window
-        )
-
-        # Build operation description
-        if isinstance(op, Source):
-            desc = f"{prefix}{op_type}(source_id='{op.source_id}'"
-            if op.schema:
-                desc += f", schema={op.schema}"
-            desc += ")"
-
-        elif isinstance(op, Select):
-            desc = f"{prefix}{op_type}(columns={op.columns}"
-            if hasattr(op, 'predicate') and op.predicate is not None:
-                desc += f", predicate='{op.predicate}'"
-            desc += ")"
-
-        elif isinstance(op, Filter):
-            desc = f"{prefix}{op_type}(predicate='{op.predicate}')"
-
-        elif isinstance(op, Join):
-            desc = f"{prefix}{op_type}(left_on={op.left_on}, right_on={op.right_on}, type='{op.join_type}')"
-
-        elif isinstance(op, GroupBy):
-            desc = f"{prefix}{op_type}(keys={op.keys}, aggregations={op.aggregations})"
-
-        elif isinstance(op, Aggregate):
-            desc = f"{prefix}{op_type}(aggregations={op.aggregations})"
-
-        elif isinstance(op, Sort):
-            desc = f"{prefix}{op_type}(keys={op.keys}"
-            if hasattr(op, 'limit') and op.limit is not None:
-                desc += f", limit={op.limit}"
-            if hasattr(op, 'predicate') and op.predicate is not None:
-                desc += f", predicate='{op.predicate}'"
-            desc += ")"
-
-        elif isinstance(op, Limit):
-            desc = f"{prefix}{op_type}(count={op.count}, end='{op.end}')"
-
-        elif isinstance(op, WithColumn):
-            desc = f"{prefix}{op_type}(column='{op.column}', expression='{op.expression}')"
-
-        elif isinstance(op, Pivot):
-            desc = f"{prefix}{op_type}(index={op.index}, columns='{op.columns}', values='{op.values}')"
-
-        elif isinstance(op, Melt):
-            value_vars_str = f", value_vars={op.value_vars}" if op.value_vars else ""
-            desc = f"{prefix}{op_type}(id_vars={op.id_vars}{value_vars_str})"
-
-        elif isinstance(op, Window):
-            desc = f"{prefix}{op_type}(function='{op.function}', output='{op.output_column}'"
-            if op.partition_by:
-                desc += f", partition_by={op.partition_by}"
-            if op.order_by:
-                desc += f", order_by={op.order_by}"
-            desc += ")"
-
-        else:
-            # Generic fallback - Union or unknown operation
-            desc = f"{prefix}{op_type}()"
-
-        lines.append(desc)
+        lines.append("  " * indent + _describe(op))
 
     def copy(self) -> 'LogicalPlan':
         """Create a shallow copy of the plan.
@@ -22,6 +22,13 @@ When schemas are not available (e.g., Source without explicit schema, or operati
 during tracing phase), validation is gracefully skipped. String expressions cannot be
 validated and are also skipped.
 
+Setting the ``FORNERO_LAZY_VALIDATION`` environment variable (read once at import) defers
+these checks: constructors skip them, and ``Operation.validate()`` runs them on demand, at
+most once per node. ``LogicalPlan.validate()`` validates the deferred nodes of a plan in
+one post-order walk, checking each against the columns derived for its inputs rather than
+only against Source schemas, so it also catches e.g. a Filter on a column dropped by a
+Select below it.
+
 Errors are raised as SchemaValidationError (subclass of ValueError) with clear messages
 indicating which columns are missing and what columns are available.
 
@@ -30,12 +37,14 @@ Constructor shortcuts
 Unary operations accept ``input=<op>`` as shorthand for ``inputs=[<op>]``.
 Binary operations (Join, Union) accept ``left=`` / ``right=`` as shorthand for
 ``inputs=[left, right]``.  Additional aliases (e.g. ``n`` for ``count``,
-``how`` for ``join_type``) are listed per-class.
+``how`` for ``join_type``) are listed per-class. However they are given, inputs
+are stored as a tuple.
 """
 
+import os
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any, Tuple, Union, TYPE_CHECKING
-from enum import Enum
+from typing import ClassVar, List, Dict, FrozenSet, Optional, Any, Tuple, Union, TYPE_CHECKING
+from enum import Enum, IntEnum
 
 import pandas as pd
 
@@ -43,6 +52,14 @@ if TYPE_CHECKING:
     from .expressions import Expression
 
 
+LAZY_VALIDATION = os.environ.get("FORNERO_LAZY_VALIDATION", "") not in ("", "0")
+"""Defer schema validation from construction to ``Operation.validate()``."""
+
+
+_UNDERIVED: Any = object()
+"""Marks an ``Operation.output_schema`` that has not been computed yet."""
+
+
 class SchemaValidationError(ValueError):
     """Raised when operation schema validation fails."""
     pass
@@ -65,33 +82,135 @@ class LimitEnd(str, Enum):
     TAIL = "tail"
 
 
+class NodeKind(IntEnum):
+    """Integer tag identifying an operation's type.
+
+    Every operation class carries its tag as the class attribute ``kind``, so
+    dispatch code can compare one integer instead of walking an ``isinstance``
+    chain. Subclasses inherit their parent's tag.
+    """
+
+    SOURCE = 0
+    SELECT = 1
+    FILTER = 2
+    JOIN = 3
+    GROUPBY = 4
+    AGGREGATE = 5
+    SORT = 6
+    LIMIT = 7
+    WITH_COLUMN = 8
+    UNION = 9
+    PIVOT = 10
+    MELT = 11
+    WINDOW = 12
+
+
 def _resolve_inputs(
-    inputs: List["Operation"],
+    inputs: Tuple["Operation", ...],
     *,
     input: Optional["Operation"] = None,
     left: Optional["Operation"] = None,
     right: Optional["Operation"] = None,
-) -> List["Operation"]:
-    """Build the inputs list from explicit inputs or convenience aliases."""
+) -> Tuple["Operation", ...]:
+    """Build the inputs tuple from explicit inputs or convenience aliases."""
     if inputs:
-        return inputs
+        return inputs if type(inputs) is tuple else tuple(inputs)
     if left is not None or right is not None:
-        result: list[Operation] = []
-        if left is not None:
-            result.append(left)
-        if right is not None:
-            result.append(right)
-        return result
+        return tuple(side for side in (left, right) if side is not None)
     if input is not None:
-        return [input]
-    return []
+        return (input,)
+    return ()
+
+
+def _as_key_tuple(keys: Any) -> Tuple[str, ...]:
+    """Normalize a join key given as a name or a sequence of names to a tuple."""
+    if isinstance(keys, str):
+        return (keys,) if keys else ()
+    return tuple(keys)
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class Operation:
     """Base class for all operations."""
 
-    inputs: List["Operation"] = field(default_factory=list)
+    kind: ClassVar[Optional[NodeKind]] = None
+
+    inputs: Tuple["Operation", ...] = ()
+    _validated: bool = field(default=False, init=False, repr=False, compare=False)
+    _output_columns: Optional[List[str]] = field(
+        default=_UNDERIVED, init=False, repr=False, compare=False
+    )
+
+    def validate(self) -> None:
+        """Run this node's schema validation, at most once.
+
+        Raises:
+            SchemaValidationError: If the node references columns its inputs lack
+        """
+        if self._validated:
+            return
+        self._check_schema()
+        self._validated = True
+
+    def _check_schema(self) -> None:
+        """Validate this node against the schemas of Source inputs."""
+        self._validate_with_input_schemas(
+            self._get_input_schemas(),
+            tuple(self._infer_schema_set(inp) for inp in self.inputs),
+        )
+
+    def _validate_with_input_schemas(
+        self,
+        schemas: Tuple[Optional[List[str]], ...],
+        schema_sets: Tuple[Optional[FrozenSet[str]], ...],
+    ) -> None:
+        """Schema checks for this node; overridden by validating operations.
+
+        Args:
+            schemas: Column list of each input, None where it is not known
+            schema_sets: The same schemas as frozensets, for membership tests
+        """
+
+    @property
+    def output_schema(self) -> Optional[List[str]]:
+        """Output columns derived from the Source schemas below, or None if unknown.
+
+        Computed on first access for this node and any underived nodes below it,
+        then kept on each node. Operations are not mutated after construction,
+        and ``dataclasses.replace`` starts the copy with an empty memo.
+        """
+        if self._output_columns is _UNDERIVED:
+            # Fill bottom-up with an explicit stack so deep chains don't recurse
+            pending = [self]
+            while pending:
+                op = pending[-1]
+                underived = [inp for inp in op.inputs if inp._output_columns is _UNDERIVED]
+                if underived:
+                    pending.extend(underived)
+                    continue
+                pending.pop()
+                if op._output_columns is _UNDERIVED:
+                    op._output_columns = op._output_schema(
+                        tuple(inp._output_columns for inp in op.inputs)
+                    )
+        return self._output_columns
+
+    def _output_schema(self, schemas: Tuple[Optional[List[str]], ...]) -> Optional[List[str]]:
+        """Derive this node's output columns from its inputs' columns.
+
+        Returns None when the output cannot be derived without executing the
+        node (the default), which skips validation of the nodes above it.
+        """
+        return None
+
+    @classmethod
+    def unary(cls, input: "Operation", **kwargs: Any) -> "Operation":
+        """Build a single-input operation over *input*.
+
+        Shortcut for ``cls(inputs=(input,), **kwargs)`` used by the tracer,
+        which appends exactly one node per traced call.
+        """
+        return cls(inputs=(input,), **kwargs)
 
     def _get_input_schema(self) -> Optional[List[str]]:
         """Get the schema from the single input operation.
@@ -130,42 +249,32 @@ class Operation:
         return None
 
     @staticmethod
-    def _extract_column_names(expression: Any) -> List[str]:
+    def _infer_schema_set(op: "Operation") -> Optional[FrozenSet[str]]:
+        """Like ``_infer_schema``, but as the frozenset cached on the Source.
+
+        Validators test membership against this instead of the schema list.
+        """
+        if isinstance(op, Source):
+            return op._schema_set
+        return None
+
+    @staticmethod
+    def _extract_column_names(expression: Any) -> Tuple[str, ...]:
         """Extract column names referenced in an expression.
 
         Args:
             expression: Expression object or string
 
         Returns:
-            List of column names found in the expression
+            Column names found in the expression, memoized on the expression node.
+            Empty for strings and anything else that is not an Expression.
         """
         # Import here to avoid circular dependency
-        from fornero.algebra.expressions import Expression, Column, BinaryOp, UnaryOp, FunctionCall
-
-        if isinstance(expression, str):
-            # For string expressions, we can't reliably extract columns
-            # Return empty list to skip validation
-            return []
-
-        if isinstance(expression, Column):
-            return [expression.name]
-
-        if isinstance(expression, BinaryOp):
-            left_cols = Operation._extract_column_names(expression.left)
-            right_cols = Operation._extract_column_names(expression.right)
-            return left_cols + right_cols
-
-        if isinstance(expression, UnaryOp):
-            return Operation._extract_column_names(expression.operand)
+        from fornero.algebra.expressions import Expression
 
-        if isinstance(expression, FunctionCall):
-            cols = []
-            for arg in expression.args:
-                cols.extend(Operation._extract_column_names(arg))
-            return cols
-
-        # For other expression types or None, return empty list
-        return []
+        if isinstance(expression, Expression):
+            return expression.referenced_columns
+        return ()
 
     def to_dict(self) -> Dict[str, Any]:
         raise NotImplementedError(
@@ -226,23 +335,54 @@ class Operation:
         return op_class(**kwargs)
 
 
-@dataclass
+def _arrow_to_pandas(table: Any) -> Any:
+    """Wrap a ``pyarrow.Table`` as a DataFrame without copying its buffers.
+
+    Columns get ``pd.ArrowDtype``, so pandas runs comparisons, filters and
+    reductions on them with Arrow compute kernels. Objects without
+    ``to_pandas`` are returned unchanged.
+    """
+    to_pandas = getattr(table, "to_pandas", None)
+    if to_pandas is None:
+        return table
+    arrow_dtype = getattr(pd, "ArrowDtype", None)
+    if arrow_dtype is None:
+        return to_pandas()
+    return to_pandas(types_mapper=arrow_dtype)
+
+
+@dataclass(slots=True)
 class Source(Operation):
     """Data source — always a leaf node.
 
+    ``data`` may also be given as a ``pyarrow.Table``; it is converted once at
+    construction to a DataFrame whose columns stay Arrow-backed.
+
     Aliases: ``name`` → ``source_id``.
     """
 
+    kind: ClassVar[NodeKind] = NodeKind.SOURCE
+
     source_id: str = ""
     schema: Optional[List[str]] = None
     data: Optional[pd.DataFrame] = field(default=None, repr=False)
     name: Optional[str] = field(default=None, repr=False)
+    _schema_set: Optional[FrozenSet[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         if self.name is not None and not self.source_id:
             self.source_id = self.name
         if self.inputs:
             raise ValueError("Source operation cannot have inputs")
+        self.inputs = ()
+        self._schema_set = frozenset(self.schema) if self.schema is not None else None
+        if self.data is not None and not isinstance(self.data, pd.DataFrame):
+            self.data = _arrow_to_pandas(self.data)
+
+    def _output_schema(self, schemas):
+        return self.schema
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -253,13 +393,15 @@ class Source(Operation):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Select(Operation):
     """Column projection.
 
     Aliases: ``input`` → ``inputs[0]``.
     """
 
+    kind: ClassVar[NodeKind] = NodeKind.SELECT
+
     columns: List[str] = field(default_factory=list)
     predicate: Any = None  # Optional filter predicate pushed down
     input: Optional[Operation] = field(default=None, repr=False)
@@ -272,16 +414,24 @@ class Select(Operation):
         if not self.columns:
             raise ValueError("Select operation must specify at least one column")
 
+        if not LAZY_VALIDATION:
+            self.validate()
+
+    def _validate_with_input_schemas(self, schemas, schema_sets) -> None:
         # Validate that requested columns exist in input schema
-        input_schema = self._get_input_schema()
+        input_schema = schemas[0]
         if input_schema is not None:
-            missing_columns = [col for col in self.columns if col not in input_schema]
-            if missing_columns:
+            available = schema_sets[0]
+            if not available.issuperset(self.columns):
+                missing_columns = [col for col in self.columns if col not in available]
                 raise SchemaValidationError(
                     f"Select references non-existent columns: {missing_columns}. "
                     f"Available columns: {input_schema}"
                 )
 
+    def _output_schema(self, schemas):
+        return list(self.columns)
+
     def to_dict(self) -> Dict[str, Any]:
         result = {
             "type": "select",
@@ -296,13 +446,15 @@ class Select(Operation):
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Filter(Operation):
     """Row filtering.
 
     Aliases: ``input`` → ``inputs[0]``.
     """
 
+    kind: ClassVar[NodeKind] = NodeKind.FILTER
+
     predicate: "Expression | Any" = ""
     input: Optional[Operation] = field(default=None, repr=False)
 
@@ -314,18 +466,26 @@ class Filter(Operation):
         if not self.predicate and self.predicate != 0:
             raise ValueError("Filter operation must specify a predicate")
 
+        if not LAZY_VALIDATION:
+            self.validate()
+
+    def _validate_with_input_schemas(self, schemas, schema_sets) -> None:
         # Validate that condition columns exist in input schema
-        input_schema = self._get_input_schema()
+        input_schema = schemas[0]
         if input_schema is not None:
             referenced_columns = self._extract_column_names(self.predicate)
             if referenced_columns:
-                missing_columns = [col for col in referenced_columns if col not in input_schema]
-                if missing_columns:
+                available = schema_sets[0]
+                if not available.issuperset(referenced_columns):
+                    missing_columns = [col for col in referenced_columns if col not in available]
                     raise SchemaValidationError(
                         f"Filter predicate references non-existent columns: {missing_columns}. "
                         f"Available columns: {input_schema}"
                     )
 
+    def _output_schema(self, schemas):
+        return schemas[0]
+
     def to_dict(self) -> Dict[str, Any]:
         pred = self.predicate
         if hasattr(pred, "to_dict"):
@@ -337,17 +497,22 @@ class Filter(Operation):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Join(Operation):
     """Equi-join.
 
+    ``left_on`` and ``right_on`` accept a column name or a list of names and are
+    stored as tuples, which makes Join nodes hashable.
+
     Aliases: ``left`` / ``right`` → ``inputs[0]`` / ``inputs[1]``,
     ``left_key`` → ``left_on``, ``right_key`` → ``right_on``,
     ``how`` → ``join_type``.
     """
 
-    left_on: str | list[str] = ""
-    right_on: str | list[str] = ""
+    kind: ClassVar[NodeKind] = NodeKind.JOIN
+
+    left_on: str | list[str] | Tuple[str, ...] = ""
+    right_on: str | list[str] | Tuple[str, ...] = ""
     join_type: str = "inner"
     suffixes: Tuple[str, str] = ("_x", "_y")
     left: Optional[Operation] = field(default=None, repr=False)
@@ -372,28 +537,32 @@ class Join(Operation):
 
         if len(self.inputs) != 2:
             raise ValueError("Join operation must have exactly two inputs")
-        if isinstance(self.left_on, str):
-            self.left_on = [self.left_on] if self.left_on else []
-        if isinstance(self.right_on, str):
-            self.right_on = [self.right_on] if self.right_on else []
+        self.left_on = _as_key_tuple(self.left_on)
+        self.right_on = _as_key_tuple(self.right_on)
         if not self.left_on or not self.right_on:
             raise ValueError("Join operation must specify join keys")
         valid_types = {"inner", "left", "right", "outer"}
         if self.join_type not in valid_types:
             raise ValueError(f"Join type must be one of {valid_types}, got: {self.join_type}")
 
+        if not LAZY_VALIDATION:
+            self.validate()
+
+    def _validate_with_input_schemas(self, schemas, schema_sets) -> None:
         # Validate that join keys exist in respective schemas
-        left_schema, right_schema = self._get_input_schemas()
+        left_schema, right_schema = schemas
         if left_schema is not None:
-            missing_left = [key for key in self.left_on if key not in left_schema]
-            if missing_left:
+            left_available = schema_sets[0]
+            if not left_available.issuperset(self.left_on):
+                missing_left = [key for key in self.left_on if key not in left_available]
                 raise SchemaValidationError(
                     f"Join left_on references non-existent columns: {missing_left}. "
                     f"Available columns: {left_schema}"
                 )
         if right_schema is not None:
-            missing_right = [key for key in self.right_on if key not in right_schema]
-            if missing_right:
+            right_available = schema_sets[1]
+            if not right_available.issuperset(self.right_on):
+                missing_right = [key for key in self.right_on if key not in right_available]
                 raise SchemaValidationError(
                     f"Join right_on references non-existent columns: {missing_right}. "
                     f"Available columns: {right_schema}"
@@ -402,21 +571,27 @@ class Join(Operation):
     def to_dict(self) -> Dict[str, Any]:
         return {
             "type": "join",
-            "left_on": self.left_on if isinstance(self.left_on, list) else [self.left_on],
-            "right_on": self.right_on if isinstance(self.right_on, list) else [self.right_on],
+            "left_on": list(self.left_on),
+            "right_on": list(self.right_on),
             "join_type": self.join_type,
             "suffixes": self.suffixes,
             "inputs": [inp.to_dict() for inp in self.inputs],
         }
 
+    def __hash__(self) -> int:
+        # Consistent with the generated __eq__: equal joins share these fields.
+        return hash((Join, self.left_on, self.right_on, self.join_type, tuple(self.suffixes)))
+
 
-@dataclass
+@dataclass(slots=True)
 class GroupBy(Operation):
     """Partitioned aggregation.
 
     Aliases: ``input`` → ``inputs[0]``.
     """
 
+    kind: ClassVar[NodeKind] = NodeKind.GROUPBY
+
     keys: List[str] = field(default_factory=list)
     aggregations: List[Tuple[str, str, str]] = field(default_factory=list)
     sort_keys: Optional[List[Tuple[str, str]]] = None  # Optional sort pushed down
@@ -449,13 +624,15 @@ class GroupBy(Operation):
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Aggregate(Operation):
     """Global aggregation (GroupBy with empty keys).
 
     Aliases: ``input`` → ``inputs[0]``.
     """
 
+    kind: ClassVar[NodeKind] = NodeKind.AGGREGATE
+
     aggregations: List[Tuple[str, str, str]] = field(default_factory=list)
     input: Optional[Operation] = field(default=None, repr=False)
 
@@ -475,13 +652,15 @@ class Aggregate(Operation):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Sort(Operation):
     """Row reordering.
 
     Aliases: ``input`` → ``inputs[0]``.
     """
 
+    kind: ClassVar[NodeKind] = NodeKind.SORT
+
     keys: List[Tuple[str, str]] = field(default_factory=list)
     limit: Optional[int] = None
     predicate: Any = None
@@ -500,17 +679,24 @@ class Sort(Operation):
         if self.limit is not None and self.limit < 0:
             raise ValueError("Sort limit must be non-negative")
 
+        if not LAZY_VALIDATION:
+            self.validate()
+
+    def _validate_with_input_schemas(self, schemas, schema_sets) -> None:
         # Validate that sort columns exist in input schema
-        input_schema = self._get_input_schema()
+        input_schema = schemas[0]
         if input_schema is not None:
-            sort_columns = [col for col, _ in self.keys]
-            missing_columns = [col for col in sort_columns if col not in input_schema]
-            if missing_columns:
+            available = schema_sets[0]
+            if not available.issuperset(col for col, _ in self.keys):
+                missing_columns = [col for col, _ in self.keys if col not in available]
                 raise SchemaValidationError(
                     f"Sort references non-existent columns: {missing_columns}. "
                     f"Available columns: {input_schema}"
                 )
 
+    def _output_schema(self, schemas):
+        return schemas[0]
+
     def to_dict(self) -> Dict[str, Any]:
         result = {
             "type": "sort",
@@ -527,13 +713,15 @@ class Sort(Operation):
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Limit(Operation):
     """Row truncation.
 
     Aliases: ``input`` → ``inputs[0]``, ``n`` → ``count``.
     """
 
+    kind: ClassVar[NodeKind] = NodeKind.LIMIT
+
     count: int = 0
     end: str = "head"
     input: Optional[Operation] = field(default=None, repr=False)
@@ -552,6 +740,9 @@ class Limit(Operation):
         if self.end not in ("head", "tail"):
             raise ValueError(f"Limit end must be 'head' or 'tail', got: {self.end}")
 
+    def _output_schema(self, schemas):
+        return schemas[0]
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "type": "limit",
@@ -561,13 +752,15 @@ class Limit(Operation):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WithColumn(Operation):
     """Add or replace a column.
 
     Aliases: ``input`` → ``inputs[0]``, ``column_name`` → ``column``.
     """
 
+    kind: ClassVar[NodeKind] = NodeKind.WITH_COLUMN
+
     column: str = ""
     expression: Any = ""
     input: Optional[Operation] = field(default=None, repr=False)
@@ -586,18 +779,29 @@ class WithColumn(Operation):
         if not self.expression and self.expression != 0:
             raise ValueError("WithColumn operation must specify an expression")
 
+        if not LAZY_VALIDATION:
+            self.validate()
+
+    def _validate_with_input_schemas(self, schemas, schema_sets) -> None:
         # Validate that referenced columns exist in input schema
-        input_schema = self._get_input_schema()
+        input_schema = schemas[0]
         if input_schema is not None:
             referenced_columns = self._extract_column_names(self.expression)
             if referenced_columns:
-                missing_columns = [col for col in referenced_columns if col not in input_schema]
-                if missing_columns:
+                available = schema_sets[0]
+                if not available.issuperset(referenced_columns):
+                    missing_columns = [col for col in referenced_columns if col not in available]
                     raise SchemaValidationError(
                         f"WithColumn expression references non-existent columns: {missing_columns}. "
                         f"Available columns: {input_schema}"
                     )
 
+    def _output_schema(self, schemas):
+        input_schema = schemas[0]
+        if input_schema is None or self.column in input_schema:
+            return input_schema
+        return input_schema + [self.column]
+
     def to_dict(self) -> Dict[str, Any]:
         expr = self.expression
         if hasattr(expr, "to_dict"):
@@ -610,13 +814,15 @@ class WithColumn(Operation):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Union(Operation):
     """Vertical concatenation of two relations.
 
     Aliases: ``left`` / ``right`` → ``inputs[0]`` / ``inputs[1]``.
     """
 
+    kind: ClassVar[NodeKind] = NodeKind.UNION
+
     left: Optional[Operation] = field(default=None, repr=False)
     right: Optional[Operation] = field(default=None, repr=False)
 
@@ -627,20 +833,33 @@ class Union(Operation):
         if len(self.inputs) != 2:
             raise ValueError("Union operation must have exactly two inputs")
 
+        if not LAZY_VALIDATION:
+            self.validate()
+
+    def _validate_with_input_schemas(self, schemas, schema_sets) -> None:
         # Validate schema equality: S(R₁) = S(R₂)
-        left_schema, right_schema = self._get_input_schemas()
+        left_schema, right_schema = schemas
         if left_schema is not None and right_schema is not None:
-            if left_schema != right_schema:
+            # Unions of a source with itself share one schema list; skip the walk.
+            # frozenset caches its hash, so differing column sets are rejected
+            # without comparing the lists; equal hashes fall back to ==.
+            left_set, right_set = schema_sets
+            if left_schema is not right_schema and (
+                hash(left_set) != hash(right_set) or left_schema != right_schema
+            ):
                 raise SchemaValidationError(
                     f"Union requires identical schemas. "
                     f"Left schema: {left_schema}, Right schema: {right_schema}"
                 )
 
+    def _output_schema(self, schemas):
+        return schemas[0]
+
     def to_dict(self) -> Dict[str, Any]:
         return {"type": "union", "inputs": [inp.to_dict() for inp in self.inputs]}
 
 
-@dataclass
+@dataclass(slots=True)
 class Pivot(Operation):
     """Long-to-wide reshaping.
 
@@ -648,6 +867,8 @@ class Pivot(Operation):
     ``values_column`` → ``values``.
     """
 
+    kind: ClassVar[NodeKind] = NodeKind.PIVOT
+
     index: str | list[str] = ""
     columns: str = ""
     values: str = ""
@@ -688,13 +909,15 @@ class Pivot(Operation):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Melt(Operation):
     """Wide-to-long reshaping (unpivot).
 
     Aliases: ``input`` → ``inputs[0]``.
     """
 
+    kind: ClassVar[NodeKind] = NodeKind.MELT
+
     id_vars: List[str] = field(default_factory=list)
     value_vars: Optional[List[str]] = None
     var_name: str = "variable"
@@ -720,7 +943,7 @@ class Melt(Operation):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Window(Operation):
     """Windowed computation.
 
@@ -728,6 +951,8 @@ class Window(Operation):
     ``input_col`` → ``input_column``, ``output_col`` → ``output_column``.
     """
 
+    kind: ClassVar[NodeKind] = NodeKind.WINDOW
+
     function: str = ""
     input_column: Optional[str] = None
     output_column: str = ""
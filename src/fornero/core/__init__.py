@@ -4,7 +4,7 @@ Core module for fornero.
 This module provides the DataFrame subclass and operation tracing functionality.
 """
 
-from .dataframe import DataFrame, DataFrameGroupBy
+from .dataframe import LAZY_MODE, DataFrame, DataFrameGroupBy
 from . import tracer
 
-__all__ = ["DataFrame", "DataFrameGroupBy", "tracer"]
+__all__ = ["DataFrame", "DataFrameGroupBy", "LAZY_MODE", "tracer"]
@@ -9,16 +9,27 @@ Key features:
 - Dual-mode execution: operations execute eagerly in pandas AND record in the logical plan
 - Plan propagation: the _plan attribute survives pandas operations via _metadata
 - Translation API: to_spreadsheet_plan() converts the logical plan to spreadsheet operations
+- Plan-only mode: with LAZY_MODE set, tracked operations record the plan and skip pandas
 """
 
 import ast
 import inspect
 import re
 import textwrap
+from contextvars import ContextVar
 
 import pandas as pd
-from ..algebra import LogicalPlan, Source, Select, Filter, Sort, Limit, GroupBy, WithColumn, Join, Pivot
+from ..algebra import LogicalPlan, Select, Filter, Sort, Limit, GroupBy, WithColumn, Pivot
 from ..algebra.expressions import Column
+from .tracer import join_node, source_for
+
+LAZY_MODE: ContextVar[bool] = ContextVar("fornero_lazy_mode", default=False)
+"""When set, tracked operations build their plan node without running pandas.
+
+Results are empty DataFrames carrying the new plan, so this suits code that only
+inspects or translates plans. Set it per thread or task with ``LAZY_MODE.set(True)``
+and restore it with the returned token.
+"""
 
 
 def _extract_lambda_expression(func, kwarg_name=None):
@@ -86,6 +97,12 @@ class _TrackedSeries(pd.Series):
     def _constructor_expanddim(self):
         return lambda *a, **kw: DataFrame(*a, **kw)
 
+    def _constructor_from_mgr(self, mgr, axes):
+        # pandas' default wraps a plain Series in a second constructor call.
+        ser = _TrackedSeries._from_mgr(mgr, axes)
+        ser._name = None
+        return ser
+
     def __gt__(self, other):
         result = super().__gt__(other)
         result._predicate = Column(self.name) > other
@@ -150,9 +167,16 @@ class DataFrame(pd.DataFrame):
         >>> print(plan.explain())
     """
 
-    # Tell pandas to preserve _plan when creating new DataFrames
+    # Tell pandas to preserve _plan when creating new DataFrames. pandas'
+    # __finalize__ shares the reference (slices, copies and deepcopies all point
+    # at the same LogicalPlan), which is safe because plans are never modified
+    # in place: every tracked method attaches a new LogicalPlan instead.
     _metadata = ['_plan']
 
+    # Every constructor path sets _plan, so a slot makes it always present and
+    # reads skip pandas' column-lookup __getattr__.
+    __slots__ = ('_plan',)
+
     @property
     def _constructor(self):
         """Return constructor for creating new instances of this class."""
@@ -163,6 +187,24 @@ class DataFrame(pd.DataFrame):
         """Return _TrackedSeries so column access captures comparison predicates."""
         return _TrackedSeries
 
+    def _constructor_from_mgr(self, mgr, axes):
+        """Build a result frame directly from a block manager.
+
+        pandas' default builds a plain DataFrame and passes it through
+        ``__init__`` again, which runs the full constructor twice for every
+        intermediate result. The fresh Source plan ``__init__`` would attach is
+        set directly instead; tracked methods replace it with their own plan.
+        """
+        result = DataFrame._from_mgr(mgr, axes)
+        schema = list(result.columns) if len(result.columns) > 0 else None
+        result._plan = LogicalPlan(source_for("<dataframe>", schema))
+        return result
+
+    def _constructor_sliced_from_mgr(self, mgr, axes):
+        ser = _TrackedSeries._from_mgr(mgr, axes)
+        ser._name = None
+        return ser
+
     def __init__(self, data=None, plan=None, source_id=None, **kwargs):
         """Initialize a fornero DataFrame.
 
@@ -172,26 +214,28 @@ class DataFrame(pd.DataFrame):
             source_id: Optional source identifier for the Source node
             **kwargs: Additional arguments passed to pandas DataFrame
         """
-        # If data is a pandas DataFrame, extract its values
-        if isinstance(data, pd.DataFrame) and not isinstance(data, DataFrame):
-            # This handles the case of DataFrame(pd_df)
-            super().__init__(data, **kwargs)
+        super().__init__(data, **kwargs)
+
+        # Read a preserved plan from the slot, or from the instance dict of a
+        # tracked Series: hasattr() on a plain pandas object falls through to
+        # its column-lookup __getattr__.
+        if isinstance(data, DataFrame):
+            inherited = data._plan
         else:
-            super().__init__(data, **kwargs)
+            inherited = getattr(data, '__dict__', {}).get('_plan')
 
         # Attach or create a logical plan
         if plan is not None:
             self._plan = plan
-        elif hasattr(data, '_plan'):
+        elif inherited is not None:
             # Preserve plan from another fornero DataFrame
-            self._plan = data._plan
+            self._plan = inherited
         else:
             # Create a new plan with a Source node
             if source_id is None:
                 source_id = "<dataframe>"
             schema = list(self.columns) if len(self.columns) > 0 else None
-            source = Source(source_id=source_id, schema=schema)
-            self._plan = LogicalPlan(source)
+            self._plan = LogicalPlan(source_for(source_id, schema))
 
     def to_spreadsheet_plan(self):
         """Convert the logical plan to a spreadsheet execution plan.
@@ -212,6 +256,10 @@ class DataFrame(pd.DataFrame):
         translator = Translator()
         return translator.translate(self._plan)
 
+    def _plan_only(self, plan, columns=None):
+        """Return an empty frame with *columns* (default: ours) carrying *plan*."""
+        return DataFrame(columns=self.columns if columns is None else columns, plan=plan)
+
     def filter(self, condition):
         """Filter rows based on a condition (tracked operation).
 
@@ -229,7 +277,7 @@ class DataFrame(pd.DataFrame):
             predicate_str = f"{condition.name} filter" if hasattr(condition, "name") else "boolean filter"
 
         # Create new plan with Filter operation
-        filter_op = Filter(predicate=predicate_str, inputs=[self._plan.root])
+        filter_op = Filter.unary(self._plan.root, predicate=predicate_str)
         new_plan = LogicalPlan(filter_op)
 
         # Attach the new plan
@@ -245,6 +293,15 @@ class DataFrame(pd.DataFrame):
         Returns:
             New DataFrame or Series with updated plan if applicable
         """
+        if LAZY_MODE.get():
+            if isinstance(key, list):
+                return self._plan_only(LogicalPlan(Select.unary(self._plan.root, columns=key)), key)
+            if getattr(key, 'dtype', None) == bool:
+                predicate_str = getattr(key, "_predicate", None)
+                if not predicate_str:
+                    predicate_str = f"{key.name} filter" if hasattr(key, "name") else "boolean filter"
+                return self._plan_only(LogicalPlan(Filter.unary(self._plan.root, predicate=predicate_str)))
+
         result = super().__getitem__(key)
 
         # If result is a DataFrame (column selection), track as Select
@@ -255,22 +312,21 @@ class DataFrame(pd.DataFrame):
 
             # If key is a list of columns, track as Select
             if isinstance(key, list):
-                select_op = Select(columns=key, inputs=[self._plan.root])
+                select_op = Select.unary(self._plan.root, columns=key)
                 result._plan = LogicalPlan(select_op)
             # If key is a boolean mask, track as Filter
             elif hasattr(key, 'dtype') and key.dtype == bool:
                 predicate_str = getattr(key, "_predicate", None)
                 if not predicate_str:
                     predicate_str = f"{key.name} filter" if hasattr(key, "name") else "boolean filter"
-                filter_op = Filter(predicate=predicate_str, inputs=[self._plan.root])
+                filter_op = Filter.unary(self._plan.root, predicate=predicate_str)
                 result._plan = LogicalPlan(filter_op)
             else:
                 # For single column (returns Series), preserve plan
                 result._plan = self._plan
         elif isinstance(result, pd.Series):
             # Preserve plan on Series (for chaining)
-            if hasattr(self, '_plan'):
-                result._plan = self._plan
+            result._plan = self._plan
 
         return result
 
@@ -285,21 +341,20 @@ class DataFrame(pd.DataFrame):
         Returns:
             New DataFrame with sorted rows and updated plan
         """
-        # Execute the sort in pandas
-        result = super().sort_values(by=by, ascending=ascending, **kwargs)
-
         # Build sort keys list
-        if isinstance(by, str):
-            by = [by]
-        if isinstance(ascending, bool):
-            ascending = [ascending] * len(by)
+        keys_by = [by] if isinstance(by, str) else by
+        directions = [ascending] * len(keys_by) if isinstance(ascending, bool) else ascending
 
-        keys = [(col, "asc" if asc else "desc") for col, asc in zip(by, ascending)]
+        keys = [(col, "asc" if asc else "desc") for col, asc in zip(keys_by, directions)]
 
         # Create new plan with Sort operation
-        sort_op = Sort(keys=keys, inputs=[self._plan.root])
+        sort_op = Sort.unary(self._plan.root, keys=keys)
         new_plan = LogicalPlan(sort_op)
+        if LAZY_MODE.get():
+            return self._plan_only(new_plan)
 
+        # Execute the sort in pandas
+        result = super().sort_values(by=by, ascending=ascending, **kwargs)
         result._plan = new_plan
         return result
 
@@ -312,13 +367,14 @@ class DataFrame(pd.DataFrame):
         Returns:
             New DataFrame with limited rows and updated plan
         """
-        # Execute the head in pandas
-        result = super().head(n)
-
         # Create new plan with Limit operation
-        limit_op = Limit(count=n, end="head", inputs=[self._plan.root])
+        limit_op = Limit.unary(self._plan.root, count=n, end="head")
         new_plan = LogicalPlan(limit_op)
+        if LAZY_MODE.get():
+            return self._plan_only(new_plan)
 
+        # Execute the head in pandas
+        result = super().head(n)
         result._plan = new_plan
         return result
 
@@ -331,13 +387,14 @@ class DataFrame(pd.DataFrame):
         Returns:
             New DataFrame with limited rows and updated plan
         """
-        # Execute the tail in pandas
-        result = super().tail(n)
-
         # Create new plan with Limit operation
-        limit_op = Limit(count=n, end="tail", inputs=[self._plan.root])
+        limit_op = Limit.unary(self._plan.root, count=n, end="tail")
         new_plan = LogicalPlan(limit_op)
+        if LAZY_MODE.get():
+            return self._plan_only(new_plan)
 
+        # Execute the tail in pandas
+        result = super().tail(n)
         result._plan = new_plan
         return result
 
@@ -363,9 +420,6 @@ class DataFrame(pd.DataFrame):
         Returns:
             New DataFrame with added/modified columns and updated plan
         """
-        # Execute the assign in pandas
-        result = super().assign(**kwargs)
-
         current_root = self._plan.root
         for col_name, value in kwargs.items():
             if callable(value):
@@ -373,10 +427,16 @@ class DataFrame(pd.DataFrame):
             else:
                 expr_str = str(value)
 
-            with_col_op = WithColumn(column=col_name, expression=expr_str, inputs=[current_root])
+            with_col_op = WithColumn.unary(current_root, column=col_name, expression=expr_str)
             current_root = with_col_op
 
         new_plan = LogicalPlan(current_root)
+        if LAZY_MODE.get():
+            columns = list(self.columns) + [name for name in kwargs if name not in self.columns]
+            return self._plan_only(new_plan, columns)
+
+        # Execute the assign in pandas
+        result = super().assign(**kwargs)
         result._plan = new_plan
         return result
 
@@ -412,16 +472,10 @@ class DataFrame(pd.DataFrame):
         else:
             # If right is a regular pandas DataFrame, create a Source node
             schema = list(right.columns)
-            right_plan = Source(source_id="<right_dataframe>", schema=schema)
+            right_plan = source_for("<right_dataframe>", schema)
 
         # Create new plan with Join operation
-        join_op = Join(
-            left_on=left_key,
-            right_on=right_key,
-            join_type=how,
-            suffixes=suffixes,
-            inputs=[self._plan.root, right_plan]
-        )
+        join_op = join_node(self._plan.root, right_plan, left_key, right_key, how, suffixes)
         new_plan = LogicalPlan(join_op)
 
         result._plan = new_plan
@@ -460,12 +514,12 @@ class DataFrame(pd.DataFrame):
         if isinstance(index, str):
             index = [index]
 
-        pivot_op = Pivot(
+        pivot_op = Pivot.unary(
+            self._plan.root,
             index=index,
             columns=columns,
             values=values,
             aggfunc=aggfunc if isinstance(aggfunc, str) else 'first',
-            inputs=[self._plan.root],
         )
         result._plan = LogicalPlan(pivot_op)
         return result
@@ -531,7 +585,7 @@ class DataFrameGroupBy:
                 aggregations.append((cols[0], "first", cols[0]))
 
         # Create new plan with GroupBy operation
-        groupby_op = GroupBy(keys=self._by, aggregations=aggregations, inputs=[self._df._plan.root])
+        groupby_op = GroupBy.unary(self._df._plan.root, keys=self._by, aggregations=aggregations)
         new_plan = LogicalPlan(groupby_op)
 
         result._plan = new_plan
@@ -11,6 +11,11 @@ while simultaneously recording their intent in the logical plan.
 
 from __future__ import annotations
 
+import functools
+import weakref
+from collections import OrderedDict
+from typing import Any, Optional
+
 from ..algebra import (
     LogicalPlan,
     Source,
@@ -26,6 +31,95 @@ from ..algebra import (
 )
 
 
+@functools.lru_cache(maxsize=1024)
+def _interned_source(source_id: str, schema: Optional[tuple]) -> Source:
+    return Source(source_id=source_id, schema=list(schema) if schema is not None else None)
+
+
+def source_for(source_id: str, schema) -> Source:
+    """Return the shared data-less Source node for *source_id* and *schema*.
+
+    Frames without attached data are identified only by ``source_id`` and
+    column names, so equal pairs can share one node instead of allocating
+    one per constructor call. Plans treat nodes as immutable, which makes
+    the sharing safe.
+
+    Args:
+        source_id: Source identifier
+        schema: Column names, or None for an empty frame
+
+    Returns:
+        The shared Source node
+    """
+    return _interned_source(source_id, tuple(schema) if schema is not None else None)
+
+
+_BINARY_NODE_CACHE_SIZE = 1024
+_binary_node_cache: "OrderedDict[tuple, weakref.ref]" = OrderedDict()
+
+
+def _as_key(value: Any) -> Any:
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _cached_binary_node(key: tuple, left, right, build):
+    """Return the node cached for *key* over *left*/*right*, building it on a miss.
+
+    Entries hold the built node weakly, so the cache keeps no plan (or data
+    attached to it) alive. A live node holds its inputs, so while it is cached
+    the ids in its key cannot be reused by other nodes.
+    """
+    try:
+        entry = _binary_node_cache.get(key)
+    except TypeError:  # unhashable parameters: build without caching
+        return build()
+    node = entry() if entry is not None else None
+    if node is not None and node.inputs[0] is left and node.inputs[1] is right:
+        _binary_node_cache.move_to_end(key)
+        return node
+    node = build()
+    _binary_node_cache[key] = weakref.ref(node)
+    if len(_binary_node_cache) > _BINARY_NODE_CACHE_SIZE:
+        _binary_node_cache.popitem(last=False)
+    return node
+
+
+def join_node(left, right, left_on, right_on, join_type, suffixes) -> Join:
+    """Return the Join node over *left* and *right*, reusing an identical one.
+
+    Nodes are immutable, so merging the same two plan roots with the same
+    parameters again returns the previously built node.
+
+    Args:
+        left: Left input operation
+        right: Right input operation
+        left_on: Left join key(s)
+        right_on: Right join key(s)
+        join_type: Join type
+        suffixes: Suffixes for overlapping columns
+
+    Returns:
+        Join node
+    """
+    key = (
+        "join", id(left), id(right),
+        _as_key(left_on), _as_key(right_on), join_type, _as_key(suffixes),
+    )
+    return _cached_binary_node(key, left, right, lambda: Join(
+        left_on=left_on,
+        right_on=right_on,
+        join_type=join_type,
+        suffixes=suffixes,
+        inputs=(left, right),
+    ))
+
+
+def union_node(top, bottom) -> Union:
+    """Return the Union node stacking *top* over *bottom*, reusing an identical one."""
+    key = ("union", id(top), id(bottom))
+    return _cached_binary_node(key, top, bottom, lambda: Union(inputs=(top, bottom)))
+
+
 def trace_filter(df, condition, predicate=None) -> LogicalPlan:
     """Trace a filter operation.
 
@@ -45,7 +139,7 @@ def trace_filter(df, condition, predicate=None) -> LogicalPlan:
                 "Use df[df['col'] > value] syntax to create trackable predicates."
             )
 
-    filter_op = Filter(predicate=predicate, inputs=[df._plan.root])
+    filter_op = Filter.unary(df._plan.root, predicate=predicate)
     return LogicalPlan(filter_op)
 
 
@@ -59,7 +153,7 @@ def trace_select(df, columns: list[str]) -> LogicalPlan:
     Returns:
         New LogicalPlan with Select node
     """
-    select_op = Select(columns=columns, inputs=[df._plan.root])
+    select_op = Select.unary(df._plan.root, columns=columns)
     return LogicalPlan(select_op)
 
 
@@ -83,7 +177,7 @@ def trace_sort(df, by: str | list[str], ascending: bool | list[bool] = True) ->
     # Build sort keys
     keys = [(col, "asc" if asc else "desc") for col, asc in zip(by, ascending)]
 
-    sort_op = Sort(keys=keys, inputs=[df._plan.root])
+    sort_op = Sort.unary(df._plan.root, keys=keys)
     return LogicalPlan(sort_op)
 
 
@@ -98,7 +192,7 @@ def trace_limit(df, count: int, end: str = "head") -> LogicalPlan:
     Returns:
         New LogicalPlan with Limit node
     """
-    limit_op = Limit(count=count, end=end, inputs=[df._plan.root])
+    limit_op = Limit.unary(df._plan.root, count=count, end=end)
     return LogicalPlan(limit_op)
 
 
@@ -121,7 +215,7 @@ def trace_groupby(
     if isinstance(keys, str):
         keys = [keys]
 
-    groupby_op = GroupBy(keys=keys, aggregations=aggregations, inputs=[df._plan.root])
+    groupby_op = GroupBy.unary(df._plan.root, keys=keys, aggregations=aggregations)
     return LogicalPlan(groupby_op)
 
 
@@ -135,7 +229,7 @@ def trace_aggregate(df, aggregations: list[tuple]) -> LogicalPlan:
     Returns:
         New LogicalPlan with Aggregate node
     """
-    agg_op = Aggregate(aggregations=aggregations, inputs=[df._plan.root])
+    agg_op = Aggregate.unary(df._plan.root, aggregations=aggregations)
     return LogicalPlan(agg_op)
 
 
@@ -150,7 +244,7 @@ def trace_with_column(df, column: str, expression: str) -> LogicalPlan:
     Returns:
         New LogicalPlan with WithColumn node
     """
-    with_col_op = WithColumn(column=column, expression=expression, inputs=[df._plan.root])
+    with_col_op = WithColumn.unary(df._plan.root, column=column, expression=expression)
     return LogicalPlan(with_col_op)
 
 
@@ -181,15 +275,9 @@ def trace_join(
     else:
         # Create a Source node for regular pandas DataFrame
         schema = list(right_df.columns) if hasattr(right_df, 'columns') else None
-        right_root = Source(source_id="<right_dataframe>", schema=schema)
+        right_root = source_for("<right_dataframe>", schema)
 
-    join_op = Join(
-        left_on=left_on,
-        right_on=right_on,
-        join_type=join_type,
-        suffixes=suffixes,
-        inputs=[left_df._plan.root, right_root]
-    )
+    join_op = join_node(left_df._plan.root, right_root, left_on, right_on, join_type, suffixes)
     return LogicalPlan(join_op)
 
 
@@ -209,7 +297,7 @@ def trace_union(df1, df2) -> LogicalPlan:
     else:
         # Create a Source node for regular pandas DataFrame
         schema = list(df2.columns) if hasattr(df2, 'columns') else None
-        df2_root = Source(source_id="<dataframe>", schema=schema)
+        df2_root = source_for("<dataframe>", schema)
 
-    union_op = Union(inputs=[df1._plan.root, df2_root])
+    union_op = union_node(df1._plan.root, df2_root)
     return LogicalPlan(union_op)
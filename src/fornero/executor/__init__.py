@@ -4,13 +4,29 @@ Executor module for fornero.
 This module provides executor backends for materialising spreadsheet plans.
 ``SheetsExecutor`` targets the Google Sheets API; ``LocalExecutor`` evaluates
 formulas in-process via formualizer (no network required).
+
+The backends are imported on first attribute access so that importing
+``fornero`` (or just the plan types) does not load gspread or formualizer.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from fornero.executor.base import Executor
-from fornero.executor.local_executor import LocalExecutor
 from fornero.executor.plan import ExecutionPlan, ExecutionStep, StepType
-from fornero.executor.sheets_client import SheetsClient
-from fornero.executor.sheets_executor import SheetsExecutor
+
+if TYPE_CHECKING:
+    from fornero.executor.local_executor import LocalExecutor
+    from fornero.executor.sheets_client import SheetsClient
+    from fornero.executor.sheets_executor import SheetsExecutor
+
+_LAZY_BACKENDS = {
+    "LocalExecutor": "fornero.executor.local_executor",
+    "SheetsClient": "fornero.executor.sheets_client",
+    "SheetsExecutor": "fornero.executor.sheets_executor",
+}
 
 __all__ = [
     "Executor",
@@ -21,3 +37,12 @@ __all__ = [
     "ExecutionStep",
     "StepType",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_BACKENDS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -27,6 +27,11 @@ from fornero.spreadsheet.operations import (
 )
 
 
+# Google Sheets limits
+MAX_CELLS = 10_000_000  # 10 million cells per spreadsheet
+MAX_FORMULA_CELLS = 5_000_000  # ~5 million formula cells (conservative estimate)
+
+
 class StepType(Enum):
     """Type of execution step, defining the fixed execution order."""
     CREATE_SHEETS = "create_sheets"
@@ -99,7 +104,8 @@ class ExecutionPlan:
         """Construct an execution plan from a flat list of operations.
 
         This method:
-        1. Validates the operation list (no duplicate sheet names, valid references)
+        1. Validates the operation list (no duplicate sheet names, valid references,
+           dataset size within Google Sheets limits)
         2. Partitions operations by type
         3. Topologically sorts formulas by their dependencies
         4. Assembles the execution steps in order
@@ -112,7 +118,7 @@ class ExecutionPlan:
             ExecutionPlan ready for execution
 
         Raises:
-            PlanValidationError: If the operation list is invalid
+            PlanValidationError: If the operation list is invalid or the dataset is too large
         """
         if not ops:
             # Empty operation list produces an empty plan
@@ -172,6 +178,9 @@ class ExecutionPlan:
                     f"NamedRange references non-existent sheet: {op.sheet}"
                 )
 
+        # Validate: fail fast on datasets Google Sheets cannot hold
+        _check_size(create_ops, value_ops, formula_ops)
+
         # Build execution steps
         steps: List[ExecutionStep] = []
 
@@ -217,6 +226,22 @@ class ExecutionPlan:
 
         return cls(steps=steps, main_sheet=main_sheet)
 
+    def validate_size(self) -> None:
+        """Validate that the plan fits within Google Sheets limits.
+
+        ``from_operations`` already runs this check; it is exposed for plans built
+        by other means, such as ``from_dict``.
+
+        Raises:
+            PlanValidationError: If the dataset is too large
+        """
+        ops = [op for step in self.steps for op in step.operations]
+        _check_size(
+            [op for op in ops if isinstance(op, CreateSheet)],
+            [op for op in ops if isinstance(op, SetValues)],
+            [op for op in ops if isinstance(op, SetFormula)],
+        )
+
     def explain(self) -> str:
         """Generate a human-readable summary of the execution plan.
 
@@ -305,6 +330,37 @@ class ExecutionPlan:
         )
 
 
+def _check_size(
+    create_ops: List[CreateSheet],
+    value_ops: List[SetValues],
+    formula_ops: List[SetFormula],
+) -> None:
+    """Raise PlanValidationError if the operations exceed Google Sheets limits.
+
+    Args:
+        create_ops: CreateSheet operations, counted by their full grid
+        value_ops: SetValues operations, counted by the cells they write
+        formula_ops: SetFormula operations, one formula cell each
+
+    Raises:
+        PlanValidationError: If dataset is too large
+    """
+    total_cells = sum(op.rows * op.cols for op in create_ops)
+    total_cells += sum(len(op.values) * len(op.values[0]) for op in value_ops if op.values)
+
+    if total_cells > MAX_CELLS:
+        raise PlanValidationError(
+            f"Dataset too large for Google Sheets: {total_cells:,} cells "
+            f"(limit: {MAX_CELLS:,}). Please reduce the data size."
+        )
+
+    if len(formula_ops) > MAX_FORMULA_CELLS:
+        raise PlanValidationError(
+            f"Too many formulas for Google Sheets: {len(formula_ops):,} "
+            f"(limit: ~{MAX_FORMULA_CELLS:,}). Please reduce the complexity."
+        )
+
+
 def _topological_sort_formulas(
     formula_ops: List[SetFormula],
     available_sheets: Set[str]
@@ -16,7 +16,13 @@ import gspread
 from gspread.exceptions import APIError
 
 from fornero.exceptions import PlanValidationError, SheetsAPIError
-from fornero.executor.plan import ExecutionPlan, ExecutionStep, StepType
+from fornero.executor.plan import (  # noqa: F401 - limits re-exported
+    MAX_CELLS,
+    MAX_FORMULA_CELLS,
+    ExecutionPlan,
+    ExecutionStep,
+    StepType,
+)
 from fornero.executor.sheets_client import SheetsClient
 from fornero.spreadsheet.operations import (
     CreateSheet,
@@ -26,11 +32,6 @@ from fornero.spreadsheet.operations import (
 )
 
 
-# Google Sheets limits
-MAX_CELLS = 10_000_000  # 10 million cells per spreadsheet
-MAX_FORMULA_CELLS = 5_000_000  # ~5 million formula cells (conservative estimate)
-
-
 class SheetsExecutor:
     """Executes execution plans against Google Sheets API.
 
@@ -82,7 +83,7 @@ class SheetsExecutor:
             SheetsAPIError: If API calls fail after retries
         """
         # Validate plan before execution
-        self._validate_plan_size(plan)
+        plan.validate_size()
 
         # Create the spreadsheet
         spreadsheet = self._retry_operation(
@@ -118,48 +119,6 @@ class SheetsExecutor:
 
         return spreadsheet
 
-    def _validate_plan_size(self, plan: ExecutionPlan) -> None:
-        """Validate that the plan fits within Google Sheets limits.
-
-        Args:
-            plan: The execution plan to validate
-
-        Raises:
-            PlanValidationError: If dataset is too large
-        """
-        total_cells = 0
-        total_formula_cells = 0
-
-        for step in plan.steps:
-            if step.step_type == StepType.CREATE_SHEETS:
-                for op in step.operations:
-                    if isinstance(op, CreateSheet):
-                        total_cells += op.rows * op.cols
-
-            elif step.step_type == StepType.WRITE_SOURCE_DATA:
-                for op in step.operations:
-                    if isinstance(op, SetValues):
-                        num_rows = len(op.values)
-                        num_cols = len(op.values[0]) if op.values else 0
-                        total_cells += num_rows * num_cols
-
-            elif step.step_type == StepType.WRITE_FORMULAS:
-                for op in step.operations:
-                    if isinstance(op, SetFormula):
-                        total_formula_cells += 1
-
-        if total_cells > MAX_CELLS:
-            raise PlanValidationError(
-                f"Dataset too large for Google Sheets: {total_cells:,} cells "
-                f"(limit: {MAX_CELLS:,}). Please reduce the data size."
-            )
-
-        if total_formula_cells > MAX_FORMULA_CELLS:
-            raise PlanValidationError(
-                f"Too many formulas for Google Sheets: {total_formula_cells:,} "
-                f"(limit: ~{MAX_FORMULA_CELLS:,}). Please reduce the complexity."
-            )
-
     def _execute_create_sheets(
         self,
         spreadsheet: gspread.Spreadsheet,
@@ -168,48 +127,68 @@ class SheetsExecutor:
     ) -> None:
         """Execute CreateSheet operations.
 
+        All sheets are created in a single ``spreadsheets.batchUpdate`` call: the
+        default sheet created with the spreadsheet is renamed and resized for the
+        first CreateSheet, and an ``addSheet`` request is issued for each of the rest.
+
         Args:
             spreadsheet: The target spreadsheet
             step: Execution step containing CreateSheet operations
             worksheets: Dictionary to populate with created worksheets
         """
-        # Get the default sheet created with the spreadsheet
-        default_sheet = spreadsheet.sheet1
-
-        for i, op in enumerate(step.operations):
-            if not isinstance(op, CreateSheet):
-                continue
+        ops = [op for op in step.operations if isinstance(op, CreateSheet)]
+        if not ops:
+            return
+
+        # Reuse the default sheet created with the spreadsheet for the first sheet
+        default_sheet = self._retry_operation(
+            lambda: spreadsheet.sheet1,
+            "get default sheet"
+        )
+        first, rest = ops[0], ops[1:]
+
+        requests: List[Dict[str, Any]] = [
+            {
+                "updateSheetProperties": {
+                    "properties": {
+                        "sheetId": default_sheet.id,
+                        "title": first.name,
+                        "gridProperties": {"rowCount": first.rows, "columnCount": first.cols},
+                    },
+                    "fields": "title,gridProperties(rowCount,columnCount)",
+                }
+            }
+        ]
+        for op in rest:
+            requests.append({
+                "addSheet": {
+                    "properties": {
+                        "title": op.name,
+                        "gridProperties": {"rowCount": op.rows, "columnCount": op.cols},
+                    }
+                }
+            })
 
-            if i == 0:
-                # Reuse the default sheet for the first CreateSheet operation
-                worksheet = self._retry_operation(
-                    lambda: spreadsheet.sheet1,
-                    f"get default sheet"
-                )
-                # Rename it
-                self._retry_operation(
-                    lambda: worksheet.update_title(op.name),
-                    f"rename default sheet to '{op.name}'"
-                )
-                # Resize if needed
-                if worksheet.row_count != op.rows or worksheet.col_count != op.cols:
-                    self._retry_operation(
-                        lambda: worksheet.resize(rows=op.rows, cols=op.cols),
-                        f"resize sheet '{op.name}'"
-                    )
-            else:
-                # Create a new sheet
-                worksheet = self._retry_operation(
-                    lambda: self.client.add_sheet(
-                        spreadsheet,
-                        op.name,
-                        rows=op.rows,
-                        cols=op.cols
-                    ),
-                    f"create sheet '{op.name}'"
-                )
+        response = self._retry_operation(
+            lambda: spreadsheet.batch_update({"requests": requests}),
+            f"create {len(ops)} sheet(s)"
+        )
 
-            worksheets[op.name] = worksheet
+        # The worksheet keeps a local copy of its properties and builds every A1
+        # range from its title, so record the rename and resize as gspread does
+        default_sheet._properties["title"] = first.name
+        default_sheet._properties.setdefault("gridProperties", {}).update(
+            rowCount=first.rows, columnCount=first.cols
+        )
+        worksheets[first.name] = default_sheet
+        # Replies are positional; the first one belongs to the default sheet update
+        for op, reply in zip(rest, response["replies"][1:]):
+            worksheets[op.name] = gspread.Worksheet(
+                spreadsheet,
+                reply["addSheet"]["properties"],
+                spreadsheet.id,
+                spreadsheet.client,
+            )
 
     def _execute_write_source_data(
         self,
@@ -267,7 +246,7 @@ class SheetsExecutor:
             if batch_updates:
                 self._retry_operation(
                     lambda: self.client.batch_update_values(worksheet, batch_updates),
-                    f"batch update {len(batch_updates)} value ranges to {worksheet.title}"
+                    f"batch update {len(batch_updates)} value ranges to {sheet_name}"
                 )
 
     def _execute_write_formulas(
@@ -322,7 +301,7 @@ class SheetsExecutor:
             if batch_updates:
                 self._retry_operation(
                     lambda: self.client.batch_update_formulas(worksheet, batch_updates),
-                    f"batch update {len(batch_updates)} formulas to {worksheet.title}"
+                    f"batch update {len(batch_updates)} formulas to {sheet_name}"
                 )
 
     def _execute_register_named_ranges(
@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from typing import Dict, List, Any, Optional
 from fornero.algebra.operations import (
     Operation, Source, Select, Filter, Join, GroupBy, Aggregate,
-    Sort, Limit, WithColumn, Union, Pivot, Melt, Window
+    Sort, Limit, WithColumn, Union, Pivot, Melt, Window, NodeKind
 )
 from fornero.algebra.logical_plan import LogicalPlan
 from fornero.spreadsheet.model import Range
@@ -18,7 +18,6 @@ from fornero.spreadsheet.operations import (
 )
 from fornero.exceptions import UnsupportedOperationError, PlanValidationError
 from fornero.translator import strategies
-from fornero.translator.optimizer import Optimizer
 
 
 _DICT_TO_OP = {
@@ -83,6 +82,8 @@ class Translator:
         Raises:
             UnsupportedOperationError: If plan contains untranslatable operations
             PlanValidationError: If plan structure is invalid
+            SchemaValidationError: If a node whose validation was deferred references
+                columns its inputs lack
         """
         self.operations = []
         self.materialized = {}
@@ -91,11 +92,12 @@ class Translator:
         if source_data is None:
             source_data = {}
 
+        # Nodes already validated at construction are skipped; this only does
+        # work for nodes deferred with FORNERO_LAZY_VALIDATION.
+        plan.validate()
+
         # Optimize the plan before translation if requested
-        working_plan = plan
-        if optimize:
-            optimizer = Optimizer()
-            working_plan = optimizer.optimize(plan)
+        working_plan = plan.optimized() if optimize else plan
 
         self._translate_operation(working_plan.root, source_data)
 
@@ -126,65 +128,66 @@ class Translator:
             input_results.append(self._translate_operation(input_op, source_data))
 
         # Translate based on operation type
-        if isinstance(op, Source):
+        kind = op.kind
+        if kind is NodeKind.SOURCE:
             result = self._translate_source(op, source_data)
 
-        elif isinstance(op, Select):
+        elif kind is NodeKind.SELECT:
             if len(input_results) != 1:
                 raise PlanValidationError("Select operation must have exactly one input")
             result = self._translate_select(op, input_results[0])
 
-        elif isinstance(op, Filter):
+        elif kind is NodeKind.FILTER:
             if len(input_results) != 1:
                 raise PlanValidationError("Filter operation must have exactly one input")
             result = self._translate_filter(op, input_results[0])
 
-        elif isinstance(op, Join):
+        elif kind is NodeKind.JOIN:
             if len(input_results) != 2:
                 raise PlanValidationError("Join operation must have exactly two inputs")
             result = self._translate_join(op, input_results[0], input_results[1])
 
-        elif isinstance(op, GroupBy):
+        elif kind is NodeKind.GROUPBY:
             if len(input_results) != 1:
                 raise PlanValidationError("GroupBy operation must have exactly one input")
             result = self._translate_groupby(op, input_results[0])
 
-        elif isinstance(op, Aggregate):
+        elif kind is NodeKind.AGGREGATE:
             if len(input_results) != 1:
                 raise PlanValidationError("Aggregate operation must have exactly one input")
             result = self._translate_aggregate(op, input_results[0])
 
-        elif isinstance(op, Sort):
+        elif kind is NodeKind.SORT:
             if len(input_results) != 1:
                 raise PlanValidationError("Sort operation must have exactly one input")
             result = self._translate_sort(op, input_results[0])
 
-        elif isinstance(op, Limit):
+        elif kind is NodeKind.LIMIT:
             if len(input_results) != 1:
                 raise PlanValidationError("Limit operation must have exactly one input")
             result = self._translate_limit(op, input_results[0])
 
-        elif isinstance(op, WithColumn):
+        elif kind is NodeKind.WITH_COLUMN:
             if len(input_results) != 1:
                 raise PlanValidationError("WithColumn operation must have exactly one input")
             result = self._translate_with_column(op, input_results[0])
 
-        elif isinstance(op, Union):
+        elif kind is NodeKind.UNION:
             if len(input_results) != 2:
                 raise PlanValidationError("Union operation must have exactly two inputs")
             result = self._translate_union(op, input_results[0], input_results[1])
 
-        elif isinstance(op, Pivot):
+        elif kind is NodeKind.PIVOT:
             if len(input_results) != 1:
                 raise PlanValidationError("Pivot operation must have exactly one input")
             result = self._translate_pivot(op, input_results[0], source_data)
 
-        elif isinstance(op, Melt):
+        elif kind is NodeKind.MELT:
             if len(input_results) != 1:
                 raise PlanValidationError("Melt operation must have exactly one input")
             result = self._translate_melt(op, input_results[0])
 
-        elif isinstance(op, Window):
+        elif kind is NodeKind.WINDOW:
             if len(input_results) != 1:
                 raise PlanValidationError("Window operation must have exactly one input")
             result = self._translate_window(op, input_results[0])
@@ -242,7 +245,7 @@ class Translator:
 
         self.operations.extend(result.operations)
 
-        right_keys = set(op.right_on) if isinstance(op.right_on, list) else {op.right_on}
+        right_keys = set(op.right_on)
         output_schema = left_ctx.schema.copy()
         for col in right_ctx.schema:
             if col not in right_keys:
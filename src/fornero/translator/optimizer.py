@@ -61,7 +61,7 @@ class Optimizer:
         - Sort(Filter(...)) -> Sort(..., predicate=p)
         """
         # Recursively optimize inputs first
-        optimized_inputs = [self._fuse_operations(inp) for inp in op.inputs]
+        optimized_inputs = tuple(self._fuse_operations(inp) for inp in op.inputs)
 
         # 1. Limit(Sort) fusion
         if isinstance(op, Limit):
@@ -118,7 +118,7 @@ class Optimizer:
             Optimized operation
         """
         # Recursively optimize inputs first
-        optimized_inputs = [self._predicate_pushdown(inp) for inp in op.inputs]
+        optimized_inputs = tuple(self._predicate_pushdown(inp) for inp in op.inputs)
 
         # If this is a Filter, try to push it down
         if isinstance(op, Filter):
@@ -159,7 +159,7 @@ class Optimizer:
             Optimized operation
         """
         # Recursively optimize inputs first
-        optimized_inputs = [self._projection_pushdown(inp) for inp in op.inputs]
+        optimized_inputs = tuple(self._projection_pushdown(inp) for inp in op.inputs)
 
         # If this is a Select followed by another Select, merge them
         if isinstance(op, Select):
@@ -193,7 +193,7 @@ class Optimizer:
             Optimized operation
         """
         # Recursively optimize inputs first
-        optimized_inputs = [self._simplify_operations(inp) for inp in op.inputs]
+        optimized_inputs = tuple(self._simplify_operations(inp) for inp in op.inputs)
 
         # Detect identity Select: if selecting all columns in order, just pass through
         if isinstance(op, Select):
@@ -7,6 +7,8 @@ of spreadsheet operations (CreateSheet, SetValues, SetFormula) along with the ou
 All strategies operate purely on the plan structure and never inspect actual data values.
 """
 
+import functools
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import List, Optional, Tuple, Dict, Any, Set
 from fornero.algebra.operations import (
@@ -58,17 +60,17 @@ class JoinTranslationContext:
     @property
     def left_key(self) -> str:
         """Get the left join key (first key if multiple)."""
-        return self.op.left_on[0] if isinstance(self.op.left_on, list) else self.op.left_on
+        return self.op.left_on[0]
 
     @property
     def right_key(self) -> str:
         """Get the right join key (first key if multiple)."""
-        return self.op.right_on[0] if isinstance(self.op.right_on, list) else self.op.right_on
+        return self.op.right_on[0]
 
     @property
     def right_keys(self) -> Set[str]:
         """Get set of all right join keys."""
-        return set(self.op.right_on) if isinstance(self.op.right_on, list) else {self.op.right_on}
+        return set(self.op.right_on)
 
     @property
     def output_schema(self) -> List[str]:
@@ -149,8 +151,18 @@ def _col_to_range_ref(sheet: str, range_obj: Range, col_name: str, col_idx: int,
     start_row_a1 = start_row_0indexed + 1
     end_row_a1 = end_row_0indexed + 1
 
-    col_letter = Range._col_to_letter(range_obj.col + col_idx)
+    return _column_ref(sheet, range_obj.col + col_idx, start_row_a1, end_row_a1)
 
+
+@functools.lru_cache(maxsize=256)
+def _column_ref(sheet: str, col: int, start_row_a1: int, end_row_a1: int) -> str:
+    """Memoized single-column reference builder.
+
+    Translating a plan asks for the same column of the same input sheet many
+    times (once per formula that reads it), and sheet names repeat across plans
+    of similar shape, so the letter conversion and quoting are done once per key.
+    """
+    col_letter = Range._col_to_letter(col)
     ref = Reference(f"{col_letter}{start_row_a1}:{col_letter}{end_row_a1}", sheet_name=sheet)
     return ref.to_string()
 
@@ -425,10 +437,37 @@ def _translate_expression_ast(node: Expression, input_sheet: str, input_range: R
     return str(node)
 
 
+_PREDICATE_CACHE_SIZE = 1024
+_predicate_cache: "OrderedDict[tuple, str]" = OrderedDict()
+
+
+def _expression_key(node: Expression) -> tuple:
+    """Structural key for an Expression AST.
+
+    Expressions overload ``==`` to build predicates, so they cannot be compared
+    or hashed by value themselves. Literal keys include the value's type so that
+    e.g. ``1`` and ``True`` (rendered differently) stay distinct.
+    """
+    if isinstance(node, Column):
+        return ("col", node.name)
+    if isinstance(node, Literal):
+        return ("lit", type(node.value).__name__, node.value)
+    if isinstance(node, BinaryOp):
+        return ("bin", node.op, _expression_key(node.left), _expression_key(node.right))
+    if isinstance(node, UnaryOp):
+        return ("un", node.op, _expression_key(node.operand))
+    if isinstance(node, FunctionCall):
+        return ("fn", node.func, tuple(_expression_key(a) for a in node.args))
+    return ("expr", str(node))
+
+
 def _translate_predicate(predicate, input_sheet: str, input_range: Range,
                          input_schema: List[str]) -> str:
     """Translate a predicate Expression AST to spreadsheet condition.
 
+    Results are cached by the predicate's structure and the input location, so a
+    predicate that reappears over the same input is rendered only once.
+
     Args:
         predicate: Expression AST node (BinaryOp, Column, Literal, etc.)
         input_sheet: Input sheet name
@@ -443,7 +482,26 @@ def _translate_predicate(predicate, input_sheet: str, input_range: Range,
             f"Predicate must be an Expression AST node, got {type(predicate).__name__}. "
             f"Use col() helper to create predicates."
         )
-    return _translate_expression_ast(predicate, input_sheet, input_range, input_schema)
+    key = (
+        _expression_key(predicate),
+        input_sheet,
+        (input_range.row, input_range.col, input_range.row_end, input_range.col_end),
+        tuple(input_schema),
+    )
+    try:
+        cached = _predicate_cache.get(key)
+    except TypeError:
+        # Unhashable literal value (e.g. a list): translate without caching
+        return _translate_expression_ast(predicate, input_sheet, input_range, input_schema)
+    if cached is not None:
+        _predicate_cache.move_to_end(key)
+        return cached
+
+    condition = _translate_expression_ast(predicate, input_sheet, input_range, input_schema)
+    _predicate_cache[key] = condition
+    if len(_predicate_cache) > _PREDICATE_CACHE_SIZE:
+        _predicate_cache.popitem(last=False)
+    return condition
 
 
 def translate_join(op: Join, counter: int, left_sheet: str, left_range: Range, left_schema: List[str],
@@ -122,7 +122,7 @@ def _format_operation(op: Operation) -> str:
         return f"{op_type}(predicate='{op.predicate}')"
 
     elif isinstance(op, Join):
-        return f"{op_type}(left_on={op.left_on}, right_on={op.right_on}, type='{op.join_type}')"
+        return f"{op_type}(left_on={list(op.left_on)}, right_on={list(op.right_on)}, type='{op.join_type}')"
 
     elif isinstance(op, GroupBy):
         return f"{op_type}(keys={op.keys}, aggregations={op.aggregations})"
@@ -1,5 +1,9 @@
 """Shared pytest configuration and fixtures for fornero tests."""
 
+import functools
+import os
+from unittest.mock import Mock
+
 import pandas as pd
 import pytest
 
@@ -15,10 +19,33 @@ def pytest_addoption(parser):
 
 def pytest_configure(config):
     config.addinivalue_line("markers", "slow: marks tests as slow (skipped unless --run-slow)")
+    if os.environ.get("FORNERO_NO_PYTEST_CACHE"):
+        # Skip .pytest_cache reads and writes (e.g. in CI); --lf/--ff need it.
+        for name in ("cacheprovider", "lfplugin", "nfplugin", "stepwiseplugin"):
+            config.pluginmanager.set_blocked(name)
+
+
+def _has_sheets_credentials():
+    """Cheaply probe for credentials gspread.service_account()/oauth() could use."""
+    if os.environ.get("GOOGLE_APPLICATION_CREDENTIALS"):
+        return True
+    config_dir = os.path.join(os.path.expanduser("~"), ".config", "gspread")
+    return any(
+        os.path.exists(os.path.join(config_dir, name))
+        for name in ("service_account.json", "credentials.json", "authorized_user.json")
+    )
 
 
 def pytest_collection_modifyitems(config, items):
     if config.getoption("--run-slow"):
+        if not _has_sheets_credentials():
+            # Deselect live tests up front instead of skipping each in its fixture.
+            keep, live = [], []
+            for item in items:
+                (live if "TestLiveCorrectness" in item.nodeid else keep).append(item)
+            if live:
+                config.hook.pytest_deselected(items=live)
+                items[:] = keep
         return
     skip = pytest.mark.skip(reason="slow test — pass --run-slow to include")
     for item in items:
@@ -61,3 +88,107 @@ def wide_format() -> pd.DataFrame:
         "q2": [20, 50],
         "q3": [30, 60],
     })
+
+
+@pytest.fixture(scope="session")
+def sample_plan():
+    """A two-sheet plan: values on ``source``, formulas on the main ``result`` sheet.
+
+    Built once per session; tests must treat it as read-only.
+    """
+    from fornero.executor.plan import ExecutionPlan
+    from fornero.spreadsheet.operations import CreateSheet, SetFormula, SetValues
+
+    ops = [
+        CreateSheet(name="source", rows=100, cols=3),
+        CreateSheet(name="result", rows=100, cols=3),
+        SetValues(sheet="source", row=0, col=0, values=[["A", "B", "C"]]),
+        SetFormula(sheet="result", row=0, col=0, formula="=source!A1"),
+        SetFormula(sheet="result", row=0, col=1, formula="=source!B1"),
+    ]
+    return ExecutionPlan.from_operations(ops, main_sheet="result")
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Make the executor's rate-limit and retry backoff sleeps return immediately.
+
+    Returns the list of requested delays, in call order, so tests can check the
+    backoff schedule without waiting for it.
+    """
+    delays = []
+    monkeypatch.setattr("fornero.executor.sheets_executor.time.sleep", delays.append)
+    return delays
+
+
+@pytest.fixture(scope="module")
+def _gspread_mocks():
+    """Spec'd gspread mocks, built once per module: spec introspection is slow."""
+    import gspread
+    from gspread.http_client import HTTPClient
+
+    spreadsheet = Mock(spec=gspread.Spreadsheet)
+    # ``client`` is an instance attribute, so the spec does not provide it
+    spreadsheet.client = Mock(spec=HTTPClient)
+    return Mock(spec=gspread.Client), spreadsheet, Mock(spec=gspread.Worksheet)
+
+
+@pytest.fixture
+def gspread_mocks(_gspread_mocks):
+    """Reset the shared gspread mocks and wire the default object graph.
+
+    ``gc.create()`` returns the spreadsheet, whose ``sheet1`` and ``add_worksheet()``
+    are the worksheet; the worksheet has id 0 and a 100x5 grid. ``batch_update()``
+    answers with a single empty reply. Tests override any of these as needed.
+    """
+    gc, spreadsheet, worksheet = _gspread_mocks
+    for mock in (*_gspread_mocks, spreadsheet.client):
+        mock.reset_mock(return_value=True, side_effect=True)
+    # Wiring order fixes each mock's parent on first use, and so the call paths in
+    # gc.mock_calls: the worksheet is recorded as create().add_worksheet().
+    gc.create.return_value = spreadsheet
+    spreadsheet.add_worksheet.return_value = worksheet
+    spreadsheet.sheet1 = worksheet
+    spreadsheet.configure_mock(id="spreadsheet-id")
+    spreadsheet.batch_update.return_value = {"spreadsheetId": "spreadsheet-id", "replies": [{}]}
+    worksheet.configure_mock(id=0, row_count=100, col_count=5)
+    worksheet._properties = {
+        "sheetId": 0, "title": "Sheet1", "gridProperties": {"rowCount": 100, "columnCount": 5}
+    }
+    return _gspread_mocks
+
+
+@pytest.fixture
+def mock_gc(gspread_mocks):
+    return gspread_mocks[0]
+
+
+@pytest.fixture
+def mock_spreadsheet(gspread_mocks):
+    return gspread_mocks[1]
+
+
+@pytest.fixture
+def mock_worksheet(gspread_mocks):
+    return gspread_mocks[2]
+
+
+@pytest.fixture(scope="module")
+def api_error_factory():
+    """Return ``make(code, message, status=None)`` building a gspread APIError.
+
+    Errors are memoized per argument tuple, so each distinct error response is
+    parsed once per module.
+    """
+    from gspread.exceptions import APIError
+
+    @functools.lru_cache(maxsize=None)
+    def make(code, message, status=None):
+        error = {"code": code, "message": message}
+        if status is not None:
+            error["status"] = status
+        response = Mock()
+        response.json.return_value = {"error": error}
+        return APIError(response)
+
+    return make
@@ -8,6 +8,7 @@ and a 2D list of values read back from a spreadsheet (the actual result).
 import math
 from typing import Any, List
 
+import numpy as np
 import pandas as pd
 
 
@@ -29,6 +30,20 @@ def dataframe_to_matrix(df: pd.DataFrame, include_header: bool = True) -> List[L
     return rows
 
 
+def sort_rows(matrix: List[List[Any]]) -> List[List[Any]]:
+    """Return the rows of *matrix* ordered by the string form of their cells.
+
+    Equivalent to ``sorted(matrix, key=lambda r: tuple(str(v) for v in r))``,
+    but the comparison runs in NumPy's sort instead of a Python key function.
+    Rows must all have the same length.
+    """
+    if not matrix:
+        return []
+    keys = np.array(matrix, dtype=object).astype(str)
+    order = np.lexsort(keys.T[::-1])
+    return [matrix[i] for i in order]
+
+
 def _normalize_value(v: Any) -> Any:
     """Normalise a Python value to something comparable with spreadsheet output.
 
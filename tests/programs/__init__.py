@@ -7,19 +7,27 @@ Each sub-module exposes:
     run()         – returns a ProgramResult(result, source_data)
 
 ``discover()`` collects every program module in this package so the
-parametrized test runner can iterate over them.
+parametrized test runner can iterate over them. Program modules must do no
+work at import time; all computation belongs in ``run()``.
 """
 
 from collections import namedtuple
-from typing import List
+from types import ModuleType
+from typing import Tuple
+import functools
 import importlib
 import pkgutil
 
 ProgramResult = namedtuple("ProgramResult", ["result", "source_data"])
 
 
-def discover() -> List:
-    """Return a list of (module_name, module) pairs for every p##_*.py file."""
+@functools.lru_cache(maxsize=1)
+def discover() -> Tuple[Tuple[str, ModuleType], ...]:
+    """Return (module_name, module) pairs for every p##_*.py file, sorted by name.
+
+    Modules are only imported, never run, and the walk happens once per
+    process.
+    """
     programs = []
     package = __name__
     pkg_path = __path__
@@ -30,4 +38,4 @@ def discover() -> List:
             programs.append((modname, mod))
 
     programs.sort(key=lambda t: t[0])
-    return programs
+    return tuple(programs)
@@ -28,6 +28,7 @@ from fornero.algebra import (
     Pivot,
     Melt,
     Window,
+    NodeKind,
 )
 
 
@@ -39,7 +40,7 @@ class TestSource:
         source = Source(source_id="data.csv", schema=["a", "b", "c"])
         assert source.source_id == "data.csv"
         assert source.schema == ["a", "b", "c"]
-        assert source.inputs == []
+        assert source.inputs == ()
 
     def test_construction_with_inputs_fails(self):
         """Source with inputs raises ValueError."""
@@ -64,7 +65,7 @@ class TestSource:
         assert isinstance(restored, Source)
         assert restored.source_id == source.source_id
         assert restored.schema == source.schema
-        assert restored.inputs == []
+        assert restored.inputs == ()
 
 
 class TestSelect:
@@ -156,11 +157,20 @@ class TestJoin:
         left = Source(source_id="left.csv")
         right = Source(source_id="right.csv")
         join = Join(left_on="id", right_on="user_id", join_type="inner", inputs=[left, right])
-        assert join.left_on == ["id"]
-        assert join.right_on == ["user_id"]
+        assert join.left_on == ("id",)
+        assert join.right_on == ("user_id",)
         assert join.join_type == "inner"
         assert len(join.inputs) == 2
 
+    def test_equal_joins_hash_equal(self):
+        """Joins normalize str and list keys alike and can be used as dict keys."""
+        left = Source(source_id="left.csv")
+        right = Source(source_id="right.csv")
+        by_name = Join(left_on="id", right_on="user_id", inputs=[left, right])
+        by_list = Join(left_on=["id"], right_on=["user_id"], inputs=[left, right])
+        assert by_name == by_list
+        assert {by_name: "cached"}[by_list] == "cached"
+
     def test_construction_without_two_inputs_fails(self):
         """Join without exactly two inputs raises ValueError."""
         source = Source(source_id="data.csv")
@@ -751,6 +761,28 @@ class TestLogicalPlan:
         assert "a > 10" in explanation
         assert "['a', 'b']" in explanation or "columns=" in explanation
 
+    def test_explain_is_cached(self):
+        """Repeat explain() calls return the cached string without re-walking the tree."""
+        source = Source(source_id="data.csv", schema=["a", "b"])
+        plan = LogicalPlan(Filter(predicate="a > 10", inputs=[source]))
+
+        first = plan.explain()
+        assert plan.explain() is first
+        assert plan.copy().explain() == first
+
+    def test_optimized_is_computed_once(self):
+        """optimized() applies the rewrite passes and caches the result on the plan."""
+        source = Source(source_id="data.csv", schema=["a", "b"])
+        plan = LogicalPlan(
+            Select(columns=["a"], inputs=[Filter(predicate="a > 5", inputs=[source])])
+        )
+
+        optimized = plan.optimized()
+        assert optimized is plan.optimized()
+        assert isinstance(optimized.root, Select)
+        assert optimized.root.predicate == "a > 5"
+        assert optimized.root.inputs[0] is source
+
     def test_explain_includes_operation_details(self):
         """Explain output includes operation-specific details."""
         source = Source(source_id="data.csv")
@@ -849,7 +881,7 @@ class TestOperationInputs:
     def test_source_has_zero_inputs(self):
         """Source has zero inputs."""
         source = Source(source_id="data.csv")
-        assert source.inputs == []
+        assert source.inputs == ()
 
     def test_unary_operations_have_one_input(self):
         """Unary operations have exactly one input."""
@@ -864,6 +896,18 @@ class TestOperationInputs:
         sort = Sort(keys=[("a", "asc")], inputs=[source])
         assert len(sort.inputs) == 1
 
+    def test_inputs_are_stored_as_tuples(self):
+        """Inputs given as a list, alias, or via unary() are stored as a tuple."""
+        source = Source(source_id="data.csv", schema=["a"])
+
+        assert Select(columns=["a"], inputs=[source]).inputs == (source,)
+        assert Select(columns=["a"], input=source).inputs == (source,)
+
+        filt = Filter.unary(source, predicate="a > 0")
+        assert isinstance(filt, Filter)
+        assert filt.inputs == (source,)
+        assert filt.predicate == "a > 0"
+
     def test_binary_operations_have_two_inputs(self):
         """Binary operations have exactly two inputs."""
         left = Source(source_id="left.csv")
@@ -874,3 +918,63 @@ class TestOperationInputs:
 
         union = Union(inputs=[left, right])
         assert len(union.inputs) == 2
+
+
+
+class TestOutputSchema:
+    """Test output column derivation on operation nodes."""
+
+    def test_schema_is_derived_through_the_plan(self):
+        """Row-wise nodes pass columns through; Select and WithColumn reshape them."""
+        source = Source(source_id="data.csv", schema=["a", "b"])
+        select = Select(columns=["b"], inputs=[source])
+        widened = WithColumn(column="c", expression="b * 2", inputs=[select])
+        sorted_op = Sort(keys=[("c", "desc")], inputs=[widened])
+
+        assert source.output_schema == ["a", "b"]
+        assert sorted_op.output_schema == ["b", "c"]
+        grouped = GroupBy(keys=["b"], aggregations=[("n", "count", "b")], inputs=[select])
+        assert grouped.output_schema is None
+        assert Filter(predicate="a > 0", inputs=[Source(source_id="x.csv")]).output_schema is None
+
+    def test_schema_is_computed_once(self):
+        """The derived schema is kept on the node and returned on later reads."""
+        source = Source(source_id="data.csv", schema=["a", "b"])
+        widened = WithColumn(column="c", expression="a + b", inputs=[source])
+        assert widened.output_schema is widened.output_schema
+
+    def test_deep_chains_do_not_recurse(self):
+        """Deriving the schema of a very deep chain does not hit the recursion limit."""
+        op = Source(source_id="data.csv", schema=["a"])
+        for _ in range(5000):
+            op = Limit(count=10, inputs=[op])
+        assert op.output_schema == ["a"]
+
+class TestNodeKind:
+    """Test the integer type tags carried by operation classes."""
+
+    def test_each_operation_class_has_a_distinct_kind(self):
+        """Every concrete operation class carries its own NodeKind tag."""
+        classes = [
+            Source, Select, Filter, Join, GroupBy, Aggregate, Sort,
+            Limit, WithColumn, Union, Pivot, Melt, Window,
+        ]
+        kinds = [cls.kind for cls in classes]
+        assert all(isinstance(kind, NodeKind) for kind in kinds)
+        assert sorted(kinds) == list(NodeKind)
+
+    def test_operations_use_slots(self):
+        """Operation nodes store fields in slots rather than a per-instance dict."""
+        source = Source(source_id="data.csv")
+        select = Select(columns=["a"], inputs=[source])
+        assert not hasattr(source, "__dict__")
+        assert not hasattr(select, "__dict__")
+        with pytest.raises(AttributeError):
+            select.not_a_field = 1
+
+    def test_kind_is_not_a_dataclass_field(self):
+        """The tag is a class attribute and stays out of serialization."""
+        source = Source(source_id="data.csv")
+        assert source.kind is NodeKind.SOURCE
+        assert "kind" not in source.to_dict()
+        assert Operation.kind is None
@@ -56,6 +56,30 @@ class TestSource:
         result.iloc[0, 0] = "MODIFIED"
         assert employees.iloc[0, 0] == "Alice", "Source must return a copy"
 
+    @pytest.mark.parametrize(
+        "make_op",
+        [
+            lambda src: Select(columns=["name", "age"], input=src),
+            lambda src: Limit(n=3, end="head", input=src),
+            lambda src: Sort(keys=[("age", "asc")], input=src),
+            lambda src: Filter(predicate=col("age") > Literal(0), input=src),
+        ],
+        ids=["select", "limit", "sort", "filter"],
+    )
+    def test_results_do_not_alias_source(self, employees: pd.DataFrame, make_op):
+        result = execute(make_op(_src(employees)))
+        result.iloc[0, 1] = -1
+        assert employees.iloc[0, 1] == 30
+
+    def test_arrow_table(self, employees: pd.DataFrame):
+        pa = pytest.importorskip("pyarrow")
+        table = pa.Table.from_pandas(employees, preserve_index=False)
+        pred = col("age") > Literal(30)
+        result = execute(Filter(predicate=pred, input=Source(data=table, name="t")))
+        expected = employees[employees["age"] > 30].reset_index(drop=True)
+        assert_frame_equal(result, expected, check_dtype=False)
+        assert isinstance(result["age"].dtype, pd.ArrowDtype)
+
     def test_empty_dataframe(self):
         df = pd.DataFrame(
             {"a": pd.Series(dtype="int64"), "b": pd.Series(dtype="float64")}
@@ -88,6 +112,11 @@ class TestSelect:
         result = execute(op)
         assert list(result.columns) == ["salary", "name"]
 
+    def test_custom_index_is_reset(self, employees: pd.DataFrame):
+        indexed = employees.set_index(pd.Index(range(100, 108)))
+        result = execute(Select(columns=["name"], input=_src(indexed)))
+        assert_frame_equal(result, employees[["name"]])
+
     def test_preserves_row_count(self, employees: pd.DataFrame):
         op = Select(columns=["name"], input=_src(employees))
         result = execute(op)
@@ -132,6 +161,13 @@ class TestFilter:
         )
         assert_frame_equal(result, expected)
 
+    def test_custom_index_is_reset(self, employees: pd.DataFrame):
+        indexed = employees.set_index(pd.Index(range(100, 108)))
+        pred = col("age") > Literal(30)
+        result = execute(Filter(predicate=pred, input=_src(indexed)))
+        expected = employees[employees["age"] > 30].reset_index(drop=True)
+        assert_frame_equal(result, expected)
+
     def test_no_matching_rows(self, employees: pd.DataFrame):
         pred = col("age") > Literal(100)
         op = Filter(predicate=pred, input=_src(employees))
@@ -173,12 +209,41 @@ class TestSort:
         ).reset_index(drop=True)
         assert_frame_equal(result, expected)
 
+    @pytest.mark.parametrize("dtype", ["int32", "int64", "uint64"])
+    @pytest.mark.parametrize("direction", ["asc", "desc"])
+    def test_large_integer_key_radix(self, dtype: str, direction: str):
+        info = np.iinfo(dtype)
+        rng = np.random.default_rng(0)
+        keys = rng.integers(info.min, info.max, 10_000, dtype=dtype, endpoint=True)
+        keys[::2] %= 50  # plenty of ties
+        df = pd.DataFrame({"k": keys, "row": np.arange(len(keys))})
+        result = execute(Sort(keys=[("k", direction)], input=_src(df)))
+        expected = df.sort_values(
+            "k", ascending=direction == "asc", kind="mergesort"
+        ).reset_index(drop=True)
+        assert_frame_equal(result, expected)
+
     def test_stable_sort(self):
         df = pd.DataFrame({"key": [1, 1, 1], "order": ["a", "b", "c"]})
         op = Sort(keys=[("key", "asc")], input=_src(df))
         result = execute(op)
         assert list(result["order"]) == ["a", "b", "c"]
 
+    def test_stable_sort_desc(self):
+        df = pd.DataFrame({"key": [1, 2, 1, 2], "order": ["a", "b", "c", "d"]})
+        op = Sort(keys=[("key", "desc")], input=_src(df))
+        result = execute(op)
+        assert list(result["order"]) == ["b", "d", "a", "c"]
+
+    def test_multi_numeric_keys_with_nan(self):
+        df = pd.DataFrame({"a": [2, 1, 2, 1], "b": [1.0, np.nan, 3.0, 0.5]})
+        op = Sort(keys=[("a", "asc"), ("b", "desc")], input=_src(df))
+        result = execute(op)
+        expected = df.sort_values(
+            ["a", "b"], ascending=[True, False], kind="mergesort"
+        ).reset_index(drop=True)
+        assert_frame_equal(result, expected)
+
 
 # ======================================================================
 # 5. Limit
@@ -208,6 +273,14 @@ class TestLimit:
         result = execute(op)
         assert len(result) == 0
 
+    @pytest.mark.parametrize("end", ["head", "tail"])
+    def test_result_does_not_alias_source(self, employees: pd.DataFrame, end: str):
+        original = employees.copy()
+        op = Limit(n=3, end=end, input=Limit(n=5, end=end, input=_src(employees)))
+        result = execute(op)
+        result.loc[:, "salary"] = 0
+        assert_frame_equal(employees, original)
+
 
 # ======================================================================
 # 6. WithColumn
@@ -309,6 +382,22 @@ class TestGroupBy:
         result = execute(op)
         assert list(result["g"]) == ["b", "a"]
 
+    def test_categorical_key_skips_unobserved_categories(self):
+        df = pd.DataFrame(
+            {
+                "g": pd.Categorical(["b", "a", "b"], categories=["a", "b", "z"]),
+                "v": [1, 2, 3],
+            }
+        )
+        op = GroupBy(
+            keys=["g"],
+            aggregations=[("total", "sum", "v")],
+            input=_src(df),
+        )
+        result = execute(op)
+        assert list(result["g"]) == ["b", "a"]
+        assert list(result["total"]) == [4, 2]
+
 
 # ======================================================================
 # 8. Aggregate
@@ -415,6 +504,23 @@ class TestJoin:
         assert len(result) == 3
         assert pd.isna(result.loc[result["key"] == 2, "extra"].iloc[0])
 
+    @pytest.mark.parametrize("how", ["inner", "left"])
+    def test_hash_join_matches_merge(self, how: str):
+        left = pd.DataFrame({"key": [3, 1, 2, 1], "val": ["a", "b", "c", "d"]})
+        right = pd.DataFrame({"key": [1, 3], "val": [10, 30], "flag": [True, False]})
+        op = Join(left=_src(left), right=_src(right), left_key="key", right_key="key", how=how)
+        result = execute(op)
+        expected = left.merge(right, on="key", how=how)
+        assert_frame_equal(result, expected)
+
+    def test_duplicate_right_keys_fall_back_to_merge(self):
+        left = pd.DataFrame({"key": [1, 2], "val": ["a", "b"]})
+        right = pd.DataFrame({"key": [1, 1, 2], "extra": [10, 11, 20]})
+        op = Join(left=_src(left), right=_src(right), left_key="key", right_key="key")
+        result = execute(op)
+        expected = left.merge(right, on="key", how="inner")
+        assert_frame_equal(result, expected)
+
 
 # ======================================================================
 # 10. Union
@@ -438,6 +544,22 @@ class TestUnion:
         result = execute(Union(left=_src(df), right=_src(df)))
         assert list(result["a"]) == [1, 1, 1, 1]
 
+    @pytest.mark.parametrize(
+        "top, bottom",
+        [
+            ({"a": [1, 2], "b": ["x", "y"]}, {"a": [3, 4], "b": ["z", "w"]}),
+            ({"a": [1, 2]}, {"a": [0.5]}),
+            ({"a": np.array([1], dtype="int8")}, {"a": np.array([2], dtype="uint8")}),
+            ({"a": [True]}, {"a": [1]}),
+            ({"a": pd.Categorical(["x"])}, {"a": pd.Categorical(["y"])}),
+        ],
+        ids=["same-dtypes", "int-float", "int8-uint8", "bool-int", "categorical"],
+    )
+    def test_dtypes_match_concat(self, top: dict, bottom: dict):
+        left, right = pd.DataFrame(top), pd.DataFrame(bottom)
+        result = execute(Union(left=_src(left), right=_src(right)))
+        assert_frame_equal(result, pd.concat([left, right], ignore_index=True))
+
 
 # ======================================================================
 # 11. Pivot
@@ -480,6 +602,57 @@ class TestPivot:
         alice_q1 = result[result["name"] == "Alice"]["q1"].iloc[0]
         assert alice_q1 == 15
 
+    @pytest.mark.parametrize("aggfunc", ["sum", "first", "min", "max", "count"])
+    def test_scatter_pivot_matches_pivot_table(self, aggfunc: str):
+        df = pd.DataFrame(
+            {
+                "name": ["Bob", "Alice", "Bob", "Alice", "Carol"],
+                "metric": ["q1", "q2", "q1", "q1", "q2"],
+                "value": [1, 2, 3, 4, 5],
+            }
+        )
+        op = Pivot(
+            index="name",
+            pivot_column="metric",
+            values_column="value",
+            aggfunc=aggfunc,
+            input=_src(df),
+        )
+        result = execute(op)
+        expected = df.pivot_table(
+            index=["name"], columns="metric", values="value", aggfunc=aggfunc
+        )
+        expected.columns = expected.columns.astype(str)
+        expected = expected.reset_index()
+        expected.columns.name = None
+        assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            np.array([2**31 - 1, 5, 7], dtype="int32"),
+            np.array([200, 153, 7], dtype="uint8"),
+            np.array([1, 2, 7], dtype="int8"),
+        ],
+        ids=["int32_overflow", "uint8_overflow", "int8_fits"],
+    )
+    def test_scatter_pivot_sum_of_narrow_ints_matches_pivot_table(self, values: np.ndarray):
+        df = pd.DataFrame(
+            {"name": ["Bob", "Bob", "Carol"], "metric": ["q1", "q1", "q1"], "value": values}
+        )
+        op = Pivot(
+            index="name",
+            pivot_column="metric",
+            values_column="value",
+            aggfunc="sum",
+            input=_src(df),
+        )
+        result = execute(op)
+        expected = df.pivot_table(index=["name"], columns="metric", values="value", aggfunc="sum")
+        expected.columns = expected.columns.astype(str)
+        expected = expected.reset_index()
+        expected.columns.name = None
+        assert_frame_equal(result, expected)
 
 # ======================================================================
 # 12. Melt
@@ -596,6 +769,39 @@ class TestWindow:
             actual = result.loc[result["dept"] == dept, "dept_count"].unique()
             assert actual[0] == expected_count
 
+    @pytest.mark.parametrize("dtype", ["int64", "int32"])
+    @pytest.mark.parametrize("categorical", [False, True], ids=["object", "categorical"])
+    @pytest.mark.parametrize("func", ["row_number", "cumsum", "rank"])
+    def test_partition_kernel_matches_groupby(self, func: str, categorical: bool, dtype: str):
+        df = pd.DataFrame(
+            {
+                "g": ["b", "a", "b", "a", "b", "a", "c"],
+                "v": np.array([5, 3, 5, 1, 2, 3, 9], dtype=dtype),
+                "o": [2, 0, 1, 2, 0, 1, 0],
+            }
+        )
+        if categorical:
+            df["g"] = df["g"].astype("category")
+        ordered = df.sort_values("o", kind="mergesort")
+        grouped = ordered.groupby("g", sort=False, observed=True)
+        if func == "row_number":
+            expected = grouped.cumcount() + 1
+        elif func == "cumsum":
+            expected = grouped["v"].cumsum()
+        else:
+            expected = grouped["v"].rank(method="min").astype(int)
+        op = Window(
+            partition_by=["g"],
+            order_by=[("o", "asc")],
+            func=func,
+            input_col="v",
+            output_col="out",
+            input=_src(df),
+        )
+        result = execute(op)
+        assert list(result["out"]) == list(expected.sort_index())
+        assert result["out"].dtype == (expected.dtype if func == "cumsum" else np.int64)
+
 
 # ======================================================================
 # 14. Expressions (unit tests for evaluate_expression)
@@ -647,6 +853,41 @@ class TestExpressions:
         result = evaluate_expression(expr, df)
         assert list(result) == [False, True, False]
 
+    def test_logical_chain(self, employees: pd.DataFrame):
+        from fornero.algebra.eager import evaluate_expression
+
+        expr = (
+            (col("age") > Literal(25)) & (col("salary") > Literal(60000))
+            & (col("dept") != Literal("hr"))
+        ) | (col("age") > Literal(40))
+        result = evaluate_expression(expr, employees)
+        expected = (
+            (employees["age"] > 25) & (employees["salary"] > 60000)
+            & (employees["dept"] != "hr")
+        ) | (employees["age"] > 40)
+        assert list(result) == list(expected)
+        assert result.dtype == np.bool_
+
+    def test_logical_on_integers_is_bitwise(self):
+        from fornero.algebra.eager import evaluate_expression
+
+        df = pd.DataFrame({"a": [6, 3], "b": [3, 5]})
+        result = evaluate_expression(col("a") & col("b"), df)
+        assert list(result) == [2, 1]
+
+    def test_compiled_closure_is_cached(self, employees: pd.DataFrame):
+        from fornero.algebra.eager import evaluate_expression
+
+        expr = col("salary") * Literal(2)
+        first = evaluate_expression(expr, employees)
+        compiled = expr._compiled
+        assert compiled is not None
+        assert expr.left._compiled is not None
+
+        second = evaluate_expression(expr, employees.head(3))
+        assert expr._compiled is compiled
+        assert list(second) == list(first.head(3))
+
     def test_unknown_op_raises(self, employees: pd.DataFrame):
         from fornero.algebra.eager import evaluate_expression
 
@@ -654,6 +895,21 @@ class TestExpressions:
         with pytest.raises(ValueError, match="Unknown binary operator"):
             evaluate_expression(expr, employees)
 
+    def test_unknown_unary_op_raises(self, employees: pd.DataFrame):
+        from fornero.algebra.eager import evaluate_expression
+        from fornero.algebra.expressions import UnaryOp
+
+        expr = UnaryOp(op="??", operand=col("age"))
+        with pytest.raises(ValueError, match="Unknown unary operator"):
+            evaluate_expression(expr, employees)
+
+    def test_unknown_expression_type_raises(self, employees: pd.DataFrame):
+        from fornero.algebra.eager import evaluate_expression
+        from fornero.algebra.expressions import Expression
+
+        with pytest.raises(TypeError, match="Unknown expression type: Expression"):
+            evaluate_expression(Expression(), employees)
+
     def test_unknown_function_raises(self, employees: pd.DataFrame):
         from fornero.algebra.eager import evaluate_expression
 
@@ -1008,3 +1264,160 @@ class TestEdgeCases:
 
         with pytest.raises(TypeError, match="Unknown operation type"):
             execute(FakeOp())
+
+
+class TestFusion:
+    def test_chain_is_fused(self, employees: pd.DataFrame):
+        from fornero.algebra.fusion import FusedProject, fuse_projections
+
+        src = _src(employees)
+        wc = WithColumn(column="bonus", expression=col("salary") * Literal(0.1), input=src)
+        flt = Filter(predicate=col("bonus") > Literal(9000), input=wc)
+        fused = fuse_projections(flt)
+        assert isinstance(fused, FusedProject)
+        assert fused.steps == [wc, flt]
+        assert fused.inputs == (src,)
+
+    def test_single_node_not_fused(self, employees: pd.DataFrame):
+        from fornero.algebra.fusion import fuse_projections
+
+        flt = Filter(predicate=col("age") > Literal(30), input=_src(employees))
+        assert fuse_projections(flt) is flt
+
+    def test_fused_matches_pandas(self, employees: pd.DataFrame):
+        src = _src(employees)
+        wc1 = WithColumn(column="bonus", expression=col("salary") * Literal(0.1), input=src)
+        flt = Filter(predicate=col("age") > Literal(30), input=wc1)
+        wc2 = WithColumn(column="total", expression=col("salary") + col("bonus"), input=flt)
+        result = execute(wc2)
+
+        expected = employees.assign(bonus=employees["salary"] * 0.1)
+        expected = expected[expected["age"] > 30].reset_index(drop=True)
+        expected["total"] = expected["salary"] + expected["bonus"]
+        assert_frame_equal(result, expected)
+
+    def test_fused_with_string_predicate(self, employees: pd.DataFrame):
+        src = _src(employees)
+        wc = WithColumn(column="double", expression=col("age") * Literal(2), input=src)
+        flt = Filter(predicate=col("dept") == Literal("eng"), input=wc)
+        result = execute(flt)
+        expected = employees.assign(double=employees["age"] * 2)
+        expected = expected[expected["dept"] == "eng"].reset_index(drop=True)
+        assert_frame_equal(result, expected)
+
+    def test_expression_to_numexpr(self):
+        from fornero.algebra.fusion import expression_to_numexpr
+
+        names: dict[str, str] = {}
+        expr = (col("a b") + Literal(1)) > col("c")
+        assert expression_to_numexpr(expr, names) == "((_c0 + 1) > _c1)"
+        assert names == {"a b": "_c0", "c": "_c1"}
+
+    def test_expression_to_numexpr_unsupported(self):
+        from fornero.algebra.fusion import expression_to_numexpr
+
+        assert expression_to_numexpr(col("dept") == Literal("eng"), {}) is None
+        assert expression_to_numexpr(FunctionCall(func="round", args=[col("a")]), {}) is None
+
+    @pytest.mark.parametrize("dtype", ["int8", "int16", "uint8", "uint16", "uint32", "uint64"])
+    def test_numexpr_rejects_narrow_and_unsigned_ints(self, dtype: str):
+        from fornero.algebra.fusion import evaluate_numexpr
+
+        df = pd.DataFrame({"a": np.array([100, 120], dtype=dtype)})
+        assert evaluate_numexpr(col("a") + Literal(100), df) is None
+
+    @pytest.mark.parametrize(
+        "values, addend",
+        [(np.array([100, 120], dtype="int8"), 100), (np.array([2**63 + 5, 1], dtype="uint64"), 1)],
+        ids=["int8", "uint64"],
+    )
+    def test_fused_narrow_ints_match_pandas(self, values: np.ndarray, addend: int):
+        df = pd.DataFrame({"a": values})
+        wc = WithColumn(column="b", expression=col("a") + Literal(addend), input=_src(df))
+        flt = Filter(predicate=col("b") < Literal(0), input=wc)
+        result = execute(flt)
+
+        expected = df.assign(b=df["a"] + addend)
+        expected = expected[expected["b"] < 0].reset_index(drop=True)
+        assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize(
+        "values, addend",
+        [(np.array([100, 120], dtype="int8"), 100), (np.array([2**63 + 5, 1], dtype="uint64"), 1)],
+        ids=["int8", "uint64"],
+    )
+    def test_filter_on_narrow_ints_matches_pandas(self, values: np.ndarray, addend: int):
+        df = pd.DataFrame({"a": values})
+        pred = (col("a") + Literal(addend)) < Literal(0)
+        result = execute(Filter(predicate=pred, input=_src(df)))
+        expected = df[(df["a"] + addend) < 0].reset_index(drop=True)
+        assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize("divisor", [Literal(0), col("d")], ids=["literal", "column"])
+    def test_fused_integer_modulo_by_zero_matches_pandas(self, divisor):
+        df = pd.DataFrame({"a": [5, 0, -3], "d": [0, 0, 2]})
+        wc1 = WithColumn(column="m", expression=col("a") % divisor, input=_src(df))
+        wc2 = WithColumn(column="n", expression=col("a") + Literal(1), input=wc1)
+        result = execute(wc2)
+
+        divisors = 0 if isinstance(divisor, Literal) else df["d"]
+        expected = df.assign(m=df["a"] % divisors, n=df["a"] + 1)
+        assert_frame_equal(result, expected)
+
+    def test_filter_predicate_uses_numexpr(self, employees: pd.DataFrame, monkeypatch):
+        from fornero.algebra import fusion
+
+        if fusion.numexpr is None:
+            pytest.skip("numexpr not installed")
+        calls: list[str] = []
+        evaluate = fusion.numexpr.evaluate
+
+        def spy(source, *args, **kwargs):
+            calls.append(source)
+            return evaluate(source, *args, **kwargs)
+
+        monkeypatch.setattr(fusion.numexpr, "evaluate", spy)
+        pred = (col("age") > Literal(30)) & (col("salary") < Literal(100000))
+        result = execute(Filter(predicate=pred, input=_src(employees)))
+        expected = employees[
+            (employees["age"] > 30) & (employees["salary"] < 100000)
+        ].reset_index(drop=True)
+        assert_frame_equal(result, expected)
+        assert calls == ["((_c0 > 30) & (_c1 < 100000))"]
+
+
+class TestSharedSubplans:
+    @staticmethod
+    def _count_evaluations(monkeypatch, op_type: type) -> list[Operation]:
+        from fornero.algebra import eager
+
+        seen: list[Operation] = []
+        evaluate = eager._evaluate
+
+        def spy(op, cache):
+            if isinstance(op, op_type):
+                seen.append(op)
+            return evaluate(op, cache)
+
+        monkeypatch.setattr(eager, "_evaluate", spy)
+        return seen
+
+    def test_identical_subtrees_evaluated_once(self, employees: pd.DataFrame, monkeypatch):
+        seen = self._count_evaluations(monkeypatch, Sort)
+        src = _src(employees)
+
+        def branch() -> Operation:
+            return Select(columns=["name"], input=Sort(keys=[("age", "asc")], input=src))
+
+        result = execute(Union(left=branch(), right=branch()))
+        names = list(employees.sort_values("age", kind="mergesort")["name"])
+        assert list(result["name"]) == names + names
+        assert len(seen) == 1
+
+    def test_different_source_data_not_shared(self, monkeypatch):
+        seen = self._count_evaluations(monkeypatch, Sort)
+        left = Sort(keys=[("a", "asc")], input=_src(pd.DataFrame({"a": [2, 1]})))
+        right = Sort(keys=[("a", "asc")], input=_src(pd.DataFrame({"a": [4, 3]})))
+        result = execute(Union(left=left, right=right))
+        assert list(result["a"]) == [1, 2, 3, 4]
+        assert len(seen) == 2
@@ -12,20 +12,29 @@ Usage:
     pytest tests/test_correctness.py -v                    # fast tests only
     pytest tests/test_correctness.py -v --run-slow         # all tests
     pytest tests/test_correctness.py -v -m slow            # slow tests only
+    pytest tests/test_correctness.py --run-slow -n auto    # live tests in parallel
     pytest tests/test_correctness.py -k "groupby_sum" -v   # single program
 """
 
+import functools
+import os
 import re
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple, Optional
 
+import numpy as np
 import pytest
 
+from fornero.algebra import LogicalPlan
+from fornero.algebra.operations import GroupBy, Join, Pivot, Source
 from fornero.translator import Translator
 from fornero.exceptions import UnsupportedOperationError
 from fornero.spreadsheet.operations import CreateSheet, SetValues, SetFormula
 from fornero.executor.plan import ExecutionPlan
 
-from tests.helpers.comparison import assert_matrix_equal, dataframe_to_matrix
+from tests.helpers.comparison import assert_matrix_equal, dataframe_to_matrix, sort_rows
 from tests.helpers.mock_executor import MockExecutor
 from tests.programs import discover
 
@@ -35,16 +44,47 @@ from tests.programs import discover
 # ---------------------------------------------------------------------------
 
 _PROGRAMS = discover()
-_PROGRAM_IDS = [name for name, _ in _PROGRAMS]
+_PROGRAM_IDS = tuple(name for name, _ in _PROGRAMS)
 
+# Cross-sheet reference such as ``filter_3!A2`` inside a formula.
+_SHEET_REF_RE = re.compile(r"(\w+_\d+)!")
 
+
+@functools.lru_cache(maxsize=None)
 def _run_program(mod):
-    """Execute a program module and return (result_df, source_data, plan)."""
+    """Execute a program module and return (result_df, source_data, plan).
+
+    Memoized per module so each program runs once per session no matter how
+    many tests use it; callers only read the returned objects.
+    """
     pr = mod.run()
     plan = pr.result._plan
     return pr.result, pr.source_data, plan
 
 
+@functools.lru_cache(maxsize=None)
+def _translate_program(mod):
+    """Translate a program's plan once per session and return the operations."""
+    _, source_data, plan = _run_program(mod)
+    return tuple(Translator().translate(plan, source_data=source_data))
+
+
+@functools.lru_cache(maxsize=None)
+def _execute_locally(mod):
+    """Replay a program's operations through LocalExecutor once per session.
+
+    Returns the main (last-created) sheet as read back from the executor.
+    Imported here so offline-only runs never load formualizer.
+    """
+    from fornero.executor import LocalExecutor
+
+    ops = _translate_program(mod)
+    executor = LocalExecutor()
+    executor.execute(ExecutionPlan.from_operations(ops), "Test Spreadsheet")
+    main_sheet = [o for o in ops if isinstance(o, CreateSheet)][-1].name
+    return executor.read_sheet(main_sheet)
+
+
 def _expected_output_columns(root_op, result_df):
     """Derive the expected output columns from the plan root.
 
@@ -52,10 +92,8 @@ def _expected_output_columns(root_op, result_df):
     semantics (ARCHITECTURE.md §Join: output schema is S(R₁) ∪ S(R₂) \\ {k₂}).
     Pandas keeps both key columns when left_on != right_on, so we reconcile here.
     """
-    from fornero.algebra.operations import Join as JoinOp
-
-    if isinstance(root_op, JoinOp):
-        right_key = root_op.right_on[0] if isinstance(root_op.right_on, list) else root_op.right_on
+    if isinstance(root_op, Join):
+        right_key = root_op.right_on[0]
         return [c for c in result_df.columns if c != right_key]
 
     return list(result_df.columns)
@@ -63,9 +101,7 @@ def _expected_output_columns(root_op, result_df):
 
 def _has_dynamic_headers(root_op):
     """True when the operation emits its own header row (QUERY, Pivot)."""
-    from fornero.algebra.operations import GroupBy as GroupByOp, Pivot as PivotOp
-
-    return isinstance(root_op, (GroupByOp, PivotOp))
+    return isinstance(root_op, (GroupBy, Pivot))
 
 
 # ---------------------------------------------------------------------------
@@ -73,30 +109,62 @@ def _has_dynamic_headers(root_op):
 # ---------------------------------------------------------------------------
 
 _FORMULA_SETTLE_SECS = 5
-_RATE_LIMIT_DELAY = 2.0
+_SETTLE_POLL_SECS = 0.25
+_MAX_RETRIES = 5
+_UPLOAD_WORKERS = 4
 
 
-def _a1_cell(row: int, col: int) -> str:
-    """Convert 1-indexed (row, col) to A1 notation (e.g. 2,3 -> 'C2')."""
+@functools.lru_cache(maxsize=1024)
+def _column_letters(col: int) -> str:
+    """Convert a 1-indexed column number to its letters (e.g. 28 -> 'AB').
+
+    Memoized because every uploaded range converts its corner columns again.
+    """
     col_str = ""
     c = col
     while c > 0:
         c -= 1
         col_str = chr(65 + (c % 26)) + col_str
         c //= 26
-    return f"{col_str}{row}"
+    return col_str
+
+
+def _a1_cell(row: int, col: int) -> str:
+    """Convert 1-indexed (row, col) to A1 notation (e.g. 2,3 -> 'C2')."""
+    return f"{_column_letters(col)}{row}"
+
+
+def _with_retry(fn, *args, retries=_MAX_RETRIES, **kwargs):
+    """Call a gspread method, backing off only when the API answers 429.
+
+    Waits for the server's ``Retry-After`` when it is given, and ``2**attempt``
+    seconds otherwise. Any other error, or a 429 on the last attempt, is
+    raised unchanged.
+    """
+    from gspread.exceptions import APIError
+
+    for attempt in range(retries + 1):
+        try:
+            return fn(*args, **kwargs)
+        except APIError as exc:
+            response = getattr(exc, "response", None)
+            if attempt == retries or getattr(response, "status_code", None) != 429:
+                raise
+            retry_after = response.headers.get("Retry-After", "")
+            time.sleep(float(retry_after) if retry_after.isdigit() else 2**attempt)
 
 
 def _execute_on_sheets(gc, operations, title):
     """Execute translator operations on a real Google Sheet.
 
     Mirrors the three-phase approach of SheetsExecutor (create → values →
-    formulas) and works with the translator's SpreadsheetOp output.
+    formulas), batching each sheet's writes into one request per phase, and
+    works with the translator's SpreadsheetOp output.
 
     Returns:
         (spreadsheet, main_sheet_name)
     """
-    spreadsheet = gc.create(title)
+    spreadsheet = _with_retry(gc.create, title)
     worksheets = {}
     main_sheet_name = None
     first_sheet = True
@@ -106,47 +174,84 @@ def _execute_on_sheets(gc, operations, title):
             continue
         if first_sheet:
             ws = spreadsheet.sheet1
-            ws.update_title(op.name)
-            ws.resize(rows=op.rows, cols=op.cols)
+            _with_retry(ws.update_title, op.name)
+            _with_retry(ws.resize, rows=op.rows, cols=op.cols)
             first_sheet = False
         else:
-            ws = spreadsheet.add_worksheet(
-                title=op.name, rows=op.rows, cols=op.cols
+            ws = _with_retry(
+                spreadsheet.add_worksheet, title=op.name, rows=op.rows, cols=op.cols
             )
         worksheets[op.name] = ws
         main_sheet_name = op.name
-        time.sleep(_RATE_LIMIT_DELAY)
 
+    value_updates = defaultdict(list)
+    formula_updates = defaultdict(list)
     for op in operations:
-        if not isinstance(op, SetValues):
-            continue
-        ws = worksheets[op.sheet]
-        if not op.values:
-            continue
-        r0 = op.row + 1
-        c0 = op.col + 1
-        r1 = r0 + len(op.values) - 1
-        c1 = c0 + len(op.values[0]) - 1
-        ws.update(values=op.values, range_name=f"{_a1_cell(r0, c0)}:{_a1_cell(r1, c1)}")
-        time.sleep(_RATE_LIMIT_DELAY)
+        if isinstance(op, SetValues) and op.values:
+            r0 = op.row + 1
+            c0 = op.col + 1
+            r1 = r0 + len(op.values) - 1
+            c1 = c0 + len(op.values[0]) - 1
+            value_updates[op.sheet].append(
+                {"range": f"{_a1_cell(r0, c0)}:{_a1_cell(r1, c1)}", "values": op.values}
+            )
 
-    for op in operations:
-        if not isinstance(op, SetFormula):
-            continue
-        ws = worksheets[op.sheet]
-        cell = _a1_cell(op.row + 1, op.col + 1)
-        formula = op.formula if op.formula.startswith("=") else f"={op.formula}"
-        ws.update(values=[[formula]], range_name=cell, raw=False)
-        time.sleep(_RATE_LIMIT_DELAY)
+    normalized = [
+        (op, op.formula if op.formula.startswith("=") else "=" + op.formula)
+        for op in operations
+        if isinstance(op, SetFormula)
+    ]
+    for op, formula in normalized:
+        formula_updates[op.sheet].append(
+            {"range": _a1_cell(op.row + 1, op.col + 1), "values": [[formula]]}
+        )
+
+    # One request per sheet and phase: values are written raw, formulas are
+    # parsed (USER_ENTERED), and all values land before any formula. Value
+    # uploads for distinct sheets are independent, so they run concurrently.
+    with ThreadPoolExecutor(max_workers=_UPLOAD_WORKERS) as pool:
+        futures = [
+            pool.submit(_with_retry, worksheets[sheet].batch_update, updates)
+            for sheet, updates in value_updates.items()
+        ]
+        for future in futures:
+            future.result()
+    for sheet, updates in formula_updates.items():
+        _with_retry(worksheets[sheet].batch_update, updates, raw=False)
 
     return spreadsheet, main_sheet_name
 
 
+def _read_settled_sheet(spreadsheet, sheet_name):
+    """Read a sheet's values once its formulas have produced data rows.
+
+    Each poll fetches the whole grid in one ``values_get`` round trip and is
+    repeated every ``_SETTLE_POLL_SECS`` until there is a data row and no cell
+    still shows ``Loading...``, or ``_FORMULA_SETTLE_SECS`` have passed. Rows
+    are padded to a rectangle, as ``get_all_values`` returns them.
+    """
+    quoted = "'" + sheet_name.replace("'", "''") + "'"
+    deadline = time.monotonic() + _FORMULA_SETTLE_SECS
+    while True:
+        response = _with_retry(spreadsheet.values_get, quoted)
+        rows = response.get("values", [])
+        width = max((len(row) for row in rows), default=0)
+        matrix = _trim_empty_rows([row + [""] * (width - len(row)) for row in rows])
+        settled = len(matrix) > 1 and not any("Loading..." in row for row in matrix)
+        if settled or time.monotonic() >= deadline:
+            return matrix
+        time.sleep(_SETTLE_POLL_SECS)
+
+
 def _trim_empty_rows(matrix):
-    """Remove trailing all-empty rows produced by over-allocated sheets."""
-    while matrix and all(cell == "" for cell in matrix[-1]):
-        matrix.pop()
-    return matrix
+    """Remove trailing all-empty rows produced by over-allocated sheets.
+
+    Rows must all have the same length.
+    """
+    if not matrix:
+        return matrix
+    filled = np.flatnonzero((np.asarray(matrix, dtype=object) != "").any(axis=1))
+    return matrix[: filled[-1] + 1] if len(filled) else []
 
 
 # ---------------------------------------------------------------------------
@@ -154,23 +259,44 @@ def _trim_empty_rows(matrix):
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="session")
+def gc():
+    """Authenticated gspread client, one per session (and so per xdist worker)."""
+    import gspread
+
+    try:
+        return _reuse_connections(gspread.service_account())
+    except Exception:
+        pass
+    try:
+        return _reuse_connections(gspread.oauth())
+    except Exception as exc:
+        pytest.skip(f"No Google Sheets credentials available: {exc}")
+
+
+def _reuse_connections(client):
+    """Give *client* a keep-alive HTTPS pool sized for the concurrent uploads.
+
+    With ``pool_block`` set, upload workers wait for a warm connection rather
+    than opening (and then discarding) an extra one, so each worker pays the
+    TLS handshake at most once per session.
+    """
+    from requests.adapters import HTTPAdapter
+
+    session = client.http_client.session
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, pool_block=True)
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return client
+
+
 @pytest.mark.slow
 class TestLiveCorrectness:
-    """Cell-by-cell verification: spreadsheet values must equal pandas output."""
-
-    @pytest.fixture(scope="class")
-    def gc(self):
-        """Session-wide authenticated gspread client."""
-        import gspread
+    """Cell-by-cell verification: spreadsheet values must equal pandas output.
 
-        try:
-            return gspread.service_account()
-        except Exception:
-            pass
-        try:
-            return gspread.oauth()
-        except Exception as exc:
-            pytest.skip(f"No Google Sheets credentials available: {exc}")
+    Every program writes its own spreadsheet, so the programs can run in
+    parallel with pytest-xdist (``-n auto``).
+    """
 
     @pytest.mark.parametrize("name, mod", _PROGRAMS, ids=_PROGRAM_IDS)
     def test_cell_values_match_pandas(self, name, mod, gc):
@@ -178,11 +304,11 @@ class TestLiveCorrectness:
         if getattr(mod, "UNSUPPORTED", False):
             pytest.skip(f"{name} uses an unsupported operation")
 
-        result, source_data, plan = _run_program(mod)
-        translator = Translator()
-        ops = translator.translate(plan, source_data=source_data)
+        result, _, plan = _run_program(mod)
+        ops = _translate_program(mod)
 
-        title = f"fornero_test_{name}"
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+        title = f"fornero_test_{name}_{worker}"
         spreadsheet = None
         try:
             try:
@@ -193,10 +319,7 @@ class TestLiveCorrectness:
 
             spreadsheet, main_sheet = _execute_on_sheets(gc, ops, title)
 
-            time.sleep(_FORMULA_SETTLE_SECS)
-
-            ws = spreadsheet.worksheet(main_sheet)
-            actual = _trim_empty_rows(ws.get_all_values())
+            actual = _read_settled_sheet(spreadsheet, main_sheet)
 
             expected_cols = _expected_output_columns(plan.root, result)
             expected_df = result[expected_cols]
@@ -205,10 +328,8 @@ class TestLiveCorrectness:
                 # QUERY / Pivot emit their own headers which may differ from
                 # the pandas column names.  Compare data rows only, sorted for
                 # order-independence.
-                expected_data = dataframe_to_matrix(expected_df, include_header=False)
-                actual_data = actual[1:] if actual else []
-                expected_data.sort(key=lambda r: tuple(str(v) for v in r))
-                actual_data.sort(key=lambda r: tuple(str(v) for v in r))
+                expected_data = sort_rows(dataframe_to_matrix(expected_df, include_header=False))
+                actual_data = sort_rows(actual[1:])
                 assert_matrix_equal(expected_data, actual_data)
             else:
                 expected_matrix = dataframe_to_matrix(expected_df, include_header=True)
@@ -227,130 +348,128 @@ class TestLiveCorrectness:
 # ---------------------------------------------------------------------------
 
 
-class TestOfflineCorrectness:
-    """Structural verification of translated spreadsheet operations."""
+class ProgramContext(NamedTuple):
+    """Everything the offline tests need about one program, computed once."""
 
-    @pytest.mark.parametrize("name, mod", _PROGRAMS, ids=_PROGRAM_IDS)
-    def test_program_runs_and_produces_plan(self, name, mod):
-        """Each program returns a DataFrame with a non-trivial logical plan."""
-        result, source_data, plan = _run_program(mod)
-        assert plan is not None
-        assert plan.root is not None
-        assert len(result) > 0, "Program produced an empty DataFrame"
+    name: str
+    mod: Any
+    result: Any
+    source_data: Any
+    plan: Any
+    ops: Optional[tuple]
+    executor: Optional[MockExecutor]
+    source_sheets: frozenset = frozenset()
+    derived_sheets: frozenset = frozenset()
+    last_sheet: Optional[str] = None
 
-    @pytest.mark.parametrize("name, mod", _PROGRAMS, ids=_PROGRAM_IDS)
-    def test_plan_explains_without_error(self, name, mod):
-        """plan.explain() should succeed for every program."""
-        _, _, plan = _run_program(mod)
-        explanation = plan.explain()
-        assert isinstance(explanation, str)
-        assert len(explanation) > 0
-
-    @pytest.mark.parametrize("name, mod", _PROGRAMS, ids=_PROGRAM_IDS)
-    def test_translation_produces_operations(self, name, mod):
-        """Translator.translate() should produce a non-empty operation list
-        (or raise UnsupportedOperationError for programs marked UNSUPPORTED)."""
-        result, source_data, plan = _run_program(mod)
+    @property
+    def local_sheet(self):
+        """Main sheet computed by LocalExecutor, evaluated on first access."""
+        return _execute_locally(self.mod)
 
-        if getattr(mod, "UNSUPPORTED", False):
-            pytest.skip(f"{name} uses an unsupported operation")
-
-        translator = Translator()
-        ops = translator.translate(plan, source_data=source_data)
-        assert len(ops) > 0, "Translator produced no operations"
 
-    @pytest.mark.parametrize("name, mod", _PROGRAMS, ids=_PROGRAM_IDS)
-    def test_operations_contain_create_sheet(self, name, mod):
-        """Every translated plan must create at least one sheet."""
-        if getattr(mod, "UNSUPPORTED", False):
-            pytest.skip(f"{name} uses an unsupported operation")
+@pytest.fixture(scope="session", params=_PROGRAMS, ids=_PROGRAM_IDS)
+def program_ctx(request):
+    """Run, translate and load each program into a MockExecutor once per session.
 
-        _, source_data, plan = _run_program(mod)
-        translator = Translator()
-        ops = translator.translate(plan, source_data=source_data)
+    The executor's sheet classifications are computed here so each test reads
+    them from the context instead of rescanning the operations. ``ops`` and
+    ``executor`` are None for programs marked UNSUPPORTED. Tests must treat the
+    shared executor as read-only.
+    """
+    name, mod = request.param
+    result, source_data, plan = _run_program(mod)
+    if getattr(mod, "UNSUPPORTED", False):
+        return ProgramContext(name, mod, result, source_data, plan, None, None)
+    ops = _translate_program(mod)
+    executor = MockExecutor()
+    executor.load(ops)
+    return ProgramContext(
+        name,
+        mod,
+        result,
+        source_data,
+        plan,
+        ops,
+        executor,
+        source_sheets=frozenset(executor.source_sheets()),
+        derived_sheets=frozenset(executor.derived_sheets()),
+        last_sheet=executor.last_sheet_name(),
+    )
+
+
+def _require_supported(ctx):
+    if ctx.executor is None:
+        pytest.skip(f"{ctx.name} uses an unsupported operation")
 
-        executor = MockExecutor()
-        executor.load(ops)
-        assert executor.num_sheets >= 1
 
-    @pytest.mark.parametrize("name, mod", _PROGRAMS, ids=_PROGRAM_IDS)
-    def test_source_sheets_contain_static_data(self, name, mod):
-        """Source nodes must produce sheets with SetValues (static data)."""
-        if getattr(mod, "UNSUPPORTED", False):
-            pytest.skip(f"{name} uses an unsupported operation")
+class TestOfflineCorrectness:
+    """Structural verification of translated spreadsheet operations.
 
-        _, source_data, plan = _run_program(mod)
-        translator = Translator()
-        ops = translator.translate(plan, source_data=source_data)
+    All checks for a program run as subtests of one item, so the suite has one
+    test per program rather than one per (check, program) pair.
+    """
 
-        executor = MockExecutor()
-        executor.load(ops)
+    def test_offline_checks(self, program_ctx, subtests):
+        with subtests.test("program runs and produces plan"):
+            assert program_ctx.plan is not None
+            assert program_ctx.plan.root is not None
+            assert len(program_ctx.result) > 0, "Program produced an empty DataFrame"
 
-        src_sheets = executor.source_sheets()
-        assert len(src_sheets) >= 1, "No source sheets found"
-        for sheet_name in src_sheets:
-            values = executor.values_for(sheet_name)
-            assert len(values) >= 2, (
-                f"Source sheet '{sheet_name}' should have header + data SetValues"
-            )
+        with subtests.test("plan explains without error"):
+            explanation = program_ctx.plan.explain()
+            assert isinstance(explanation, str)
+            assert len(explanation) > 0
 
-    @pytest.mark.parametrize("name, mod", _PROGRAMS, ids=_PROGRAM_IDS)
-    def test_derived_sheets_use_formulas_not_values(self, name, mod):
-        """Non-source sheets must use SetFormula for data, never SetValues
-        (except for headers at row 0)."""
-        if getattr(mod, "UNSUPPORTED", False):
-            pytest.skip(f"{name} uses an unsupported operation")
+        _require_supported(program_ctx)
+        executor = program_ctx.executor
 
-        _, source_data, plan = _run_program(mod)
-        translator = Translator()
-        ops = translator.translate(plan, source_data=source_data)
+        with subtests.test("translation produces operations"):
+            assert len(program_ctx.ops) > 0, "Translator produced no operations"
 
-        executor = MockExecutor()
-        executor.load(ops)
+        with subtests.test("operations contain create sheet"):
+            assert executor.num_sheets >= 1
 
-        for sheet_name in executor.derived_sheets():
-            for sv in executor.values_for(sheet_name):
-                assert sv.row == 0, (
-                    f"Derived sheet '{sheet_name}' has SetValues at row {sv.row} "
-                    "(only row-0 headers are permitted; data must use SetFormula)"
+        with subtests.test("source sheets contain static data"):
+            assert len(program_ctx.source_sheets) >= 1, "No source sheets found"
+            for sheet_name in program_ctx.source_sheets:
+                values = executor.values_for(sheet_name)
+                assert len(values) >= 2, (
+                    f"Source sheet '{sheet_name}' should have header + data SetValues"
                 )
 
-    @pytest.mark.parametrize("name, mod", _PROGRAMS, ids=_PROGRAM_IDS)
-    def test_headers_match_output_schema(self, name, mod):
-        """The last-created sheet's headers should match the result DataFrame columns."""
-        if getattr(mod, "UNSUPPORTED", False):
-            pytest.skip(f"{name} uses an unsupported operation")
-
-        result, source_data, plan = _run_program(mod)
-
-        if _has_dynamic_headers(plan.root):
-            pytest.skip("GroupBy/QUERY and Pivot emit dynamic headers")
-
-        translator = Translator()
-        ops = translator.translate(plan, source_data=source_data)
-
-        executor = MockExecutor()
-        executor.load(ops)
+        with subtests.test("derived sheets use formulas, not values"):
+            # Only row-0 headers may be SetValues on a derived sheet.
+            for sheet_name in program_ctx.derived_sheets:
+                for sv in executor.values_for(sheet_name):
+                    assert sv.row == 0, (
+                        f"Derived sheet '{sheet_name}' has SetValues at row {sv.row} "
+                        "(only row-0 headers are permitted; data must use SetFormula)"
+                    )
+
+        with subtests.test("headers match output schema"):
+            plan = program_ctx.plan
+            if _has_dynamic_headers(plan.root):
+                pytest.skip("GroupBy/QUERY and Pivot emit dynamic headers")
 
-        output_sheet = executor.last_sheet_name()
-        assert output_sheet is not None
+            output_sheet = program_ctx.last_sheet
+            assert output_sheet is not None
 
-        headers = executor.headers_for(output_sheet)
-        if headers is not None:
-            expected_columns = _expected_output_columns(plan.root, result)
-            assert headers == expected_columns, (
-                f"Header mismatch on sheet '{output_sheet}': "
-                f"expected {expected_columns}, got {headers}"
-            )
+            headers = executor.headers_for(output_sheet)
+            if headers is not None:
+                expected_columns = _expected_output_columns(plan.root, program_ctx.result)
+                assert headers == expected_columns, (
+                    f"Header mismatch on sheet '{output_sheet}': "
+                    f"expected {expected_columns}, got {headers}"
+                )
 
 
 class TestOfflineFormulaPatterns:
     """Verify that specific operations produce the expected formula functions."""
 
     def _translate(self, mod):
-        result, source_data, plan = _run_program(mod)
-        translator = Translator()
-        ops = translator.translate(plan, source_data=source_data)
+        result, _, _ = _run_program(mod)
+        ops = _translate_program(mod)
         executor = MockExecutor()
         executor.load(ops)
         return executor, result
@@ -415,9 +534,7 @@ class TestOfflineMultiStep:
     """Verify multi-operation pipelines produce multiple sheets."""
 
     def _translate(self, mod):
-        result, source_data, plan = _run_program(mod)
-        translator = Translator()
-        ops = translator.translate(plan, source_data=source_data)
+        ops = _translate_program(mod)
         executor = MockExecutor()
         executor.load(ops)
         return executor
@@ -447,9 +564,7 @@ class TestOfflineMultiStep:
     def test_cross_sheet_references_are_consistent(self):
         """Formulas referencing other sheets must only reference sheets that exist."""
         from tests.programs import p09_select_then_sort as mod
-        _, source_data, plan = _run_program(mod)
-        translator = Translator()
-        ops = translator.translate(plan, source_data=source_data)
+        ops = _translate_program(mod)
 
         executor = MockExecutor()
         executor.load(ops)
@@ -457,8 +572,7 @@ class TestOfflineMultiStep:
 
         for formula_op in executor.all_formulas():
             formula_str = formula_op.formula
-            refs = re.findall(r"(\w+_\d+)!", formula_str)
-            for ref in refs:
+            for ref in _SHEET_REF_RE.findall(formula_str):
                 assert ref in known_sheets, (
                     f"Formula references unknown sheet '{ref}': {formula_str}"
                 )
@@ -472,34 +586,18 @@ class TestLocalCorrectness:
     network access is required.
     """
 
-    @pytest.mark.parametrize("name, mod", _PROGRAMS, ids=_PROGRAM_IDS)
-    def test_cell_values_match_pandas(self, name, mod):
-        from fornero.executor import LocalExecutor
-        from fornero.algebra.operations import Pivot
-
-        if getattr(mod, "UNSUPPORTED", False):
-            pytest.skip(f"{name} uses an unsupported operation")
-
-        result, source_data, plan = _run_program(mod)
-
-        translator = Translator()
-        ops = translator.translate(plan, source_data=source_data)
-
-        executor = LocalExecutor()
-        execution_plan = ExecutionPlan.from_operations(ops)
-        executor.execute(execution_plan, "Test Spreadsheet")
+    def test_cell_values_match_pandas(self, program_ctx):
+        _require_supported(program_ctx)
 
-        main_sheet = [o for o in ops if isinstance(o, CreateSheet)][-1].name
-        actual = executor.read_sheet(main_sheet)
+        result, plan = program_ctx.result, program_ctx.plan
+        actual = program_ctx.local_sheet
 
         expected_cols = _expected_output_columns(plan.root, result)
         expected_df = result[expected_cols]
 
         if _has_dynamic_headers(plan.root):
-            expected_data = dataframe_to_matrix(expected_df, include_header=False)
-            actual_data = actual[1:] if actual else []
-            expected_data.sort(key=lambda r: tuple(str(v) for v in r))
-            actual_data.sort(key=lambda r: tuple(str(v) for v in r))
+            expected_data = sort_rows(dataframe_to_matrix(expected_df, include_header=False))
+            actual_data = sort_rows(actual[1:])
             assert_matrix_equal(expected_data, actual_data)
         else:
             expected_matrix = dataframe_to_matrix(expected_df, include_header=True)
@@ -511,7 +609,6 @@ class TestUnsupportedOperations:
 
     def test_pivot_produces_two_sheet_strategy(self):
         """Pivot translation should produce a helper sheet and output sheet."""
-        from fornero.algebra.operations import Pivot, Source
         source = Source(source_id="test", schema=["dept", "quarter", "revenue"])
         pivot = Pivot(
             index="dept",
@@ -519,7 +616,6 @@ class TestUnsupportedOperations:
             values="revenue",
             inputs=[source],
         )
-        from fornero.algebra import LogicalPlan
         plan = LogicalPlan(pivot)
 
         translator = Translator()
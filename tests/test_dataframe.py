@@ -11,64 +11,156 @@ These tests verify:
 No external dependencies (no API calls, no real filesystem).
 """
 
+import gc
+import weakref
+
+import numpy as np
 import pandas as pd
+import pytest
+
 import fornero
 from fornero import DataFrame, LogicalPlan
 from fornero.algebra import Source, Select, Filter, Sort, Limit, GroupBy, Join, WithColumn, Union
 from fornero.algebra.expressions import BinaryOp, Column, Literal
 
 
+# Shared frames are built once per module. Tracked operations return new frames
+# (and new plans), so tests can use these without copying.
+
+
+@pytest.fixture(scope="module")
+def small_df():
+    return DataFrame({'a': np.arange(1, 5), 'b': np.arange(5, 9)})
+
+
+@pytest.fixture(scope="module")
+def filtered_mask(small_df):
+    """The ``a > 2`` mask over ``small_df``, computed once and reused."""
+    return small_df['a'] > 2
+
+
+@pytest.fixture(scope="module")
+def abc_df():
+    return DataFrame({'a': np.arange(1, 3), 'b': np.arange(3, 5), 'c': np.arange(5, 7)})
+
+
+@pytest.fixture(scope="module")
+def unsorted_df():
+    return DataFrame({'x': np.array([3, 1, 2])})
+
+
+@pytest.fixture(scope="module")
+def category_df():
+    return DataFrame({'category': ['A', 'B', 'A'], 'amount': np.array([10, 20, 30])})
+
+
+@pytest.fixture(scope="module")
+def join_frames():
+    left = DataFrame({'id': np.arange(1, 3), 'x': np.array([10, 20])})
+    right = DataFrame({'id': np.arange(1, 3), 'y': np.array([30, 40])})
+    return left, right
+
+
+@pytest.fixture(scope="module")
+def concat_frames():
+    return DataFrame({'a': np.arange(1, 3)}), DataFrame({'a': np.arange(3, 5)})
+
+
+@pytest.fixture
+def plan_only():
+    """Trace operations without executing them in pandas."""
+    token = fornero.LAZY_MODE.set(True)
+    yield
+    fornero.LAZY_MODE.reset(token)
+
+
 class TestDataFrameConstruction:
     """Tests for Task 2: fornero.DataFrame subclass construction."""
 
     def test_construction_from_dict_attaches_source_plan(self):
         """Constructing DataFrame from dict attaches LogicalPlan with Source root."""
-        df = DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]})
+        df = DataFrame({'a': np.arange(1, 4), 'b': np.arange(4, 7)})
 
-        assert hasattr(df, '_plan')
+        assert df._plan is not None
         assert isinstance(df._plan, LogicalPlan)
         assert isinstance(df._plan.root, Source)
         assert df._plan.root.schema == ['a', 'b']
 
+    def test_construction_from_dict_of_arrays_copies_like_pandas(self):
+        """A dict of arrays is copied, as in pandas, unless copy=False is requested."""
+        values = np.arange(4)
+
+        df = DataFrame({'a': values})
+        df.loc[0, 'a'] = 99
+        assert values[0] == 0
+        shared = DataFrame({'a': values}, copy=False)
+        assert np.shares_memory(shared['a'].to_numpy(), values)
+
     def test_construction_from_pandas_df_preserves_data_and_attaches_plan(self):
         """Constructing from pandas DataFrame preserves data and attaches fresh plan."""
-        pd_df = pd.DataFrame({'x': [10, 20], 'y': [30, 40]})
+        pd_df = pd.DataFrame({'x': np.array([10, 20]), 'y': np.array([30, 40])})
         fornero_df = DataFrame(pd_df)
 
         # Data is preserved
         assert list(fornero_df.columns) == ['x', 'y']
         assert len(fornero_df) == 2
-        assert fornero_df['x'].tolist() == [10, 20]
+        assert np.array_equal(fornero_df['x'].to_numpy(), [10, 20])
 
         # Plan is attached
-        assert hasattr(fornero_df, '_plan')
+        assert fornero_df._plan is not None
         assert isinstance(fornero_df._plan, LogicalPlan)
         assert isinstance(fornero_df._plan.root, Source)
 
-    def test_plan_survives_slicing(self):
+    def test_identical_constructions_share_source_node(self):
+        """Frames with the same source_id and columns share one interned Source."""
+        first = DataFrame({'a': np.arange(1, 4)})
+        second = DataFrame({'a': np.arange(4, 6)})
+        other = DataFrame({'b': np.array([1])})
+
+        assert first._plan.root is second._plan.root
+        assert first._plan.root is not other._plan.root
+        assert DataFrame({'a': np.array([1])}, source_id='t')._plan.root is not first._plan.root
+
+    def test_wrapping_tracked_frame_keeps_its_plan(self, small_df, filtered_mask):
+        """DataFrame(tracked) keeps the tracked plan; DataFrame(pandas) gets a Source."""
+        filtered = small_df[filtered_mask]
+        assert DataFrame(filtered)._plan is filtered._plan
+
+        wrapped = DataFrame(pd.DataFrame({'a': np.array([1])}))
+        assert isinstance(wrapped._plan.root, Source)
+
+    def test_plan_survives_slicing(self, small_df):
         """_plan attribute survives pandas operations via _metadata propagation."""
-        df = DataFrame({'a': [1, 2, 3, 4], 'b': [5, 6, 7, 8]})
+        df = small_df
         original_plan_root_type = type(df._plan.root)
 
         # Slicing should preserve the plan
         sliced = df.iloc[1:3]
 
-        assert hasattr(sliced, '_plan')
+        assert sliced._plan is not None
         assert isinstance(sliced._plan, LogicalPlan)
         # The plan root type should be preserved (Source in this case)
         assert isinstance(sliced._plan.root, original_plan_root_type)
 
-    def test_plan_survives_copying(self):
+    def test_propagated_plan_is_shared_not_copied(self, small_df):
+        """Slices and copies share the source frame's plan object."""
+        import copy
+
+        assert small_df.iloc[1:3]._plan is small_df._plan
+        assert small_df.copy()._plan is small_df._plan
+        assert copy.deepcopy(small_df)._plan is small_df._plan
+
+    def test_plan_survives_copying(self, small_df):
         """_plan attribute survives copy operations."""
-        df = DataFrame({'a': [1, 2, 3]})
+        df = small_df
         copied = df.copy()
 
-        assert hasattr(copied, '_plan')
+        assert copied._plan is not None
         assert isinstance(copied._plan, LogicalPlan)
 
-    def test_to_spreadsheet_plan_exists(self):
+    def test_to_spreadsheet_plan_exists(self, small_df):
         """to_spreadsheet_plan() method exists and is callable."""
-        df = DataFrame({'a': [1, 2, 3]})
+        df = small_df
 
         # Method should exist
         assert hasattr(df, 'to_spreadsheet_plan')
@@ -83,11 +175,11 @@ class TestForneroInitReexports:
 
     def test_import_fornero_dataframe_produces_fornero_dataframe(self):
         """import fornero as pd; pd.DataFrame(...) produces fornero.DataFrame."""
-        df = fornero.DataFrame({'a': [1, 2, 3]})
+        df = fornero.DataFrame({'a': np.arange(1, 4)})
 
         assert isinstance(df, DataFrame)
         assert not isinstance(df, pd.DataFrame) or isinstance(df, DataFrame)
-        assert hasattr(df, '_plan')
+        assert df._plan is not None
 
     def test_read_csv_returns_fornero_dataframe_with_source(self):
         """fornero.read_csv (stubbed) returns fornero.DataFrame with Source node."""
@@ -99,30 +191,39 @@ class TestForneroInitReexports:
         df = fornero.read_csv(csv_buffer)
 
         assert isinstance(df, DataFrame)
-        assert hasattr(df, '_plan')
+        assert df._plan is not None
+        assert isinstance(df._plan.root, Source)
+        assert df._plan.root.schema == ['a', 'b', 'c']
+
+    def test_lazy_read_csv_parses_only_the_header(self):
+        """read_csv(lazy=True) builds the Source schema without reading any rows."""
+        import io
+        csv_buffer = io.StringIO("a,b,c\n1,2,3\n4,5,6")
+
+        df = fornero.read_csv(csv_buffer, lazy=True)
+
         assert isinstance(df._plan.root, Source)
         assert df._plan.root.schema == ['a', 'b', 'c']
+        assert len(df) == 0
 
-    def test_merge_returns_tracked_frame(self):
+    def test_merge_returns_tracked_frame(self, join_frames):
         """fornero.merge returns a fornero.DataFrame with Join node."""
-        left = DataFrame({'id': [1, 2], 'x': [10, 20]})
-        right = DataFrame({'id': [1, 2], 'y': [30, 40]})
+        left, right = join_frames
 
         result = fornero.merge(left, right, on='id')
 
         assert isinstance(result, DataFrame)
-        assert hasattr(result, '_plan')
+        assert result._plan is not None
         assert isinstance(result._plan.root, Join)
 
-    def test_concat_returns_tracked_frame(self):
+    def test_concat_returns_tracked_frame(self, concat_frames):
         """fornero.concat returns a fornero.DataFrame with appropriate tracking."""
-        df1 = DataFrame({'a': [1, 2]})
-        df2 = DataFrame({'a': [3, 4]})
+        df1, df2 = concat_frames
 
         result = fornero.concat([df1, df2])
 
         assert isinstance(result, DataFrame)
-        assert hasattr(result, '_plan')
+        assert result._plan is not None
         # For two DataFrames concatenated vertically, should have Union node
         assert isinstance(result._plan.root, Union)
 
@@ -130,9 +231,10 @@ class TestForneroInitReexports:
 class TestOperationTracer:
     """Tests for Task 4: Operation tracer."""
 
+    @pytest.mark.usefixtures("plan_only")
     def test_filter_appends_filter_node(self):
         """Filter operation appends Filter node to plan."""
-        df = DataFrame({'age': [20, 30, 40]})
+        df = DataFrame({'age': np.array([20, 30, 40])})
 
         # Apply filter via boolean indexing
         result = df[df['age'] > 25]
@@ -141,9 +243,10 @@ class TestOperationTracer:
         assert len(result._plan.root.inputs) == 1
         assert isinstance(result._plan.root.inputs[0], Source)
 
-    def test_select_appends_select_node(self):
+    @pytest.mark.usefixtures("plan_only")
+    def test_select_appends_select_node(self, abc_df):
         """Column selection appends Select node to plan."""
-        df = DataFrame({'a': [1, 2], 'b': [3, 4], 'c': [5, 6]})
+        df = abc_df
 
         result = df[['a', 'b']]
 
@@ -151,27 +254,30 @@ class TestOperationTracer:
         assert result._plan.root.columns == ['a', 'b']
         assert len(result._plan.root.inputs) == 1
 
-    def test_sort_appends_sort_node(self):
+    @pytest.mark.usefixtures("plan_only")
+    def test_sort_appends_sort_node(self, unsorted_df):
         """Sort operation appends Sort node to plan."""
-        df = DataFrame({'x': [3, 1, 2]})
+        df = unsorted_df
 
         result = df.sort_values('x')
 
         assert isinstance(result._plan.root, Sort)
         assert result._plan.root.keys == [('x', 'asc')]
 
-    def test_sort_descending(self):
+    @pytest.mark.usefixtures("plan_only")
+    def test_sort_descending(self, unsorted_df):
         """Sort with descending direction captures direction correctly."""
-        df = DataFrame({'x': [1, 2, 3]})
+        df = unsorted_df
 
         result = df.sort_values('x', ascending=False)
 
         assert isinstance(result._plan.root, Sort)
         assert result._plan.root.keys == [('x', 'desc')]
 
-    def test_head_appends_limit_node(self):
+    @pytest.mark.usefixtures("plan_only")
+    def test_head_appends_limit_node(self, small_df):
         """head() appends Limit node with end='head'."""
-        df = DataFrame({'a': [1, 2, 3, 4, 5]})
+        df = small_df
 
         result = df.head(3)
 
@@ -179,9 +285,10 @@ class TestOperationTracer:
         assert result._plan.root.count == 3
         assert result._plan.root.end == 'head'
 
-    def test_tail_appends_limit_node(self):
+    @pytest.mark.usefixtures("plan_only")
+    def test_tail_appends_limit_node(self, small_df):
         """tail() appends Limit node with end='tail'."""
-        df = DataFrame({'a': [1, 2, 3, 4, 5]})
+        df = small_df
 
         result = df.tail(2)
 
@@ -189,9 +296,9 @@ class TestOperationTracer:
         assert result._plan.root.count == 2
         assert result._plan.root.end == 'tail'
 
-    def test_groupby_agg_appends_groupby_node(self):
+    def test_groupby_agg_appends_groupby_node(self, category_df):
         """groupby().agg() appends GroupBy node with aggregations."""
-        df = DataFrame({'category': ['A', 'B', 'A'], 'amount': [10, 20, 30]})
+        df = category_df
 
         result = df.groupby('category').agg({'amount': 'sum'})
 
@@ -199,31 +306,32 @@ class TestOperationTracer:
         assert result._plan.root.keys == ['category']
         assert len(result._plan.root.aggregations) > 0
 
-    def test_merge_appends_join_node(self):
+    def test_merge_appends_join_node(self, join_frames):
         """merge() appends Join node to plan."""
-        left = DataFrame({'id': [1, 2], 'x': [10, 20]})
-        right = DataFrame({'id': [1, 2], 'y': [30, 40]})
+        left, right = join_frames
 
         result = left.merge(right, on='id', how='left')
 
         assert isinstance(result._plan.root, Join)
         assert result._plan.root.join_type == 'left'
 
-    def test_assign_appends_withcolumn_node(self):
+    @pytest.mark.usefixtures("plan_only")
+    def test_assign_appends_withcolumn_node(self, small_df):
         """assign() appends WithColumn node(s) to plan."""
-        df = DataFrame({'a': [1, 2], 'b': [3, 4]})
+        df = small_df
 
         result = df.assign(c=5)
 
         assert isinstance(result._plan.root, WithColumn)
         assert result._plan.root.column == 'c'
 
-    def test_chaining_operations_produces_nested_plan(self):
+    @pytest.mark.usefixtures("plan_only")
+    def test_chaining_operations_produces_nested_plan(self, small_df, filtered_mask):
         """Chaining operations produces plan with nested nodes in correct order."""
-        df = DataFrame({'a': [1, 2, 3, 4], 'b': [5, 6, 7, 8]})
+        df = small_df
 
         # Chain: filter -> select
-        result = df[df['a'] > 2][['a', 'b']]
+        result = df[filtered_mask][['a', 'b']]
 
         # Root should be Select
         assert isinstance(result._plan.root, Select)
@@ -232,9 +340,10 @@ class TestOperationTracer:
         # Filter's input should be Source
         assert isinstance(result._plan.root.inputs[0].inputs[0], Source)
 
+    @pytest.mark.usefixtures("plan_only")
     def test_complex_chain_preserves_order(self):
         """Complex chain preserves operation order in plan."""
-        df = DataFrame({'x': [3, 1, 4, 2], 'y': [10, 20, 30, 40]})
+        df = DataFrame({'x': np.array([3, 1, 4, 2]), 'y': np.array([10, 20, 30, 40])})
 
         # Chain: filter -> sort -> head
         result = df[df['x'] > 1].sort_values('x').head(2)
@@ -248,18 +357,20 @@ class TestOperationTracer:
         # Base should be Source
         assert isinstance(result._plan.root.inputs[0].inputs[0].inputs[0], Source)
 
+    @pytest.mark.usefixtures("plan_only")
     def test_tracer_captures_column_names(self):
         """Tracer captures column names faithfully."""
-        df = DataFrame({'name': ['Alice', 'Bob'], 'age': [25, 30]})
+        df = DataFrame({'name': ['Alice', 'Bob'], 'age': np.array([25, 30])})
 
         result = df[['name']]
 
         assert isinstance(result._plan.root, Select)
         assert result._plan.root.columns == ['name']
 
-    def test_tracer_captures_sort_directions(self):
+    @pytest.mark.usefixtures("plan_only")
+    def test_tracer_captures_sort_directions(self, small_df):
         """Tracer captures sort directions for multiple columns."""
-        df = DataFrame({'a': [1, 2], 'b': [3, 4]})
+        df = small_df
 
         result = df.sort_values(['a', 'b'], ascending=[True, False])
 
@@ -268,32 +379,42 @@ class TestOperationTracer:
 
     def test_tracer_captures_join_keys(self):
         """Tracer captures join keys correctly."""
-        left = DataFrame({'id': [1, 2], 'x': [10, 20]})
-        right = DataFrame({'user_id': [1, 2], 'y': [30, 40]})
+        left = DataFrame({'id': np.arange(1, 3), 'x': np.array([10, 20])})
+        right = DataFrame({'user_id': np.arange(1, 3), 'y': np.array([30, 40])})
 
         result = left.merge(right, left_on='id', right_on='user_id')
 
         assert isinstance(result._plan.root, Join)
-        assert result._plan.root.left_on == ['id']
-        assert result._plan.root.right_on == ['user_id']
+        assert result._plan.root.left_on == ('id',)
+        assert result._plan.root.right_on == ('user_id',)
+
+    def test_plan_only_mode_skips_pandas_execution(self, small_df, filtered_mask, plan_only):
+        """With LAZY_MODE set, tracked ops return empty frames carrying the plan."""
+        result = small_df[filtered_mask][['a']].sort_values('a').head(1)
 
-    def test_operations_execute_eagerly_in_pandas(self):
+        assert len(result) == 0
+        assert list(result.columns) == ['a']
+        assert isinstance(result._plan.root, Limit)
+        assert isinstance(result._plan.root.inputs[0], Sort)
+        assert isinstance(result._plan.root.inputs[0].inputs[0], Select)
+
+    def test_operations_execute_eagerly_in_pandas(self, small_df, filtered_mask):
         """Operations execute eagerly in pandas (dual-mode invariant)."""
-        df = DataFrame({'a': [1, 2, 3, 4], 'b': [5, 6, 7, 8]})
+        df = small_df
 
         # Filter operation
-        result = df[df['a'] > 2]
+        result = df[filtered_mask]
 
         # Verify pandas execution
         assert len(result) == 2  # Only rows where a > 2
-        assert result['a'].tolist() == [3, 4]
+        assert np.array_equal(result['a'].to_numpy(), [3, 4])
 
         # Verify plan tracking
         assert isinstance(result._plan.root, Filter)
 
-    def test_select_executes_and_tracks(self):
+    def test_select_executes_and_tracks(self, abc_df):
         """Select operation executes in pandas and tracks in plan."""
-        df = DataFrame({'a': [1, 2], 'b': [3, 4], 'c': [5, 6]})
+        df = abc_df
 
         result = df[['a', 'c']]
 
@@ -305,27 +426,27 @@ class TestOperationTracer:
         assert isinstance(result._plan.root, Select)
         assert result._plan.root.columns == ['a', 'c']
 
-    def test_sort_executes_and_tracks(self):
+    def test_sort_executes_and_tracks(self, unsorted_df):
         """Sort operation executes in pandas and tracks in plan."""
-        df = DataFrame({'x': [3, 1, 2]})
+        df = unsorted_df
 
         result = df.sort_values('x')
 
         # Pandas execution
-        assert result['x'].tolist() == [1, 2, 3]
+        assert np.array_equal(result['x'].to_numpy(), [1, 2, 3])
 
         # Plan tracking
         assert isinstance(result._plan.root, Sort)
 
-    def test_head_executes_and_tracks(self):
+    def test_head_executes_and_tracks(self, small_df):
         """head() executes in pandas and tracks in plan."""
-        df = DataFrame({'a': [1, 2, 3, 4, 5]})
+        df = small_df
 
         result = df.head(3)
 
         # Pandas execution
         assert len(result) == 3
-        assert result['a'].tolist() == [1, 2, 3]
+        assert np.array_equal(result['a'].to_numpy(), [1, 2, 3])
 
         # Plan tracking
         assert isinstance(result._plan.root, Limit)
@@ -335,18 +456,18 @@ class TestOperationTracer:
 class TestGroupByTracking:
     """Tests for GroupBy operation tracking."""
 
-    def test_groupby_sum_tracks_aggregation(self):
+    def test_groupby_sum_tracks_aggregation(self, category_df):
         """groupby().sum() tracks sum aggregation."""
-        df = DataFrame({'category': ['A', 'B', 'A'], 'amount': [10, 20, 30]})
+        df = category_df
 
         result = df.groupby('category').sum()
 
         assert isinstance(result._plan.root, GroupBy)
         assert result._plan.root.keys == ['category']
 
-    def test_groupby_mean_tracks_aggregation(self):
+    def test_groupby_mean_tracks_aggregation(self, category_df):
         """groupby().mean() tracks mean aggregation."""
-        df = DataFrame({'category': ['A', 'B', 'A'], 'value': [10, 20, 30]})
+        df = category_df
 
         result = df.groupby('category').mean()
 
@@ -355,7 +476,7 @@ class TestGroupByTracking:
 
     def test_groupby_multiple_keys(self):
         """groupby() with multiple keys captures all keys."""
-        df = DataFrame({'a': [1, 1, 2], 'b': ['x', 'y', 'x'], 'c': [10, 20, 30]})
+        df = DataFrame({'a': np.array([1, 1, 2]), 'b': ['x', 'y', 'x'], 'c': np.array([10, 20, 30])})
 
         result = df.groupby(['a', 'b']).sum()
 
@@ -366,30 +487,40 @@ class TestGroupByTracking:
 class TestMergeTracking:
     """Tests for merge/join operation tracking."""
 
-    def test_merge_inner_join(self):
+    def test_merge_inner_join(self, join_frames):
         """merge with how='inner' tracks correctly."""
-        left = DataFrame({'id': [1, 2], 'x': [10, 20]})
-        right = DataFrame({'id': [1, 2], 'y': [30, 40]})
+        left, right = join_frames
 
         result = left.merge(right, on='id', how='inner')
 
         assert isinstance(result._plan.root, Join)
         assert result._plan.root.join_type == 'inner'
 
-    def test_merge_left_join(self):
+    def test_merge_left_join(self, join_frames):
         """merge with how='left' tracks correctly."""
-        left = DataFrame({'id': [1, 2], 'x': [10, 20]})
-        right = DataFrame({'id': [1, 2], 'y': [30, 40]})
+        left, right = join_frames
 
         result = left.merge(right, on='id', how='left')
 
         assert isinstance(result._plan.root, Join)
         assert result._plan.root.join_type == 'left'
 
-    def test_merge_with_pandas_dataframe(self):
+    def test_repeated_merge_reuses_join_node(self, join_frames):
+        """Merging the same inputs with the same parameters reuses one Join node."""
+        left, right = join_frames
+
+        first = left.merge(right, on='id', how='inner')._plan.root
+        again = fornero.merge(left, right, on='id', how='inner')._plan.root
+        other = left.merge(right, on='id', how='left')._plan.root
+
+        assert again is first
+        assert other is not first
+        assert other.join_type == 'left'
+
+    def test_merge_with_pandas_dataframe(self, join_frames):
         """merge with regular pandas DataFrame creates Source for right side."""
-        left = DataFrame({'id': [1, 2], 'x': [10, 20]})
-        right = pd.DataFrame({'id': [1, 2], 'y': [30, 40]})
+        left, _ = join_frames
+        right = pd.DataFrame({'id': np.arange(1, 3), 'y': np.array([30, 40])})
 
         result = left.merge(right, on='id')
 
@@ -403,7 +534,7 @@ class TestAssignTracking:
 
     def test_assign_single_column(self):
         """assign with single column tracks WithColumn."""
-        df = DataFrame({'a': [1, 2]})
+        df = DataFrame({'a': np.arange(1, 3)})
 
         result = df.assign(b=10)
 
@@ -412,7 +543,7 @@ class TestAssignTracking:
 
     def test_assign_multiple_columns_chains_operations(self):
         """assign with multiple columns chains WithColumn operations."""
-        df = DataFrame({'a': [1, 2]})
+        df = DataFrame({'a': np.arange(1, 3)})
 
         result = df.assign(b=10, c=20)
 
@@ -425,34 +556,52 @@ class TestAssignTracking:
 class TestConcatTracking:
     """Tests for concat operation tracking."""
 
-    def test_concat_two_dataframes_creates_union(self):
+    def test_concat_two_dataframes_creates_union(self, concat_frames):
         """concat of two DataFrames creates Union node."""
-        df1 = DataFrame({'a': [1, 2]})
-        df2 = DataFrame({'a': [3, 4]})
+        df1, df2 = concat_frames
 
         result = fornero.concat([df1, df2])
 
         assert isinstance(result._plan.root, Union)
         assert len(result._plan.root.inputs) == 2
 
-    def test_concat_preserves_data(self):
+    def test_repeated_concat_reuses_union_node(self, concat_frames):
+        """Concatenating the same two frames again reuses one Union node."""
+        df1, df2 = concat_frames
+        filtered = df2[df2['a'] > 3]
+
+        first = fornero.concat([df1, filtered])._plan.root
+        assert fornero.concat([df1, filtered])._plan.root is first
+        assert fornero.concat([filtered, df1])._plan.root is not first
+
+    def test_concat_node_cache_does_not_retain_plans(self, concat_frames):
+        """The reuse cache drops a Union node once no frame refers to it."""
+        df1, df2 = concat_frames
+        result = fornero.concat([df1, df2])
+        ref = weakref.ref(result._plan.root)
+
+        del result
+        gc.collect()
+
+        assert ref() is None
+
+    def test_concat_preserves_data(self, concat_frames):
         """concat executes correctly in pandas."""
-        df1 = DataFrame({'a': [1, 2]})
-        df2 = DataFrame({'a': [3, 4]})
+        df1, df2 = concat_frames
 
         result = fornero.concat([df1, df2])
 
         # Should have 4 rows
         assert len(result) == 4
-        assert result['a'].tolist() == [1, 2, 3, 4]
+        assert np.array_equal(result['a'].to_numpy(), [1, 2, 3, 4])
 
 
 class TestPlanExplain:
     """Tests for plan explanation (verifying plan structure)."""
 
-    def test_plan_explain_shows_operations(self):
+    def test_plan_explain_shows_operations(self, small_df):
         """Plan explanation shows operations in readable format."""
-        df = DataFrame({'a': [1, 2, 3]})
+        df = small_df
         result = df[df['a'] > 1][['a']]
 
         explanation = result._plan.explain()
@@ -461,9 +610,9 @@ class TestPlanExplain:
         assert 'Filter' in explanation or 'filter' in explanation
         assert 'Select' in explanation or 'select' in explanation
 
-    def test_plan_explain_includes_source(self):
+    def test_plan_explain_includes_source(self, small_df):
         """Plan explanation includes source information."""
-        df = DataFrame({'a': [1, 2, 3]})
+        df = small_df
 
         explanation = df._plan.explain()
 
@@ -475,7 +624,7 @@ class TestTrackedSeriesASTPredicates:
 
     def test_tracked_series_creates_ast_predicates(self):
         """_TrackedSeries comparison operators create AST predicates."""
-        df = DataFrame({'age': [25, 35, 45]})
+        df = DataFrame({'age': np.array([25, 35, 45])})
         condition = df['age'] > 30
 
         # Verify _predicate is an AST node
@@ -488,7 +637,7 @@ class TestTrackedSeriesASTPredicates:
 
     def test_tracked_series_compound_predicates(self):
         """_TrackedSeries logical operators combine AST nodes."""
-        df = DataFrame({'age': [25, 35, 45], 'salary': [40000, 60000, 80000]})
+        df = DataFrame({'age': np.array([25, 35, 45]), 'salary': np.array([40000, 60000, 80000])})
         condition = (df['age'] > 30) & (df['salary'] > 50000)
 
         # Verify compound AST
@@ -505,7 +654,7 @@ class TestTrackedSeriesASTPredicates:
 
     def test_tracked_series_all_comparison_operators(self):
         """All comparison operators create correct AST predicates."""
-        df = DataFrame({'x': [1, 2, 3]})
+        df = DataFrame({'x': np.arange(1, 4)})
         
         test_cases = [
             (df['x'] > 1, '>'),
@@ -524,12 +673,12 @@ class TestTrackedSeriesASTPredicates:
 
     def test_filter_with_ast_predicate_works_eagerly(self):
         """Filtering with AST predicates works in eager mode."""
-        df = DataFrame({'age': [25, 35, 45], 'name': ['Alice', 'Bob', 'Carol']})
+        df = DataFrame({'age': np.array([25, 35, 45]), 'name': ['Alice', 'Bob', 'Carol']})
         result = df[df['age'] > 30]
         
         # Verify pandas execution
         assert len(result) == 2
-        assert result['age'].tolist() == [35, 45]
+        assert np.array_equal(result['age'].to_numpy(), [35, 45])
         
         # Verify plan has AST predicate
         assert isinstance(result._plan.root, Filter)
@@ -8,14 +8,15 @@ Task 15: SheetsExecutor tests
 All tests mock gspread - no real API calls are made.
 """
 
-from unittest.mock import Mock
-import pytest
+import re
+from dataclasses import replace
+from unittest.mock import call
 import gspread
-from gspread.exceptions import APIError
+import pytest
 
 from fornero.executor.sheets_client import SheetsClient
 from fornero.executor.sheets_executor import SheetsExecutor
-from fornero.executor.plan import ExecutionPlan, StepType
+from fornero.executor.plan import ExecutionPlan, ExecutionStep, StepType
 from fornero.spreadsheet.operations import (
     CreateSheet,
     SetValues,
@@ -25,58 +26,72 @@ from fornero.spreadsheet.operations import (
 from fornero.exceptions import SheetsAPIError, PlanValidationError
 
 
+@pytest.fixture
+def client(mock_gc):
+    return SheetsClient(mock_gc)
+
+
+@pytest.fixture
+def executor(client):
+    return SheetsExecutor(client, rate_limit_delay=0)
+
+
+def _all_of(*substrings: str) -> str:
+    """Regex for pytest.raises(match=...) requiring every substring, in any order."""
+    return "(?s)" + "".join(f"(?=.*{re.escape(sub)})" for sub in substrings)
+
+
+def _create_sheets_response(*added: CreateSheet) -> dict:
+    """batchUpdate response for a CREATE_SHEETS step that adds *added* after the default sheet."""
+    replies = [{}] + [
+        {
+            "addSheet": {
+                "properties": {
+                    "sheetId": sheet_id,
+                    "title": op.name,
+                    "index": sheet_id,
+                    "gridProperties": {"rowCount": op.rows, "columnCount": op.cols},
+                }
+            }
+        }
+        for sheet_id, op in enumerate(added, start=1)
+    ]
+    return {"spreadsheetId": "spreadsheet-id", "replies": replies}
+
+
+# Shared operations; tests never mutate them, and variants go through replace().
+SHEET1 = CreateSheet(name="sheet1", rows=100, cols=3)
+SOURCE = CreateSheet(name="source", rows=100, cols=3)
+SHEET1_ROW = SetValues(sheet="sheet1", row=0, col=0, values=[[1, 2, 3]])
+# Sized like the mock worksheet's 100x5 grid, so the executor does not resize it.
+DEFAULT_SHEET = CreateSheet(name="Sheet1", rows=100, cols=5)
+DATA_SHEET = CreateSheet(name="Data", rows=100, cols=5)
+
+# Operation type held by each ExecutionPlan step.
+_STEP_OP_TYPES = {
+    StepType.CREATE_SHEETS: CreateSheet,
+    StepType.WRITE_SOURCE_DATA: SetValues,
+    StepType.WRITE_FORMULAS: SetFormula,
+    StepType.REGISTER_NAMED_RANGES: NamedRange,
+}
+
+
 class TestSheetsClient:
     """Test suite for SheetsClient wrapper (Task 14)."""
 
-    def test_init_stores_gc(self):
+    def test_init_stores_gc(self, client, mock_gc):
         """The wrapper stores the provided gspread client."""
-        mock_gc = Mock(spec=gspread.Client)
-        client = SheetsClient(mock_gc)
         assert client.gc is mock_gc
 
-    def test_create_spreadsheet_success(self):
+    def test_create_spreadsheet_success(self, client, mock_gc, mock_spreadsheet):
         """create_spreadsheet(title) calls gc.create(title) and returns the result."""
-        mock_gc = Mock(spec=gspread.Client)
-        mock_spreadsheet = Mock(spec=gspread.Spreadsheet)
-        mock_gc.create.return_value = mock_spreadsheet
-
-        client = SheetsClient(mock_gc)
         result = client.create_spreadsheet("Test Spreadsheet")
 
         mock_gc.create.assert_called_once_with("Test Spreadsheet")
         assert result == mock_spreadsheet
 
-    def test_create_spreadsheet_api_error(self):
-        """Error wrapping: APIError during create_spreadsheet is caught and re-raised as SheetsAPIError."""
-        mock_gc = Mock(spec=gspread.Client)
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "error": {
-                "code": 429,
-                "message": "Quota exceeded",
-                "status": "RESOURCE_EXHAUSTED"
-            }
-        }
-        api_error = APIError(mock_response)
-        mock_gc.create.side_effect = api_error
-
-        client = SheetsClient(mock_gc)
-
-        with pytest.raises(SheetsAPIError) as exc_info:
-            client.create_spreadsheet("Test Spreadsheet")
-
-        assert "Failed to create spreadsheet" in str(exc_info.value)
-        assert "Test Spreadsheet" in str(exc_info.value)
-        assert "Quota exceeded" in str(exc_info.value)
-
-    def test_add_sheet_with_defaults(self):
+    def test_add_sheet_with_defaults(self, client, mock_spreadsheet, mock_worksheet):
         """add_sheet(name, rows, cols) calls spreadsheet.add_worksheet(...) with correct arguments."""
-        mock_gc = Mock(spec=gspread.Client)
-        mock_spreadsheet = Mock(spec=gspread.Spreadsheet)
-        mock_worksheet = Mock(spec=gspread.Worksheet)
-        mock_spreadsheet.add_worksheet.return_value = mock_worksheet
-
-        client = SheetsClient(mock_gc)
         result = client.add_sheet(mock_spreadsheet, "Sheet1")
 
         mock_spreadsheet.add_worksheet.assert_called_once_with(
@@ -86,14 +101,8 @@ class TestSheetsClient:
         )
         assert result == mock_worksheet
 
-    def test_add_sheet_with_custom_dimensions(self):
+    def test_add_sheet_with_custom_dimensions(self, client, mock_spreadsheet, mock_worksheet):
         """add_sheet accepts custom rows and cols parameters."""
-        mock_gc = Mock(spec=gspread.Client)
-        mock_spreadsheet = Mock(spec=gspread.Spreadsheet)
-        mock_worksheet = Mock(spec=gspread.Worksheet)
-        mock_spreadsheet.add_worksheet.return_value = mock_worksheet
-
-        client = SheetsClient(mock_gc)
         result = client.add_sheet(mock_spreadsheet, "Sheet2", rows=500, cols=10)
 
         mock_spreadsheet.add_worksheet.assert_called_once_with(
@@ -103,108 +112,22 @@ class TestSheetsClient:
         )
         assert result == mock_worksheet
 
-    def test_add_sheet_api_error(self):
-        """Error wrapping: APIError during add_sheet is caught and re-raised as SheetsAPIError."""
-        mock_gc = Mock(spec=gspread.Client)
-        mock_spreadsheet = Mock(spec=gspread.Spreadsheet)
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "error": {
-                "code": 400,
-                "message": "Sheet name already exists",
-                "status": "INVALID_ARGUMENT"
-            }
-        }
-        api_error = APIError(mock_response)
-        mock_spreadsheet.add_worksheet.side_effect = api_error
-
-        client = SheetsClient(mock_gc)
-
-        with pytest.raises(SheetsAPIError) as exc_info:
-            client.add_sheet(mock_spreadsheet, "DuplicateSheet")
-
-        assert "Failed to add worksheet" in str(exc_info.value)
-        assert "DuplicateSheet" in str(exc_info.value)
-        assert "Sheet name already exists" in str(exc_info.value)
-
-    def test_write_values_success(self):
+    def test_write_values_success(self, client, mock_worksheet):
         """write_values(sheet, range, values) calls worksheet.update(range, values)."""
-        mock_gc = Mock(spec=gspread.Client)
-        mock_worksheet = Mock(spec=gspread.Worksheet)
-
-        client = SheetsClient(mock_gc)
         values = [["A", "B", "C"], [1, 2, 3], [4, 5, 6]]
         client.write_values(mock_worksheet, "A1:C3", values)
 
         mock_worksheet.update.assert_called_once_with(values, range_name="A1:C3")
 
-    def test_write_values_api_error(self):
-        """Error wrapping: APIError during write_values is caught and re-raised as SheetsAPIError."""
-        mock_gc = Mock(spec=gspread.Client)
-        mock_worksheet = Mock(spec=gspread.Worksheet)
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "error": {
-                "code": 400,
-                "message": "Invalid range",
-                "status": "INVALID_ARGUMENT"
-            }
-        }
-        api_error = APIError(mock_response)
-        mock_worksheet.update.side_effect = api_error
-
-        client = SheetsClient(mock_gc)
-        values = [["A", "B"], [1, 2]]
-
-        with pytest.raises(SheetsAPIError) as exc_info:
-            client.write_values(mock_worksheet, "Z999:ZZ999", values)
-
-        assert "Failed to write values to range" in str(exc_info.value)
-        assert "Z999:ZZ999" in str(exc_info.value)
-        assert "Invalid range" in str(exc_info.value)
-
-    def test_write_formula_success(self):
+    def test_write_formula_success(self, client, mock_worksheet):
         """write_formula(sheet, cell, formula) calls worksheet.update(cell, formula, raw=False)."""
-        mock_gc = Mock(spec=gspread.Client)
-        mock_worksheet = Mock(spec=gspread.Worksheet)
-
-        client = SheetsClient(mock_gc)
         formula = "=SUM(A1:A10)"
         client.write_formula(mock_worksheet, "B1", formula)
 
         mock_worksheet.update.assert_called_once_with([[formula]], range_name="B1", raw=False)
 
-    def test_write_formula_api_error(self):
-        """Error wrapping: APIError during write_formula is caught and re-raised as SheetsAPIError."""
-        mock_gc = Mock(spec=gspread.Client)
-        mock_worksheet = Mock(spec=gspread.Worksheet)
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "error": {
-                "code": 400,
-                "message": "Formula syntax error",
-                "status": "INVALID_ARGUMENT"
-            }
-        }
-        api_error = APIError(mock_response)
-        mock_worksheet.update.side_effect = api_error
-
-        client = SheetsClient(mock_gc)
-
-        with pytest.raises(SheetsAPIError) as exc_info:
-            client.write_formula(mock_worksheet, "C5", "=INVALID()")
-
-        assert "Failed to write formula to cell" in str(exc_info.value)
-        assert "C5" in str(exc_info.value)
-        assert "Formula syntax error" in str(exc_info.value)
-
-    def test_batch_update_values_success(self):
+    def test_batch_update_values_success(self, client, mock_worksheet):
         """batch_update_values calls worksheet.batch_update with correct format."""
-        mock_gc = Mock(spec=gspread.Client)
-        mock_worksheet = Mock(spec=gspread.Worksheet)
-
-        client = SheetsClient(mock_gc)
-
         updates = [
             {'range': 'A1:B2', 'values': [[1, 2], [3, 4]]},
             {'range': 'D1:E1', 'values': [[5, 6]]},
@@ -219,23 +142,14 @@ class TestSheetsClient:
         assert batch_data[0] == {'range': 'A1:B2', 'values': [[1, 2], [3, 4]]}
         assert batch_data[1] == {'range': 'D1:E1', 'values': [[5, 6]]}
 
-    def test_batch_update_values_empty_list(self):
+    def test_batch_update_values_empty_list(self, client, mock_worksheet):
         """batch_update_values handles empty list without calling API."""
-        mock_gc = Mock(spec=gspread.Client)
-        mock_worksheet = Mock(spec=gspread.Worksheet)
-
-        client = SheetsClient(mock_gc)
         client.batch_update_values(mock_worksheet, [])
 
         mock_worksheet.batch_update.assert_not_called()
 
-    def test_batch_update_formulas_success(self):
+    def test_batch_update_formulas_success(self, client, mock_worksheet):
         """batch_update_formulas calls worksheet.batch_update with correct format and raw=False."""
-        mock_gc = Mock(spec=gspread.Client)
-        mock_worksheet = Mock(spec=gspread.Worksheet)
-
-        client = SheetsClient(mock_gc)
-
         updates = [
             {'range': 'A1', 'values': [["=SUM(B1:B10)"]]},
             {'range': 'C3', 'values': [["=AVERAGE(D1:D5)"]]},
@@ -251,72 +165,77 @@ class TestSheetsClient:
         assert batch_data[1] == {'range': 'C3', 'values': [["=AVERAGE(D1:D5)"]]}
         assert call_args[1]["raw"] is False
 
-    def test_batch_update_formulas_empty_list(self):
+    def test_batch_update_formulas_empty_list(self, client, mock_worksheet):
         """batch_update_formulas handles empty list without calling API."""
-        mock_gc = Mock(spec=gspread.Client)
-        mock_worksheet = Mock(spec=gspread.Worksheet)
-
-        client = SheetsClient(mock_gc)
         client.batch_update_formulas(mock_worksheet, [])
 
         mock_worksheet.batch_update.assert_not_called()
 
-    def test_batch_update_values_api_error(self):
-        """Error wrapping: APIError during batch_update_values is caught and re-raised as SheetsAPIError."""
-        mock_gc = Mock(spec=gspread.Client)
-        mock_worksheet = Mock(spec=gspread.Worksheet)
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "error": {
-                "code": 400,
-                "message": "Invalid range",
-                "status": "INVALID_ARGUMENT"
-            }
-        }
-        api_error = APIError(mock_response)
-        mock_worksheet.batch_update.side_effect = api_error
-
-        client = SheetsClient(mock_gc)
-
-        with pytest.raises(SheetsAPIError) as exc_info:
-            client.batch_update_values(mock_worksheet, [("A1:B2", [[1, 2]])])
-
-        assert "Failed to batch update" in str(exc_info.value)
-        assert "value ranges" in str(exc_info.value)
-        assert "Invalid range" in str(exc_info.value)
-
-    def test_error_wrapping_preserves_original_message(self):
+    @pytest.mark.parametrize(
+        "method_name, owner, owner_method, args, error, expected_substrs",
+        [
+            pytest.param(
+                "create_spreadsheet", "mock_gc", "create", ("Test Spreadsheet",),
+                (429, "Quota exceeded", "RESOURCE_EXHAUSTED"),
+                ["Failed to create spreadsheet", "Test Spreadsheet", "Quota exceeded"],
+                id="create_spreadsheet_api_error",
+            ),
+            pytest.param(
+                "add_sheet", "mock_spreadsheet", "add_worksheet", ("DuplicateSheet",),
+                (400, "Sheet name already exists", "INVALID_ARGUMENT"),
+                ["Failed to add worksheet", "DuplicateSheet", "Sheet name already exists"],
+                id="add_sheet_api_error",
+            ),
+            pytest.param(
+                "write_values", "mock_worksheet", "update", ("Z999:ZZ999", [["A", "B"], [1, 2]]),
+                (400, "Invalid range", "INVALID_ARGUMENT"),
+                ["Failed to write values to range", "Z999:ZZ999", "Invalid range"],
+                id="write_values_api_error",
+            ),
+            pytest.param(
+                "write_formula", "mock_worksheet", "update", ("C5", "=INVALID()"),
+                (400, "Formula syntax error", "INVALID_ARGUMENT"),
+                ["Failed to write formula to cell", "C5", "Formula syntax error"],
+                id="write_formula_api_error",
+            ),
+            pytest.param(
+                "batch_update_values", "mock_worksheet", "batch_update", ([("A1:B2", [[1, 2]])],),
+                (400, "Invalid range", "INVALID_ARGUMENT"),
+                ["Failed to batch update", "value ranges", "Invalid range"],
+                id="batch_update_values_api_error",
+            ),
+        ],
+    )
+    def test_api_error_is_wrapped(
+        self, request, client, mock_gc, api_error_factory,
+        method_name, owner, owner_method, args, error, expected_substrs,
+    ):
+        """Error wrapping: an APIError from gspread is caught and re-raised as SheetsAPIError.
+
+        *owner* names the mock whose *owner_method* fails; spreadsheet and worksheet
+        methods take that mock as their first argument.
+        """
+        owner_mock = request.getfixturevalue(owner)
+        getattr(owner_mock, owner_method).side_effect = api_error_factory(*error)
+        call_args = args if owner_mock is mock_gc else (owner_mock, *args)
+
+        with pytest.raises(SheetsAPIError, match=_all_of(*expected_substrs)):
+            getattr(client, method_name)(*call_args)
+
+    def test_error_wrapping_preserves_original_message(self, client, mock_gc, api_error_factory):
         """Error wrapping: the original APIError message is preserved in SheetsAPIError."""
-        mock_gc = Mock(spec=gspread.Client)
         original_message = "Rate limit exceeded: too many requests"
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "error": {
-                "code": 429,
-                "message": original_message,
-                "status": "RESOURCE_EXHAUSTED"
-            }
-        }
-        api_error = APIError(mock_response)
+        api_error = api_error_factory(429, original_message, "RESOURCE_EXHAUSTED")
         mock_gc.create.side_effect = api_error
 
-        client = SheetsClient(mock_gc)
 
-        with pytest.raises(SheetsAPIError) as exc_info:
+        with pytest.raises(SheetsAPIError, match=re.escape(original_message)):
             client.create_spreadsheet("Test")
 
-        assert original_message in str(exc_info.value)
-
-    def test_multiple_operations_in_sequence(self):
+    def test_multiple_operations_in_sequence(
+        self, client, mock_gc, mock_spreadsheet, mock_worksheet
+    ):
         """Integration: verify client can perform multiple operations in sequence."""
-        mock_gc = Mock(spec=gspread.Client)
-        mock_spreadsheet = Mock(spec=gspread.Spreadsheet)
-        mock_worksheet = Mock(spec=gspread.Worksheet)
-        mock_gc.create.return_value = mock_spreadsheet
-        mock_spreadsheet.add_worksheet.return_value = mock_worksheet
-
-        client = SheetsClient(mock_gc)
-
         spreadsheet = client.create_spreadsheet("Multi-op Test")
         assert spreadsheet == mock_spreadsheet
 
@@ -326,9 +245,13 @@ class TestSheetsClient:
         client.write_values(worksheet, "A1:B2", [[1, 2], [3, 4]])
         client.write_formula(worksheet, "C1", "=A1+B1")
 
-        mock_gc.create.assert_called_once()
-        mock_spreadsheet.add_worksheet.assert_called_once()
-        assert mock_worksheet.update.call_count == 2
+        sheet = call.create().add_worksheet()
+        assert mock_gc.mock_calls == [
+            call.create("Multi-op Test"),
+            call.create().add_worksheet(title="Data", rows=1000, cols=26),
+            sheet.update([[1, 2], [3, 4]], range_name="A1:B2"),
+            sheet.update([["=A1+B1"]], range_name="C1", raw=False),
+        ]
 
 
 class TestExecutionPlan:
@@ -340,63 +263,157 @@ class TestExecutionPlan:
         assert len(plan.steps) == 0
         assert plan.main_sheet is None
 
-    def test_single_source_plan(self):
-        """A single-source plan (one CreateSheet, one SetValues, no formulas) produces two steps in the right order."""
-        ops = [
-            CreateSheet(name="source", rows=100, cols=5),
-            SetValues(
-                sheet="source",
-                row=0,
-                col=0,
-                values=[["A", "B", "C"], [1, 2, 3], [4, 5, 6]]
+    @pytest.mark.parametrize(
+        "ops, expected_step_types, ordering_constraints, formula_sheet_order",
+        [
+            pytest.param(
+                [
+                    replace(SOURCE, cols=5),
+                    SetValues(sheet="source", row=0, col=0,
+                              values=[["A", "B", "C"], [1, 2, 3], [4, 5, 6]]),
+                ],
+                [StepType.CREATE_SHEETS, StepType.WRITE_SOURCE_DATA],
+                [(StepType.CREATE_SHEETS, StepType.WRITE_SOURCE_DATA)],
+                [],
+                id="single_source_plan",
             ),
-        ]
-
+            pytest.param(
+                [
+                    SOURCE,
+                    replace(SOURCE, name="filtered"),
+                    SetValues(sheet="source", row=0, col=0, values=[["A", "B", "C"], [1, 2, 3]]),
+                    SetFormula(sheet="filtered", row=0, col=0,
+                               formula="=FILTER(source!A:C, source!A:A > 0)", ref="source"),
+                ],
+                [StepType.CREATE_SHEETS, StepType.WRITE_SOURCE_DATA, StepType.WRITE_FORMULAS],
+                [(StepType.WRITE_SOURCE_DATA, StepType.WRITE_FORMULAS)],
+                [],
+                id="cross_sheet_formula_ordering",
+            ),
+            pytest.param(
+                [
+                    SHEET1,
+                    SHEET1_ROW,
+                    SetFormula(sheet="sheet1", row=1, col=0, formula="=SUM(A1:C1)"),
+                    NamedRange(name="data_range", sheet="sheet1",
+                               row_start=0, col_start=0, row_end=10, col_end=2),
+                ],
+                [StepType.CREATE_SHEETS, StepType.WRITE_SOURCE_DATA,
+                 StepType.WRITE_FORMULAS, StepType.REGISTER_NAMED_RANGES],
+                [(StepType.WRITE_FORMULAS, StepType.REGISTER_NAMED_RANGES)],
+                [],
+                id="named_ranges_after_formulas",
+            ),
+            pytest.param(
+                [
+                    CreateSheet(name="a", rows=10, cols=2),
+                    CreateSheet(name="b", rows=10, cols=2),
+                    CreateSheet(name="c", rows=10, cols=2),
+                    SetValues(sheet="a", row=0, col=0, values=[[1, 2]]),
+                    SetValues(sheet="b", row=0, col=0, values=[[3, 4]]),
+                    SetFormula(sheet="c", row=0, col=0, formula="=a!A1 + b!A1", ref="a"),
+                    SetFormula(sheet="c", row=0, col=1, formula="=a!B1 + b!B1", ref="b"),
+                ],
+                [StepType.CREATE_SHEETS, StepType.WRITE_SOURCE_DATA, StepType.WRITE_FORMULAS],
+                [(StepType.WRITE_SOURCE_DATA, StepType.WRITE_FORMULAS)],
+                [],
+                id="topological_sort_multiple_dependencies",
+            ),
+            pytest.param(
+                [
+                    CreateSheet(name="C", rows=10, cols=2),
+                    CreateSheet(name="B", rows=10, cols=2),
+                    CreateSheet(name="A", rows=10, cols=2),
+                    # C has no dependencies, B depends on C, A depends on B and C
+                    SetFormula(sheet="C", row=0, col=0, formula="=1+1"),
+                    SetFormula(sheet="B", row=0, col=0, formula="=C!A1", ref="C"),
+                    SetFormula(sheet="A", row=0, col=0, formula="=B!A1 + C!A1", ref="B"),
+                    SetFormula(sheet="A", row=0, col=1, formula="=C!A1", ref="C"),
+                ],
+                [StepType.CREATE_SHEETS, StepType.WRITE_FORMULAS],
+                [(StepType.CREATE_SHEETS, StepType.WRITE_FORMULAS)],
+                [("C", "B"), ("C", "A"), ("B", "A")],
+                id="topological_sort_chain_dependencies",
+            ),
+        ],
+    )
+    def test_step_ordering(
+        self, ops, expected_step_types, ordering_constraints, formula_sheet_order
+    ):
+        """Steps come out in phase order, each holding only its phase's operations.
+
+        ``ordering_constraints`` lists ``(a, b)`` step types where step *a* must precede
+        step *b*; ``formula_sheet_order`` lists ``(x, y)`` sheets whose formulas must be
+        written first for *x* (a referenced sheet precedes the sheets referencing it).
+        """
         plan = ExecutionPlan.from_operations(ops)
 
-        assert len(plan.steps) == 2
-        assert plan.steps[0].step_type == StepType.CREATE_SHEETS
-        assert plan.steps[1].step_type == StepType.WRITE_SOURCE_DATA
+        step_types = [step.step_type for step in plan.steps]
+        assert step_types == expected_step_types
+        for before, after in ordering_constraints:
+            assert step_types.index(before) < step_types.index(after)
+
+        for step in plan.steps:
+            op_type = _STEP_OP_TYPES[step.step_type]
+            assert all(isinstance(op, op_type) for op in step.operations)
+            assert step.target_sheets == {
+                op.name if isinstance(op, CreateSheet) else op.sheet for op in step.operations
+            }
 
-        assert len(plan.steps[0].operations) == 1
-        assert isinstance(plan.steps[0].operations[0], CreateSheet)
-        assert len(plan.steps[1].operations) == 1
-        assert isinstance(plan.steps[1].operations[0], SetValues)
+        if formula_sheet_order:
+            formula_step = plan.steps[step_types.index(StepType.WRITE_FORMULAS)]
+            sheet_order = list(dict.fromkeys(op.sheet for op in formula_step.operations))
+            for before, after in formula_sheet_order:
+                assert sheet_order.index(before) < sheet_order.index(after), (
+                    f"Sheet {before} should come before sheet {after}"
+                )
+
+    def test_explain_output(self, sample_plan):
+        """explain() output includes sheet count, formula count, and step count."""
+        explanation = sample_plan.explain()
 
-    def test_cross_sheet_formula_ordering(self):
-        """A plan with cross-sheet formulas places WriteSourceData for the referenced sheet before WriteFormulas for the referencing sheet."""
+        assert "Sheets: 2" in explanation
+        assert "Formula operations: 2" in explanation
+        assert "Source data operations: 1" in explanation
+        assert "Total execution steps:" in explanation
+        assert "Main output sheet: result" in explanation
+
+    def test_to_dict_round_trip(self, sample_plan):
+        """to_dict() round-trips: ExecutionPlan.from_dict(plan.to_dict()) produces an equivalent plan."""
+        plan_dict = sample_plan.to_dict()
+        restored_plan = ExecutionPlan.from_dict(plan_dict)
+
+        assert len(sample_plan.steps) == len(restored_plan.steps)
+        assert sample_plan.main_sheet == restored_plan.main_sheet
+
+        for orig_step, restored_step in zip(sample_plan.steps, restored_plan.steps):
+            assert orig_step.step_type == restored_step.step_type
+            assert len(orig_step.operations) == len(restored_step.operations)
+            assert orig_step.target_sheets == restored_step.target_sheets
+
+    def test_main_sheet_tracker(self):
+        """The main-sheet tracker correctly identifies the root output sheet."""
         ops = [
-            CreateSheet(name="source", rows=100, cols=3),
-            CreateSheet(name="filtered", rows=100, cols=3),
-            SetValues(
-                sheet="source",
-                row=0,
-                col=0,
-                values=[["A", "B", "C"], [1, 2, 3]]
-            ),
-            SetFormula(
-                sheet="filtered",
-                row=0,
-                col=0,
-                formula="=FILTER(source!A:C, source!A:A > 0)",
-                ref="source"
-            ),
+            CreateSheet(name="input", rows=10, cols=2),
+            CreateSheet(name="output", rows=10, cols=2),
         ]
 
-        plan = ExecutionPlan.from_operations(ops)
+        plan = ExecutionPlan.from_operations(ops, main_sheet="output")
+        assert plan.main_sheet == "output"
 
-        assert len(plan.steps) == 3
-        assert plan.steps[0].step_type == StepType.CREATE_SHEETS
-        assert plan.steps[1].step_type == StepType.WRITE_SOURCE_DATA
-        assert plan.steps[2].step_type == StepType.WRITE_FORMULAS
+    def test_empty_explain(self):
+        """explain() on empty plan returns appropriate message."""
+        plan = ExecutionPlan.from_operations([])
+        explanation = plan.explain()
+        assert "Empty execution plan" in explanation
 
-        assert plan.steps[1].step_type == StepType.WRITE_SOURCE_DATA
-        assert "source" in plan.steps[1].target_sheets
 
+class TestExecutionPlanValidation:
+    """ExecutionPlan.from_operations rejects invalid operation lists (Task 13)."""
     def test_formula_referencing_nonexistent_sheet(self):
         """A plan with a formula referencing a nonexistent sheet raises PlanValidationError."""
         ops = [
-            CreateSheet(name="sheet1", rows=100, cols=3),
+            SHEET1,
             SetFormula(
                 sheet="sheet1",
                 row=0,
@@ -406,15 +423,13 @@ class TestExecutionPlan:
             ),
         ]
 
-        with pytest.raises(PlanValidationError) as exc_info:
+        with pytest.raises(PlanValidationError, match="nonexistent"):
             ExecutionPlan.from_operations(ops)
 
-        assert "nonexistent" in str(exc_info.value)
-
     def test_setvalues_nonexistent_sheet(self):
         """SetValues targeting a nonexistent sheet raises PlanValidationError."""
         ops = [
-            CreateSheet(name="sheet1", rows=100, cols=3),
+            SHEET1,
             SetValues(
                 sheet="nonexistent",
                 row=0,
@@ -423,202 +438,39 @@ class TestExecutionPlan:
             ),
         ]
 
-        with pytest.raises(PlanValidationError) as exc_info:
+        with pytest.raises(PlanValidationError, match="nonexistent"):
             ExecutionPlan.from_operations(ops)
 
-        assert "nonexistent" in str(exc_info.value)
-
     def test_duplicate_sheet_names(self):
         """CreateSheet operations with duplicate sheet names raise PlanValidationError."""
         ops = [
-            CreateSheet(name="sheet1", rows=100, cols=3),
-            CreateSheet(name="sheet1", rows=50, cols=2),
+            SHEET1,
+            replace(SHEET1, rows=50, cols=2),
         ]
 
-        with pytest.raises(PlanValidationError) as exc_info:
+        with pytest.raises(
+            PlanValidationError, match=_all_of("Duplicate sheet names", "sheet1")
+        ):
             ExecutionPlan.from_operations(ops)
 
-        assert "Duplicate sheet names" in str(exc_info.value)
-        assert "sheet1" in str(exc_info.value)
-
-    def test_named_ranges_after_formulas(self):
-        """RegisterNamedRanges step always comes after all WriteFormulas steps."""
-        ops = [
-            CreateSheet(name="sheet1", rows=100, cols=3),
-            SetValues(sheet="sheet1", row=0, col=0, values=[[1, 2, 3]]),
-            SetFormula(sheet="sheet1", row=1, col=0, formula="=SUM(A1:C1)"),
-            NamedRange(
-                name="data_range",
-                sheet="sheet1",
-                row_start=0,
-                col_start=0,
-                row_end=10,
-                col_end=2
-            ),
-        ]
-
-        plan = ExecutionPlan.from_operations(ops)
-
-        formula_idx = None
-        named_range_idx = None
-        for i, step in enumerate(plan.steps):
-            if step.step_type == StepType.WRITE_FORMULAS:
-                formula_idx = i
-            elif step.step_type == StepType.REGISTER_NAMED_RANGES:
-                named_range_idx = i
-
-        assert named_range_idx is not None
-        assert formula_idx is not None
-        assert named_range_idx > formula_idx
-
-    def test_explain_output(self):
-        """explain() output includes sheet count, formula count, and step count."""
-        ops = [
-            CreateSheet(name="source", rows=100, cols=3),
-            CreateSheet(name="result", rows=100, cols=3),
-            SetValues(sheet="source", row=0, col=0, values=[["A", "B", "C"]]),
-            SetFormula(sheet="result", row=0, col=0, formula="=source!A1"),
-            SetFormula(sheet="result", row=0, col=1, formula="=source!B1"),
-        ]
-
-        plan = ExecutionPlan.from_operations(ops, main_sheet="result")
-        explanation = plan.explain()
-
-        assert "Sheets: 2" in explanation
-        assert "Formula operations: 2" in explanation
-        assert "Source data operations: 1" in explanation
-        assert "Total execution steps:" in explanation
-        assert "Main output sheet: result" in explanation
-
-    def test_to_dict_round_trip(self):
-        """to_dict() round-trips: ExecutionPlan.from_dict(plan.to_dict()) produces an equivalent plan."""
-        ops = [
-            CreateSheet(name="sheet1", rows=100, cols=3),
-            SetValues(sheet="sheet1", row=0, col=0, values=[[1, 2, 3], [4, 5, 6]]),
-            SetFormula(sheet="sheet1", row=2, col=0, formula="=SUM(A1:C2)"),
-        ]
-
-        original_plan = ExecutionPlan.from_operations(ops, main_sheet="sheet1")
-        plan_dict = original_plan.to_dict()
-        restored_plan = ExecutionPlan.from_dict(plan_dict)
-
-        assert len(original_plan.steps) == len(restored_plan.steps)
-        assert original_plan.main_sheet == restored_plan.main_sheet
-
-        for orig_step, restored_step in zip(original_plan.steps, restored_plan.steps):
-            assert orig_step.step_type == restored_step.step_type
-            assert len(orig_step.operations) == len(restored_step.operations)
-            assert orig_step.target_sheets == restored_step.target_sheets
-
-    def test_topological_sort_multiple_dependencies(self):
-        """WriteFormulas step respects topological order: if formula on sheet B references sheet A, sheet A's data step precedes sheet B's formula step."""
-        ops = [
-            CreateSheet(name="a", rows=10, cols=2),
-            CreateSheet(name="b", rows=10, cols=2),
-            CreateSheet(name="c", rows=10, cols=2),
-            SetValues(sheet="a", row=0, col=0, values=[[1, 2]]),
-            SetValues(sheet="b", row=0, col=0, values=[[3, 4]]),
-            SetFormula(sheet="c", row=0, col=0, formula="=a!A1 + b!A1", ref="a"),
-            SetFormula(sheet="c", row=0, col=1, formula="=a!B1 + b!B1", ref="b"),
-        ]
-
-        plan = ExecutionPlan.from_operations(ops)
-
-        assert len(plan.steps) == 3
-
-        source_idx = None
-        formula_idx = None
-        for i, step in enumerate(plan.steps):
-            if step.step_type == StepType.WRITE_SOURCE_DATA:
-                source_idx = i
-            elif step.step_type == StepType.WRITE_FORMULAS:
-                formula_idx = i
-
-        assert source_idx is not None
-        assert formula_idx is not None
-        assert source_idx < formula_idx
-
-    def test_main_sheet_tracker(self):
-        """The main-sheet tracker correctly identifies the root output sheet."""
-        ops = [
-            CreateSheet(name="input", rows=10, cols=2),
-            CreateSheet(name="output", rows=10, cols=2),
-        ]
-
-        plan = ExecutionPlan.from_operations(ops, main_sheet="output")
-        assert plan.main_sheet == "output"
-
-    def test_topological_sort_chain_dependencies(self):
-        """Topological sort handles chain dependencies: A depends on B and C, B depends on C -> order is C, B, A."""
-        ops = [
-            CreateSheet(name="C", rows=10, cols=2),
-            CreateSheet(name="B", rows=10, cols=2),
-            CreateSheet(name="A", rows=10, cols=2),
-            # All sheets have formulas to be included in topological sort
-            # C has no dependencies (base case)
-            SetFormula(sheet="C", row=0, col=0, formula="=1+1"),
-            # B depends on C
-            SetFormula(sheet="B", row=0, col=0, formula="=C!A1", ref="C"),
-            # A depends on both B and C
-            SetFormula(sheet="A", row=0, col=0, formula="=B!A1 + C!A1", ref="B"),
-            SetFormula(sheet="A", row=0, col=1, formula="=C!A1", ref="C"),
-        ]
-
-        plan = ExecutionPlan.from_operations(ops)
-
-        # Find the WriteFormulas step
-        formula_step = None
-        for step in plan.steps:
-            if step.step_type == StepType.WRITE_FORMULAS:
-                formula_step = step
-                break
-
-        assert formula_step is not None
-
-        # Extract the order of sheets from the formulas
-        sheet_order = []
-        for formula_op in formula_step.operations:
-            if formula_op.sheet not in sheet_order:
-                sheet_order.append(formula_op.sheet)
-
-        # Verify correct topological order: C before B, and both before A
-        c_idx = sheet_order.index("C")
-        b_idx = sheet_order.index("B")
-        a_idx = sheet_order.index("A")
-
-        assert c_idx < b_idx, "Sheet C (no dependencies) should come before Sheet B (depends on C)"
-        assert c_idx < a_idx, "Sheet C should come before Sheet A (depends on C)"
-        assert b_idx < a_idx, "Sheet B should come before Sheet A (depends on B)"
-
-    def test_empty_explain(self):
-        """explain() on empty plan returns appropriate message."""
-        plan = ExecutionPlan.from_operations([])
-        explanation = plan.explain()
-        assert "Empty execution plan" in explanation
+    def test_dataset_size_validation(self):
+        """A plan whose sheets exceed the Google Sheets cell limit is rejected up front."""
+        with pytest.raises(PlanValidationError, match="Dataset too large"):
+            ExecutionPlan.from_operations([CreateSheet(name="Huge", rows=10000, cols=2000)])
 
 
+@pytest.mark.usefixtures("no_sleep")
 class TestSheetsExecutor:
     """Test suite for SheetsExecutor (Task 15)."""
 
-    def _make_client(self):
-        mock_gc = Mock(spec=gspread.Client)
-        return SheetsClient(mock_gc), mock_gc
-
-    def test_execute_creates_spreadsheet(self):
+    def test_execute_creates_spreadsheet(
+        self, executor, mock_gc, mock_spreadsheet, mock_worksheet
+    ):
         """Executor creates a new spreadsheet with the specified title."""
-        client, mock_gc = self._make_client()
-        mock_spreadsheet = Mock(spec=gspread.Spreadsheet)
-        mock_worksheet = Mock(spec=gspread.Worksheet)
-        mock_worksheet.id = 0
         mock_worksheet.row_count = 1000
         mock_worksheet.col_count = 26
 
-        mock_gc.create.return_value = mock_spreadsheet
-        mock_spreadsheet.sheet1 = mock_worksheet
-
-        executor = SheetsExecutor(client, rate_limit_delay=0)
-
-        ops = [CreateSheet(name="Sheet1", rows=100, cols=5)]
+        ops = [DEFAULT_SHEET]
         plan = ExecutionPlan.from_operations(ops)
 
         result = executor.execute(plan, "Test Spreadsheet")
@@ -626,112 +478,96 @@ class TestSheetsExecutor:
         mock_gc.create.assert_called_once_with("Test Spreadsheet")
         assert result == mock_spreadsheet
 
-    def test_execute_creates_multiple_sheets(self):
-        """Executor creates multiple sheets in order."""
-        client, mock_gc = self._make_client()
-        mock_spreadsheet = Mock(spec=gspread.Spreadsheet)
-        mock_worksheet1 = Mock(spec=gspread.Worksheet)
-        mock_worksheet1.id = 0
-        mock_worksheet1.row_count = 100
-        mock_worksheet1.col_count = 5
-        mock_worksheet2 = Mock(spec=gspread.Worksheet)
-        mock_worksheet2.id = 1
-
-        mock_gc.create.return_value = mock_spreadsheet
-        mock_spreadsheet.sheet1 = mock_worksheet1
-        mock_spreadsheet.add_worksheet.return_value = mock_worksheet2
-
-        executor = SheetsExecutor(client, rate_limit_delay=0)
-
-        ops = [
-            CreateSheet(name="Sheet1", rows=100, cols=5),
-            CreateSheet(name="Sheet2", rows=50, cols=3),
-        ]
-        plan = ExecutionPlan.from_operations(ops)
+    def test_execute_creates_multiple_sheets(self, executor, mock_spreadsheet, mock_worksheet):
+        """Executor creates all sheets, in order, with one spreadsheet batch_update."""
+        sheet2 = CreateSheet(name="Sheet2", rows=50, cols=3)
+        mock_spreadsheet.batch_update.return_value = _create_sheets_response(sheet2)
+        plan = ExecutionPlan.from_operations([DEFAULT_SHEET, sheet2])
 
         executor.execute(plan, "Multi-Sheet Test")
 
-        mock_worksheet1.update_title.assert_called_once_with("Sheet1")
-        mock_spreadsheet.add_worksheet.assert_called_once()
-
-    def test_execute_writes_values(self):
-        """Executor writes values to the correct range."""
-        client, mock_gc = self._make_client()
-        mock_spreadsheet = Mock(spec=gspread.Spreadsheet)
-        mock_worksheet = Mock(spec=gspread.Worksheet)
-        mock_worksheet.id = 0
-        mock_worksheet.row_count = 100
-        mock_worksheet.col_count = 5
-
-        mock_gc.create.return_value = mock_spreadsheet
-        mock_spreadsheet.sheet1 = mock_worksheet
-
-        executor = SheetsExecutor(client, rate_limit_delay=0)
-
-        values = [["A", "B", "C"], [1, 2, 3], [4, 5, 6]]
-        ops = [
-            CreateSheet(name="Data", rows=100, cols=5),
-            SetValues(sheet="Data", row=0, col=0, values=values),
-        ]
+        mock_spreadsheet.batch_update.assert_called_once()
+        requests = mock_spreadsheet.batch_update.call_args.args[0]["requests"]
+        assert requests[0]["updateSheetProperties"]["properties"] == {
+            "sheetId": 0,
+            "title": "Sheet1",
+            "gridProperties": {"rowCount": 100, "columnCount": 5},
+        }
+        assert requests[1]["addSheet"]["properties"]["title"] == "Sheet2"
+        mock_worksheet.update_title.assert_not_called()
+        mock_spreadsheet.add_worksheet.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "ops, batch_len",
+        [
+            pytest.param(
+                [DATA_SHEET, SetValues(sheet="Data", row=0, col=0,
+                                       values=[["A", "B", "C"], [1, 2, 3], [4, 5, 6]])],
+                1,
+                id="writes_values",
+            ),
+            pytest.param(
+                [DATA_SHEET, SetFormula(sheet="Data", row=0, col=0, formula="=SUM(A2:A10)")],
+                1,
+                id="writes_formulas",
+            ),
+            pytest.param(
+                [DATA_SHEET, replace(SHEET1_ROW, sheet="Data"),
+                 SetValues(sheet="Data", row=1, col=0, values=[[4, 5, 6]])],
+                2,
+                id="batch_operations_per_sheet",
+            ),
+        ],
+    )
+    def test_writes_are_batched_per_sheet(
+        self, executor, mock_spreadsheet, mock_worksheet, ops, batch_len
+    ):
+        """All writes to a sheet go out in one batch_update call, one entry per operation.
+
+        Values are sent as given; formulas are sent with ``raw=False`` so Sheets parses them.
+        Creating the sheet costs a single spreadsheet batch_update on top of the writes.
+        """
         plan = ExecutionPlan.from_operations(ops)
 
-        executor.execute(plan, "Values Test")
-
-        # Verify batch_update was called (new batching implementation)
-        mock_worksheet.batch_update.assert_called()
-        call_args = mock_worksheet.batch_update.call_args
-        # Should be called with list of dicts: [{'range': ..., 'values': ...}]
-        batch_data = call_args[0][0]
-        assert len(batch_data) == 1
-        assert batch_data[0]['values'] == values
-
-    def test_execute_writes_formulas(self):
-        """Executor writes formulas to cells."""
-        client, mock_gc = self._make_client()
-        mock_spreadsheet = Mock(spec=gspread.Spreadsheet)
-        mock_worksheet = Mock(spec=gspread.Worksheet)
-        mock_worksheet.id = 0
-        mock_worksheet.row_count = 100
-        mock_worksheet.col_count = 5
-        mock_worksheet.title = "Formulas"
-
-        mock_gc.create.return_value = mock_spreadsheet
-        mock_spreadsheet.sheet1 = mock_worksheet
-
-        executor = SheetsExecutor(client, rate_limit_delay=0)
+        executor.execute(plan, "Batch Test")
 
-        ops = [
-            CreateSheet(name="Formulas", rows=100, cols=5),
-            SetFormula(sheet="Formulas", row=0, col=0, formula="=SUM(A2:A10)"),
-        ]
-        plan = ExecutionPlan.from_operations(ops)
+        assert mock_spreadsheet.batch_update.call_count == 1
+        mock_worksheet.batch_update.assert_called_once()
+        (batch_data,), kwargs = mock_worksheet.batch_update.call_args
+        assert len(batch_data) == batch_len
+
+        writes = ops[1:]
+        if isinstance(writes[0], SetFormula):
+            assert kwargs["raw"] is False
+        else:
+            assert [update["values"] for update in batch_data] == [op.values for op in writes]
+
+    def test_renamed_default_sheet_writes_to_new_title(self, executor, mock_spreadsheet):
+        """Writes to the default sheet address the title it was renamed to, not "Sheet1"."""
+        mock_spreadsheet.sheet1 = gspread.Worksheet(
+            mock_spreadsheet,
+            {"sheetId": 0, "title": "Sheet1", "index": 0,
+             "gridProperties": {"rowCount": 1000, "columnCount": 26}},
+            "spreadsheet-id",
+            mock_spreadsheet.client,
+        )
+        plan = ExecutionPlan.from_operations(
+            [DATA_SHEET, SetValues(sheet="Data", row=0, col=0, values=[["A", "B"]])]
+        )
 
-        executor.execute(plan, "Formula Test")
+        executor.execute(plan, "Rename Test")
 
-        # Verify batch_update was called with raw=False (new batching implementation)
-        mock_worksheet.batch_update.assert_called()
-        call_args = mock_worksheet.batch_update.call_args
-        # Should be called with list of dicts and raw=False
-        batch_data = call_args[0][0]
-        assert len(batch_data) == 1
-        assert call_args[1]["raw"] is False
+        assert mock_spreadsheet.sheet1.title == "Data"
+        assert (mock_spreadsheet.sheet1.row_count, mock_spreadsheet.sheet1.col_count) == (
+            DATA_SHEET.rows, DATA_SHEET.cols
+        )
+        body = mock_spreadsheet.client.values_batch_update.call_args.kwargs["body"]
+        assert [entry["range"] for entry in body["data"]] == ["'Data'!A1:B1"]
 
-    def test_execute_registers_named_ranges(self):
+    def test_execute_registers_named_ranges(self, executor, mock_spreadsheet):
         """Executor registers named ranges using batch_update."""
-        client, mock_gc = self._make_client()
-        mock_spreadsheet = Mock(spec=gspread.Spreadsheet)
-        mock_worksheet = Mock(spec=gspread.Worksheet)
-        mock_worksheet.id = 0
-        mock_worksheet.row_count = 100
-        mock_worksheet.col_count = 5
-
-        mock_gc.create.return_value = mock_spreadsheet
-        mock_spreadsheet.sheet1 = mock_worksheet
-
-        executor = SheetsExecutor(client, rate_limit_delay=0)
-
         ops = [
-            CreateSheet(name="Data", rows=100, cols=5),
+            DATA_SHEET,
             NamedRange(
                 name="MyRange",
                 sheet="Data",
@@ -745,128 +581,67 @@ class TestSheetsExecutor:
 
         executor.execute(plan, "Named Range Test")
 
-        mock_spreadsheet.batch_update.assert_called_once()
+        # The first batch_update creates the sheet
+        assert mock_spreadsheet.batch_update.call_count == 2
         call_args = mock_spreadsheet.batch_update.call_args
         requests = call_args[0][0]["requests"]
         assert len(requests) == 1
         assert "addNamedRange" in requests[0]
 
-    def test_retry_logic_on_api_error(self):
-        """Executor retries operations that fail with APIError."""
-        client, mock_gc = self._make_client()
-        mock_spreadsheet = Mock(spec=gspread.Spreadsheet)
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "error": {"code": 503, "message": "Service unavailable"}
-        }
-        api_error = APIError(mock_response)
+    def test_retry_logic_on_api_error(
+        self, client, mock_gc, mock_spreadsheet, api_error_factory, no_sleep
+    ):
+        """Executor retries operations that fail with APIError, backing off exponentially."""
+        api_error = api_error_factory(503, "Service unavailable")
 
         mock_gc.create.side_effect = [api_error, api_error, mock_spreadsheet]
 
-        executor = SheetsExecutor(client, max_retries=3, base_delay=0.01, rate_limit_delay=0)
+        executor = SheetsExecutor(client, max_retries=3, rate_limit_delay=0)
 
-        ops = [CreateSheet(name="Sheet1", rows=100, cols=5)]
+        ops = [DEFAULT_SHEET]
         plan = ExecutionPlan.from_operations(ops)
 
-        mock_spreadsheet.sheet1 = Mock()
-        mock_spreadsheet.sheet1.id = 0
-        mock_spreadsheet.sheet1.row_count = 100
-        mock_spreadsheet.sheet1.col_count = 5
-
         result = executor.execute(plan, "Retry Test")
 
         assert mock_gc.create.call_count == 3
         assert result == mock_spreadsheet
+        assert no_sleep == [1.0, 2.0]
 
-    def test_retry_exhaustion_raises_error(self):
+    def test_retry_exhaustion_raises_error(self, client, mock_gc, api_error_factory):
         """Executor raises SheetsAPIError when retries are exhausted."""
-        client, mock_gc = self._make_client()
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "error": {"code": 503, "message": "Service unavailable"}
-        }
-        api_error = APIError(mock_response)
+        api_error = api_error_factory(503, "Service unavailable")
         mock_gc.create.side_effect = api_error
 
-        executor = SheetsExecutor(client, max_retries=2, base_delay=0.01, rate_limit_delay=0)
+        executor = SheetsExecutor(client, max_retries=2, rate_limit_delay=0)
 
-        ops = [CreateSheet(name="Sheet1", rows=100, cols=5)]
+        ops = [DEFAULT_SHEET]
         plan = ExecutionPlan.from_operations(ops)
 
-        with pytest.raises(SheetsAPIError) as exc_info:
+        with pytest.raises(SheetsAPIError, match="after 3 attempts"):
             executor.execute(plan, "Fail Test")
 
-        assert "after 3 attempts" in str(exc_info.value)
+    def test_dataset_size_validation(self, executor, mock_gc):
+        """Executor rejects oversized plans that bypassed from_operations, before any API call."""
+        huge = CreateSheet(name="Huge", rows=10000, cols=2000)
+        plan = ExecutionPlan([ExecutionStep(StepType.CREATE_SHEETS, [huge], {"Huge"})])
 
-    def test_dataset_size_validation(self):
-        """Executor validates dataset size and rejects plans that exceed limits."""
-        client, mock_gc = self._make_client()
-
-        executor = SheetsExecutor(client, rate_limit_delay=0)
-
-        ops = [
-            CreateSheet(name="Huge", rows=10000, cols=2000),
-        ]
-        plan = ExecutionPlan.from_operations(ops)
-
-        with pytest.raises(PlanValidationError) as exc_info:
+        with pytest.raises(PlanValidationError, match="Dataset too large"):
             executor.execute(plan, "Too Large")
+        mock_gc.create.assert_not_called()
 
-        assert "Dataset too large" in str(exc_info.value)
-
-    def test_main_sheet_positioning(self):
+    def test_main_sheet_positioning(self, executor, mock_spreadsheet):
         """Executor positions the main sheet as the first tab."""
-        client, mock_gc = self._make_client()
-        mock_spreadsheet = Mock(spec=gspread.Spreadsheet)
-        mock_worksheet1 = Mock(spec=gspread.Worksheet)
-        mock_worksheet1.id = 0
-        mock_worksheet1.row_count = 100
-        mock_worksheet1.col_count = 5
-        mock_worksheet2 = Mock(spec=gspread.Worksheet)
-        mock_worksheet2.id = 1
-
-        mock_gc.create.return_value = mock_spreadsheet
-        mock_spreadsheet.sheet1 = mock_worksheet1
-        mock_spreadsheet.add_worksheet.return_value = mock_worksheet2
-
-        executor = SheetsExecutor(client, rate_limit_delay=0)
-
-        ops = [
-            CreateSheet(name="Input", rows=100, cols=5),
-            CreateSheet(name="Output", rows=100, cols=5),
-        ]
-        plan = ExecutionPlan.from_operations(ops, main_sheet="Output")
+        output = replace(DATA_SHEET, name="Output")
+        mock_spreadsheet.batch_update.return_value = _create_sheets_response(output)
+        plan = ExecutionPlan.from_operations(
+            [replace(DATA_SHEET, name="Input"), output], main_sheet="Output"
+        )
 
         executor.execute(plan, "Main Sheet Test")
 
-        mock_worksheet2.update_index.assert_called_once_with(0)
-
-    def test_batch_operations_per_sheet(self):
-        """Executor groups operations by sheet for efficient batching."""
-        client, mock_gc = self._make_client()
-        mock_spreadsheet = Mock(spec=gspread.Spreadsheet)
-        mock_worksheet = Mock(spec=gspread.Worksheet)
-        mock_worksheet.id = 0
-        mock_worksheet.row_count = 100
-        mock_worksheet.col_count = 5
-
-        mock_gc.create.return_value = mock_spreadsheet
-        mock_spreadsheet.sheet1 = mock_worksheet
-
-        executor = SheetsExecutor(client, rate_limit_delay=0)
-
-        ops = [
-            CreateSheet(name="Data", rows=100, cols=5),
-            SetValues(sheet="Data", row=0, col=0, values=[[1, 2, 3]]),
-            SetValues(sheet="Data", row=1, col=0, values=[[4, 5, 6]]),
-        ]
-        plan = ExecutionPlan.from_operations(ops)
-
-        executor.execute(plan, "Batch Test")
-
-        # With batching, both SetValues should be combined into one batch_update call
-        assert mock_worksheet.batch_update.call_count == 1
-        call_args = mock_worksheet.batch_update.call_args
-        batch_data = call_args[0][0]
-        # Should have 2 updates in the batch
-        assert len(batch_data) == 2
+        mock_spreadsheet.client.batch_update.assert_called_once()
+        (_, body) = mock_spreadsheet.client.batch_update.call_args.args
+        assert body["requests"][0]["updateSheetProperties"]["properties"] == {
+            "sheetId": 1,
+            "index": 0,
+        }
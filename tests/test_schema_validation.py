@@ -6,6 +6,8 @@ column references at construction time and raise appropriate errors.
 """
 
 import pytest
+from fornero.algebra import operations
+from fornero.algebra.logical_plan import LogicalPlan
 from fornero.algebra.operations import (
     Source, Select, Filter, Join, Sort, WithColumn, Union,
     SchemaValidationError
@@ -13,6 +15,12 @@ from fornero.algebra.operations import (
 from fornero.algebra.expressions import col
 
 
+@pytest.fixture
+def lazy_validation(monkeypatch):
+    """Defer schema validation to validate(), as FORNERO_LAZY_VALIDATION does."""
+    monkeypatch.setattr(operations, "LAZY_VALIDATION", True)
+
+
 class TestSelectValidation:
     """Tests for Select schema validation."""
 
@@ -90,8 +98,8 @@ class TestJoinValidation:
         left = Source(source_id="left.csv", schema=["id", "name"])
         right = Source(source_id="right.csv", schema=["user_id", "email"])
         join = Join(left_on="id", right_on="user_id", inputs=[left, right])
-        assert join.left_on == ["id"]
-        assert join.right_on == ["user_id"]
+        assert join.left_on == ("id",)
+        assert join.right_on == ("user_id",)
 
     def test_join_invalid_left_key_fails(self):
         """Join with non-existent left key raises SchemaValidationError."""
@@ -114,7 +122,7 @@ class TestJoinValidation:
 
         # Valid multi-key join
         join = Join(left_on=["id", "date"], right_on=["user_id", "timestamp"], inputs=[left, right])
-        assert join.left_on == ["id", "date"]
+        assert join.left_on == ("id", "date")
 
         # Invalid multi-key join
         with pytest.raises(SchemaValidationError, match="left_on references non-existent columns: \\['x'\\]"):
@@ -125,14 +133,14 @@ class TestJoinValidation:
         left = Source(source_id="left.csv")  # No schema
         right = Source(source_id="right.csv", schema=["user_id", "email"])
         join = Join(left_on="id", right_on="user_id", inputs=[left, right])
-        assert join.left_on == ["id"]
+        assert join.left_on == ("id",)
 
     def test_join_without_right_schema_skips_right_validation(self):
         """Join without right schema skips right key validation."""
         left = Source(source_id="left.csv", schema=["id", "name"])
         right = Source(source_id="right.csv")  # No schema
         join = Join(left_on="id", right_on="user_id", inputs=[left, right])
-        assert join.right_on == ["user_id"]
+        assert join.right_on == ("user_id",)
 
 
 class TestSortValidation:
@@ -184,6 +192,16 @@ class TestWithColumnValidation:
         with pytest.raises(SchemaValidationError, match="non-existent columns: \\['x'\\]"):
             WithColumn(column="result", expression=(col("a") + col("x")) / col("c"), inputs=[source])
 
+    def test_with_column_reuses_referenced_columns(self):
+        """Referenced columns are collected once per expression node, in first-use order."""
+        source = Source(source_id="data.csv", schema=["a", "b", "c"])
+        expression = (col("b") + col("a")) / col("b")
+        assert expression.referenced_columns == ("b", "a")
+
+        WithColumn(column="r1", expression=expression, inputs=[source])
+        assert WithColumn(column="r2", expression=expression, inputs=[source]).column == "r2"
+        assert expression._referenced_columns is expression.referenced_columns
+
     def test_with_column_string_expression_skips_validation(self):
         """WithColumn with string expression skips validation."""
         source = Source(source_id="data.csv", schema=["price", "quantity"])
@@ -284,3 +302,54 @@ class TestValidationErrorMessages:
             assert "Right schema:" in str(e)
             assert "['a', 'b', 'c']" in str(e)
             assert "['a', 'b', 'd']" in str(e)
+
+
+@pytest.mark.usefixtures("lazy_validation")
+class TestLazyValidation:
+    """Tests for deferred validation via validate()."""
+
+    def test_construction_defers_validation(self):
+        """Invalid references are accepted at construction and rejected by validate()."""
+        source = Source(source_id="data.csv", schema=["a", "b"])
+        select = Select(columns=["x"], inputs=[source])
+        with pytest.raises(SchemaValidationError, match="non-existent columns: \\['x'\\]"):
+            select.validate()
+
+    def test_validate_runs_once(self, monkeypatch):
+        """A validated node skips its checks on later validate() calls."""
+        source = Source(source_id="data.csv", schema=["a", "b"])
+        select = Select(columns=["a"], inputs=[source])
+        select.validate()
+
+        monkeypatch.setattr(Select, "_check_schema", lambda self: pytest.fail("re-validated"))
+        select.validate()
+
+    def test_plan_validate_checks_every_node(self):
+        """LogicalPlan.validate() reaches nodes below the root."""
+        source = Source(source_id="data.csv", schema=["a", "b"])
+        bad = Sort(keys=[("x", "asc")], inputs=[source])
+        plan = LogicalPlan(Select(columns=["a"], inputs=[bad]))
+        with pytest.raises(SchemaValidationError, match="Sort references"):
+            plan.validate()
+
+    def test_plan_validate_uses_derived_schemas(self):
+        """Nodes are checked against columns derived through non-Source inputs."""
+        source = Source(source_id="data.csv", schema=["a", "b"])
+        projected = Select(columns=["a"], inputs=[source])
+        widened = WithColumn(column="c", expression=col("a") * 2, inputs=[projected])
+        LogicalPlan(Filter(predicate=col("c") > 1, inputs=[widened])).validate()
+
+        plan = LogicalPlan(Filter(predicate=col("b") > 1, inputs=[widened]))
+        with pytest.raises(SchemaValidationError, match="Available columns: \\['a', 'c'\\]"):
+            plan.validate()
+
+
+class TestPlanValidation:
+    """Tests for LogicalPlan.validate() without deferred validation."""
+
+    def test_plan_validate_skips_nodes_validated_at_construction(self):
+        """Nodes checked by their constructors are not re-checked against derived schemas."""
+        source = Source(source_id="data.csv", schema=["a", "b"])
+        projected = Select(columns=["a"], inputs=[source])
+        plan = LogicalPlan(Filter(predicate=col("b") > 1, inputs=[projected]))
+        plan.validate()
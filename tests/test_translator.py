@@ -11,6 +11,7 @@ These tests verify:
 No external dependencies (no API calls, no filesystem except fixtures).
 """
 
+import pandas as pd
 import pytest
 from fornero.algebra import (
     LogicalPlan, Source, Select, Filter, Join, GroupBy, Aggregate,
@@ -130,6 +131,18 @@ class TestTranslateFilter:
         # AND should be translated to * (multiplication for boolean arrays)
         assert '*' in formula or 'AND' in formula
 
+    def test_filter_predicate_cache_is_structural(self):
+        """Equal predicates share a cached condition; literals of different types do not."""
+        def filter_formula(predicate):
+            source = Source(source_id="test.csv", schema=["flag"])
+            plan = LogicalPlan(Filter(predicate=predicate, inputs=[source]))
+            ops = Translator().translate(plan, source_data={"test.csv": [[1]]})
+            return next(op.formula for op in ops if isinstance(op, SetFormula) and 'Filter' in op.sheet)
+
+        assert filter_formula(col("flag") == 1) == filter_formula(col("flag") == 1)
+        assert filter_formula(col("flag") == True) != filter_formula(col("flag") == 1)  # noqa: E712
+        assert "[1, 2]" in filter_formula(col("flag") == Literal([1, 2]))
+
 
 class TestTranslateJoin:
     """Test Join translation strategy."""
@@ -702,6 +715,37 @@ class TestOptimizationPasses:
         # Input should be Source (Filter fused into Sort)
         assert isinstance(optimized_plan.root.inputs[0], Source)
 
+    def test_optimize_keeps_each_plans_source_data(self):
+        """Same-shaped sources holding different values each keep their own data."""
+        def build(data):
+            source = Source(source_id="cache.csv", schema=["a", "b"], data=data)
+            select = Select(columns=["a", "b"], inputs=[source])
+            return LogicalPlan(Filter(predicate="a > 1", inputs=[select]))
+
+        def leaf(op):
+            while op.inputs:
+                op = op.inputs[0]
+            return op
+
+        optimizer = Optimizer()
+        optimizer.optimize(build(pd.DataFrame({"a": [1, 2], "b": [3, 4]})))
+        second = optimizer.optimize(build(pd.DataFrame({"a": [5, 6], "b": [7, 8]})))
+        assert leaf(second.root).data["a"].tolist() == [5, 6]
+
+    def test_optimize_does_not_retain_source_data(self):
+        """Optimizing a plan keeps no reference to its data once the plan is dropped."""
+        import gc
+        import weakref
+
+        source = Source(source_id="data.csv", schema=["a"], data=pd.DataFrame({"a": [1, 2]}))
+        plan = LogicalPlan(Filter(predicate="a > 1", inputs=[source]))
+        data = weakref.ref(source.data)
+        Optimizer().optimize(plan)
+
+        del source, plan
+        gc.collect()
+        assert data() is None
+
     def test_fuse_select_filter(self):
         """Select(Filter(...)) fuses into a single Select operation."""
         source = Source(source_id="test.csv", schema=["a", "b"])
@@ -249,8 +249,8 @@ class TestSerialization:
         restored = deserialize(serialized)
 
         assert isinstance(restored.root, Join)
-        assert restored.root.left_on == ["id"]
-        assert restored.root.right_on == ["id"]
+        assert restored.root.left_on == ("id",)
+        assert restored.root.right_on == ("id",)
         assert restored.root.join_type == "left"
 
     def test_serialize_groupby_operation(self):